@@ -2,7 +2,7 @@ x_num = 3.14
 x_int = 42
 x_chr = "texto"
 x_log = true
-v = [1, 2, 3]
+v = Int[1, 2, 3]
 m = reshape(1:6, 2, div(length(1:6), 2))
-l = Dict("nome" => "Ana", "idade" => 21, "notas" => [8, 9, 10])
-df = DataFrame(nome = ["Ana", "Beto"], idade = [21, 30])
\ No newline at end of file
+l = (nome = "Ana", idade = 21, notas = Int[8, 9, 10])
+df = DataFrame(nome = String["Ana", "Beto"], idade = Int[21, 30])
\ No newline at end of file
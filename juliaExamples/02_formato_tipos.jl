@@ -1,6 +1,6 @@
 3.14 isa Float64
 2 isa Int
-v = [10, 20, 30]
-v = Dict(string(i) => v[i] for i in eachindex(v))
+v = Int[10, 20, 30]
+v = Dict{String,Any}(string(i) => x for (i, x) in pairs(v))
 v["nome"] = 5
 println(v)
\ No newline at end of file
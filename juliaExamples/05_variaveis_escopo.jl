@@ -4,4 +4,5 @@ function f()
     return x_local
 end
 f()
-isdefined(Main, Symbol("x_local"))
\ No newline at end of file
+isdefined(Main, Symbol("x_local"))
+isdefined(Main, Symbol("x_global"))
\ No newline at end of file
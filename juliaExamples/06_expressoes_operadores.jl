@@ -1,7 +1,7 @@
 println((2 + (3 * 4)))
 println(((2 + 3) * 4))
-struct Myclass
-    value
+struct Myclass{T}
+    value::T
 end
 import Base: +
 +(a::Myclass, b::Myclass) =     "Soma personalizada!"
@@ -11,6 +11,6 @@ let x = x
         x = (x - 1)
         if (x == 0)
             break
-end
+        end
     end
 end
\ No newline at end of file
@@ -0,0 +1,12 @@
+function main()
+    x_num = 3.14
+    x_int = 42
+    x_chr = "texto"
+    x_log = true
+    v = Int[1, 2, 3]
+    m = reshape(1:6, 2, div(length(1:6), 2))
+    l = (nome = "Ana", idade = 21, notas = Int[8, 9, 10])
+    df = DataFrame(nome = String["Ana", "Beto"], idade = Int[21, 30])
+end
+
+main()
\ No newline at end of file
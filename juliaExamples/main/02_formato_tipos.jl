@@ -0,0 +1,10 @@
+function main()
+    3.14 isa Float64
+    2 isa Int
+    v = Int[10, 20, 30]
+    v = Dict{String,Any}(string(i) => x for (i, x) in pairs(v))
+    v["nome"] = 5
+    println(v)
+end
+
+main()
\ No newline at end of file
@@ -0,0 +1,11 @@
+function f(e)
+    e["x"] = (e["x"] + 1)
+end
+function main()
+    env = new.env()
+    env["x"] = 10
+    f(env)
+    env["x"]
+end
+
+main()
\ No newline at end of file
@@ -0,0 +1,7 @@
+function main()
+    if true
+        println("ok")
+    end
+end
+
+main()
\ No newline at end of file
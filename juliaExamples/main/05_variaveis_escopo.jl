@@ -0,0 +1,12 @@
+function f()
+    x_local = 5
+    return x_local
+end
+function main()
+    x_global = 10
+    f()
+    isdefined(Main, Symbol("x_local"))
+    @isdefined(x_global)
+end
+
+main()
\ No newline at end of file
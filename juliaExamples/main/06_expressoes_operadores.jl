@@ -0,0 +1,14 @@
+struct Myclass{T}
+    value::T
+end
+import Base: +
++(a::Myclass, b::Myclass) =     "Soma personalizada!"
+function main()
+    println((2 + (3 * 4)))
+    println(((2 + 3) * 4))
+    a = Myclass(1)
+    b = Myclass(2)
+    println((a + b))
+end
+
+main()
\ No newline at end of file
@@ -0,0 +1,18 @@
+function main()
+    x = 5
+    if (x > 0)
+        println("positivo")
+    elseif (x == 0)
+        println("zero")
+    else
+        println("negativo")
+    end
+    while true
+        x = (x - 1)
+        if (x == 0)
+            break
+        end
+    end
+end
+
+main()
\ No newline at end of file
@@ -0,0 +1,12 @@
+function main()
+    for i in 1:3
+        println(i)
+    end
+    i = 1
+    while (i <= 3)
+        println(i)
+        i = (i + 1)
+    end
+end
+
+main()
\ No newline at end of file
@@ -0,0 +1,8 @@
+function soma(a, b)
+    return (a + b)
+end
+function main()
+    println(soma(5, 3))
+end
+
+main()
\ No newline at end of file
@@ -0,0 +1,12 @@
+function main()
+    a = true
+    b = false
+    resultado_e = (a && b)
+    resultado_ou = (a || b)
+    resultado_nao = (!a)
+    println("E:", resultado_e)
+    println("OU:", resultado_ou)
+    println("NÃO:", resultado_nao)
+end
+
+main()
\ No newline at end of file
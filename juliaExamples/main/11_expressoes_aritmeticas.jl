@@ -0,0 +1,14 @@
+function main()
+    x = 10
+    y = 3
+    soma = (x + y)
+    subtracao = (x - y)
+    multiplicacao = (x * y)
+    divisao = (x / y)
+    println("Soma:", soma)
+    println("Subtração:", subtracao)
+    println("Multiplicação:", multiplicacao)
+    println("Divisão:", divisao)
+end
+
+main()
\ No newline at end of file
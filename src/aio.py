@@ -0,0 +1,181 @@
+﻿import os
+import asyncio
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .transpile import get_transpiler
+from .diagnostics import Diagnostics
+
+# API assíncrona para serviços asyncio. transpile() é CPU puro e, chamado
+# dentro do event loop, o bloqueia até terminar; aqui o trabalho vai para um
+# pool limitado de workers (processos, por padrão: também escapam do GIL) e o
+# loop só espera o resultado.
+#
+#   code = await transpile_async(src, timeout=5)
+#
+#   async with AsyncTranspiler(workers=4) as tr:
+#       async for i, code, diagnostics, error in tr.transpile_many(fontes):
+#           ...
+
+
+def _work(source_code, file, collect, codegen_options):
+    # roda no worker: o Transpiler da thread/processo é reaproveitado
+    diagnostics = Diagnostics(file) if collect else None
+    code = get_transpiler().transpile(source_code, diagnostics, **codegen_options)
+    return code, (diagnostics.items if collect else None)
+
+
+class AsyncTranspiler:
+    """
+    Pool de workers para transpilar sem bloquear o event loop.
+
+    workers: tamanho do pool (padrão: nº de CPUs). max_pending: máximo de
+    pedidos no pool ao mesmo tempo (padrão: 2 × workers); acima disso,
+    transpile() espera uma vaga antes de enviar o código (backpressure).
+    processes=False usa threads: não há custo de iniciar processos nem de
+    copiar o código, mas as conversões disputam o GIL com o loop.
+
+    Um pedido cancelado (ou com timeout) que ainda não começou sai da fila;
+    um que já está rodando vai até o fim no worker (Python não interrompe
+    uma thread/processo no meio) e o resultado é descartado. A vaga só é
+    liberada quando o worker termina, para que max_pending valha de fato.
+    """
+
+    def __init__(self, workers=None, max_pending=None, processes=True):
+        workers = workers or os.cpu_count() or 1
+        if processes:
+            self._executor = ProcessPoolExecutor(workers, initializer=get_transpiler)
+        else:
+            self._executor = ThreadPoolExecutor(workers)
+        self.max_pending = max_pending or 2 * workers
+        self._slots = weakref.WeakKeyDictionary()  # um semáforo por event loop
+
+    def _semaphore(self, loop):
+        sem = self._slots.get(loop)
+        if sem is None:
+            sem = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+        return sem
+
+    async def transpile(self, source_code, diagnostics=None, timeout=None, **codegen_options):
+        """
+        Como transpile() (veja Transpiler.transpile), sem bloquear o loop.
+        Com timeout (segundos), levanta TimeoutError se o resultado não vier a
+        tempo; o prazo conta desde a chamada, incluindo a espera por uma vaga.
+        """
+        loop = asyncio.get_running_loop()
+        sem = self._semaphore(loop)
+        if timeout is None:
+            await sem.acquire()
+        else:
+            deadline = loop.time() + timeout
+            await asyncio.wait_for(sem.acquire(), timeout)
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                sem.release()
+                raise asyncio.TimeoutError
+        try:
+            fut = self._executor.submit(
+                _work, source_code, diagnostics.file if diagnostics is not None else None,
+                diagnostics is not None, codegen_options)
+        except BaseException:
+            sem.release()
+            raise
+
+        def _done(_fut):
+            try:
+                loop.call_soon_threadsafe(sem.release)
+            except RuntimeError:
+                pass  # loop já fechado
+
+        fut.add_done_callback(_done)
+        code, items = await asyncio.wait_for(asyncio.wrap_future(fut, loop=loop), timeout)
+        if diagnostics is not None:
+            diagnostics.items.extend(items)
+        return code
+
+    async def _one(self, index, source_code, timeout, codegen_options):
+        diagnostics = Diagnostics()
+        try:
+            code = await self.transpile(source_code, diagnostics, timeout, **codegen_options)
+        except Exception as e:
+            return index, None, diagnostics, e
+        return index, code, diagnostics, None
+
+    async def transpile_many(self, sources, timeout=None, concurrency=None, **codegen_options):
+        """
+        Transpila os códigos de `sources` (iterável ou iterável assíncrono),
+        gerando (índice, código, Diagnostics, erro) na ordem em que terminam.
+        Erros de sintaxe vão para os diagnósticos (os comandos válidos são
+        gerados); erro é a exceção do item (ex.: TimeoutError) ou None.
+
+        No máximo `concurrency` (padrão: max_pending) itens ficam em
+        andamento; o próximo código só é lido de `sources` quando um termina.
+        Se o consumidor parar ou for cancelado, os itens pendentes são
+        cancelados.
+        """
+        limit = concurrency or self.max_pending
+        if hasattr(sources, '__aiter__'):
+            it = sources.__aiter__()
+        else:
+            it = _aiter(sources)
+        pending = set()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        source_code = await it.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(
+                        self._one(index, source_code, timeout, codegen_options)))
+                    index += 1
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def aclose(self):
+        # shutdown(wait=True) bloquearia o loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
+
+
+_default = None
+
+
+def _get_default():
+    global _default
+    if _default is None:
+        _default = AsyncTranspiler()
+    return _default
+
+
+async def transpile_async(source_code, diagnostics=None, timeout=None, **codegen_options):
+    """transpile() num pool de processos compartilhado; veja AsyncTranspiler."""
+    return await _get_default().transpile(source_code, diagnostics, timeout, **codegen_options)
+
+
+async def transpile_many(sources, timeout=None, concurrency=None, **codegen_options):
+    """AsyncTranspiler.transpile_many no pool compartilhado."""
+    async for result in _get_default().transpile_many(sources, timeout, concurrency,
+                                                      **codegen_options):
+        yield result
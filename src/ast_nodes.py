@@ -1,20 +1,43 @@
 ﻿class Node:
-    pass
+    """
+    Base dos nós da AST. Todas as classes usam __slots__ (sem __dict__ por
+    instância), o que reduz bastante a memória de árvores grandes.
+
+    lineno/col: posição (linha e coluna, a partir de 1) do início do nó no
+    código R, preenchidas pelo parser. Nós criados fora do parser ficam com None.
+
+    jl_type: tipo Julia inferido para expressões (ver typeinfer.py), ou None.
+    """
+    __slots__ = ('lineno', 'col', 'jl_type')
+
+    def __getattr__(self, name):
+        # só é chamado quando o slot não foi preenchido
+        if name in ('lineno', 'col', 'jl_type'):
+            return None
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
 class IsDouble(Node):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
 class IsInteger(Node):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
 class DollarAccess(Node):
+    __slots__ = ('target', 'field')
+
     def __init__(self, target, field):
         self.target = target  
         self.field = field     
 
 class S3FunctionDecl(Node):
+    __slots__ = ('operator_name', 'class_name', 'params', 'body')
+
     def __init__(self, operator_name, class_name, params, body):
         self.operator_name = operator_name  # Ex: "+"
         self.class_name = class_name        # Ex: "myclass"
@@ -22,29 +45,48 @@ class S3FunctionDecl(Node):
         self.body = body                    # bloco da função
 
 class Program(Node):
+    __slots__ = ('stmts',)
+
     def __init__(self, stmts):
         self.stmts = stmts
 
 class Block(Node):
+    __slots__ = ('stmts', 'assigned', 'reads', 'growth', 'writes')
+
     def __init__(self, stmts):
         self.stmts = stmts
+        # preenchidos por scope.analyze_scopes (None = ainda não analisado)
+        self.assigned = None
+        self.reads = None
+        # corpo de laço: vetores que crescem nele (growth.GrowthPlan ou None)
+        self.growth = None
+        # escritas do bloco e dos aninhados (growth._Writes, None = ainda não vistas)
+        self.writes = None
 
 class Assign(Node):
+    __slots__ = ('name', 'expr')
+
     def __init__(self, name, expr):
         self.name = name
         self.expr = expr
 
 class ExprStmt(Node):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
 class If(Node):
+    __slots__ = ('cond', 'then_block', 'else_block')
+
     def __init__(self, cond, then_block, else_block=None):
         self.cond = cond
         self.then_block = then_block
         self.else_block = else_block
 
 class For(Node):
+    __slots__ = ('var', 'start_expr', 'end_expr', 'body')
+
     def __init__(self, var, start_expr, end_expr, body):
         self.var = var
         self.start_expr = start_expr
@@ -52,68 +94,96 @@ class For(Node):
         self.body = body
 
 class While(Node):
+    __slots__ = ('cond', 'body')
+
     def __init__(self, cond, body):
         self.cond = cond
         self.body = body
 
 class FunctionDecl(Node):
+    __slots__ = ('name', 'params', 'body')
+
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
         self.body = body
 
 class Return(Node):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
 class Call(Node):
+    __slots__ = ('name', 'args')
+
     def __init__(self, name, args):
         # args: list of Expr or NamedArg
         self.name = name
         self.args = args
 
 class NamedArg(Node):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
 
 class BinaryOp(Node):
+    __slots__ = ('op', 'left', 'right')
+
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
         self.right = right
 
 class UnaryOp(Node):
+    __slots__ = ('op', 'expr')
+
     def __init__(self, op, expr):
         self.op = op
         self.expr = expr
 
 class Var(Node):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
 class IntLiteral(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 class FloatLiteral(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 class StringLiteral(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 class BoolLiteral(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 class IndexOp(Node):
+    __slots__ = ('target', 'index')
+
     def __init__(self, target, index):
         self.target = target
         self.index = index
 
 class AssignIndex(Node):
+    __slots__ = ('target', 'index', 'expr')
+
     def __init__(self, target, index, expr):
         self.target = target
         self.index = index
@@ -0,0 +1,251 @@
+﻿"""
+Codificação binária compacta da AST (ast_nodes.py), para guardar programas já
+analisados ou passá-los a outro processo sem pickle.
+
+Formato (versão FORMAT_VERSION), inteiros em varint (7 bits por byte, o bit
+alto indica que há mais bytes):
+
+    MAGIC, versão (1 byte)
+    tabela de tipos: n, depois o nome de cada classe de nó usada
+    pool de strings: n, depois cada string (tamanho + UTF-8)
+    tamanho do corpo em bytes (um arquivo truncado não passa por válido)
+    corpo: os valores em pós-ordem (filhos antes do pai)
+
+No corpo, cada valor começa por um byte de tipo: None, False, True, inteiro
+(zigzag), float (8 bytes), string (índice no pool), lista (nº de itens, já
+empilhados) ou nó (_NODE + índice na tabela). Um nó toma da pilha seus campos
+(os __slots__ da classe, na ordem) e traz a posição: a linha como diferença
+para a do nó anterior e a coluna (0 = sem posição). Nomes e strings repetidos
+ficam uma vez só no pool.
+
+Só a estrutura e as posições são guardadas; as anotações das análises
+(jl_type, Block.assigned/reads/growth/writes) são refeitas por quem usa a AST.
+"""
+import struct
+from . import ast_nodes
+from .ast_nodes import Node
+
+MAGIC = b"RAST"
+FORMAT_VERSION = 1
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST = range(7)
+_NODE = 7  # _NODE + i: o tipo i da tabela
+
+# anotações preenchidas depois do parse: não entram na codificação
+_ANNOTATIONS = ('assigned', 'reads', 'growth', 'writes')
+_FIELDS = {}
+_FLOAT_STRUCT = struct.Struct('<d')
+
+
+def _fields(cls):
+    fields = _FIELDS.get(cls)
+    if fields is None:
+        fields = _FIELDS[cls] = tuple(f for f in cls.__slots__ if f not in _ANNOTATIONS)
+    return fields
+
+
+def _varint(out, n):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def dumps(value):
+    """Codifica um nó (ex.: Program), uma lista de comandos ou None em bytes."""
+    body = bytearray()
+    append = body.append
+    pool = {}
+    types = {}
+    last_line = 0
+    stack = [(value, False)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        item, ready = pop()
+        cls = item.__class__
+        if cls is str:
+            index = pool.get(item)
+            if index is None:
+                index = pool[item] = len(pool)
+            append(_STR)
+            _varint(body, index)
+        elif item is None:
+            append(_NONE)
+        elif cls is bool:
+            append(_TRUE if item else _FALSE)
+        elif cls is int:
+            append(_INT)
+            _varint(body, item << 1 if item >= 0 else (-item << 1) - 1)
+        elif cls is float:
+            append(_FLOAT)
+            body += _FLOAT_STRUCT.pack(item)
+        elif cls is list or cls is tuple:
+            if ready:
+                append(_LIST)
+                _varint(body, len(item))
+            else:
+                push((item, True))
+                for child in reversed(item):
+                    push((child, False))
+        elif isinstance(item, Node):
+            fields = _fields(cls)
+            if ready:
+                tag = types.get(cls)
+                if tag is None:
+                    tag = types[cls] = len(types)
+                append(_NODE + tag)
+                line = item.lineno
+                if line is None:
+                    append(0)
+                else:
+                    delta = line - last_line
+                    _varint(body, (delta << 1 if delta >= 0 else (-delta << 1) - 1) + 1)
+                    last_line = line
+                col = item.col
+                _varint(body, 0 if col is None else col)
+            else:
+                push((item, True))
+                for f in reversed(fields):
+                    push((getattr(item, f), False))
+        else:
+            raise TypeError(f"astcodec: valor não suportado: {type(item).__name__}")
+
+    if len(types) > 255 - _NODE:
+        raise ValueError("astcodec: tipos de nó demais")
+    out = bytearray(MAGIC)
+    out.append(FORMAT_VERSION)
+    _varint(out, len(types))
+    for cls in types:  # na ordem dos índices
+        name = cls.__name__.encode('ascii')
+        _varint(out, len(name))
+        out += name
+    _varint(out, len(pool))
+    for s in pool:
+        data = s.encode('utf-8', 'surrogatepass')
+        _varint(out, len(data))
+        out += data
+    _varint(out, len(body))
+    out += body
+    return bytes(out)
+
+
+def loads(data):
+    """Decodifica o resultado de dumps(). Levanta ValueError se os dados não servem."""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("astcodec: não é uma AST codificada")
+    if len(data) <= len(MAGIC) or data[len(MAGIC)] != FORMAT_VERSION:
+        raise ValueError(f"astcodec: versão do formato não suportada "
+                         f"(esperada {FORMAT_VERSION})")
+    try:
+        return _decode(memoryview(data), len(MAGIC) + 1)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"astcodec: dados corrompidos ({e})") from None
+
+
+def _read_varint(data, i):
+    b = data[i]
+    if b < 0x80:
+        return b, i + 1
+    n = b & 0x7F
+    shift = 7
+    while True:
+        i += 1
+        b = data[i]
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, i + 1
+        shift += 7
+
+
+def _decode(data, i):
+    count, i = _read_varint(data, i)
+    types = []
+    for _ in range(count):
+        size, i = _read_varint(data, i)
+        name = bytes(data[i:i + size]).decode('ascii')
+        i += size
+        cls = getattr(ast_nodes, name, None)
+        if not (isinstance(cls, type) and issubclass(cls, Node)):
+            raise ValueError(f"astcodec: tipo de nó desconhecido: {name}")
+        types.append((cls, len(_fields(cls))))
+    count, i = _read_varint(data, i)
+    pool = []
+    for _ in range(count):
+        size, i = _read_varint(data, i)
+        pool.append(str(data[i:i + size], 'utf-8', 'surrogatepass'))
+        i += size
+    size, i = _read_varint(data, i)
+    end = len(data)
+    if end - i != size:
+        raise ValueError("astcodec: dados corrompidos (tamanho do corpo)")
+
+    stack = []
+    push = stack.append
+    last_line = 0
+    unpack_float = _FLOAT_STRUCT.unpack_from
+    while i < end:
+        tag = data[i]
+        i += 1
+        if tag >= _NODE:
+            cls, arity = types[tag - _NODE]
+            if len(stack) < arity:
+                raise ValueError("astcodec: dados corrompidos (faltam campos)")
+            if arity:
+                args = stack[-arity:]
+                del stack[-arity:]
+                node = cls(*args)
+            else:
+                node = cls()
+            # posição: linha (diferença, zigzag + 1; 0 = sem linha) e coluna
+            n = data[i]
+            if n < 0x80:
+                i += 1
+            else:
+                n, i = _read_varint(data, i)
+            if n:
+                n -= 1
+                last_line += (n >> 1) if not n & 1 else -((n + 1) >> 1)
+                node.lineno = last_line
+            n = data[i]
+            if n < 0x80:
+                i += 1
+            else:
+                n, i = _read_varint(data, i)
+            if n:
+                node.col = n
+            push(node)
+        elif tag == _STR:
+            n = data[i]
+            if n < 0x80:
+                i += 1
+            else:
+                n, i = _read_varint(data, i)
+            push(pool[n])
+        elif tag == _LIST:
+            n, i = _read_varint(data, i)
+            if len(stack) < n:
+                raise ValueError("astcodec: dados corrompidos (faltam itens)")
+            if n:
+                items = stack[-n:]
+                del stack[-n:]
+            else:
+                items = []
+            push(items)
+        elif tag == _NONE:
+            push(None)
+        elif tag == _INT:
+            n, i = _read_varint(data, i)
+            push((n >> 1) if not n & 1 else -((n + 1) >> 1))
+        elif tag == _FLOAT:
+            push(unpack_float(data, i)[0])
+            i += 8
+        elif tag == _TRUE:
+            push(True)
+        elif tag == _FALSE:
+            push(False)
+        else:
+            raise ValueError(f"astcodec: byte de tipo inválido: {tag}")
+    if len(stack) != 1:
+        raise ValueError("astcodec: dados corrompidos (estrutura incompleta)")
+    return stack[0]
@@ -0,0 +1,136 @@
+﻿import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .transpile import get_transpiler
+from .cache import BuildCache
+from .diagnostics import Diagnostics
+
+
+def find_r_files(src_dir):
+    """Lista (recursivamente) os arquivos .R de src_dir, relativos a ele."""
+    found = []
+    for root, _dirs, files in os.walk(src_dir):
+        for f in files:
+            if f.lower().endswith(".r"):
+                found.append(os.path.relpath(os.path.join(root, f), src_dir))
+    return sorted(found)
+
+
+def output_path(rel, out_dir):
+    """Caminho do .jl correspondente a um .R, preservando os subdiretórios."""
+    return os.path.join(out_dir, os.path.splitext(rel)[0] + ".jl")
+
+
+def _read_if_exists(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def transpile_file(infile, outfile, cache=None, codegen_options=None, diagnostics=None):
+    """
+    Transpila infile para outfile. Com cache, reaproveita a saída de uma
+    execução anterior para o mesmo código e não reescreve outfile se ele já
+    estiver atualizado. Retorna True se a saída veio do cache.
+    Com diagnostics, os erros vão para lá e o Julia dos comandos válidos é
+    gravado; saídas com erros não entram no cache (os erros seriam perdidos).
+    """
+    codegen_options = codegen_options or {}
+    with open(infile, 'r', encoding='utf-8') as f:
+        src = f.read()
+
+    jc = None
+    if cache is not None:
+        key = cache.key(src, codegen_options)
+        jc = cache.get(key)
+    cached = jc is not None
+
+    if not cached:
+        mark = len(diagnostics) if diagnostics is not None else 0
+        jc = get_transpiler().transpile(src, diagnostics, **codegen_options)
+        if cache is not None and (diagnostics is None or len(diagnostics) == mark):
+            cache.put(key, jc)
+    elif _read_if_exists(outfile) == jc:
+        return True
+
+    os.makedirs(os.path.dirname(outfile) or ".", exist_ok=True)
+    with open(outfile, 'w', encoding='utf-8') as f:
+        f.write(jc)
+    return cached
+
+
+def _init_worker():
+    # cria o Transpiler do processo uma única vez, antes da primeira tarefa
+    get_transpiler()
+
+
+def _run_task(rel, src_dir, out_dir, cache_dir=None, codegen_options=None):
+    start = time.perf_counter()
+    cached = False
+    infile = os.path.join(src_dir, rel)
+    diagnostics = Diagnostics(infile)
+    try:
+        cache = BuildCache(cache_dir) if cache_dir is not None else None
+        cached = transpile_file(infile, output_path(rel, out_dir),
+                                cache, codegen_options, diagnostics)
+        error = f"{len(diagnostics)} erro(s) de sintaxe" if len(diagnostics) else None
+    except Exception as e:
+        error = f"{e.__class__.__name__}: {e}"
+    return rel, error, time.perf_counter() - start, cached, diagnostics.sorted()
+
+
+def transpile_dir(src_dir, out_dir, jobs=None, report=print, cache=None, codegen_options=None):
+    """
+    Transpila todos os .R de src_dir para out_dir usando um pool de processos.
+
+    Cada worker importa as tabelas do PLY e monta seu Transpiler uma vez só;
+    as tarefas reaproveitam esse estado. Com jobs=1 roda no próprio processo.
+    Com um BuildCache, arquivos sem mudança não são retranspilados e o cache
+    é podado (LRU) ao final.
+    Arquivos com erros de sintaxe são gravados sem os comandos com erro e
+    reportados como [ERRO], seguidos dos diagnósticos (arquivo:linha:coluna).
+    Retorna a lista de (arquivo_relativo, erro_ou_None, segundos, do_cache,
+    diagnósticos).
+    """
+    files = find_r_files(src_dir)
+    cache_dir = cache.cache_dir if cache is not None else None
+    jobs = jobs or os.cpu_count() or 1
+    results = []
+    start = time.perf_counter()
+
+    def _collect(result):
+        rel, error, _elapsed, cached, diagnostics = result
+        if cached:
+            report(f"[CACHE] {rel}")
+        elif error is None:
+            report(f"[OK]   {rel}")
+        else:
+            report(f"[ERRO] {rel}: {error}")
+            for d in diagnostics:
+                report(f"       {d}")
+        results.append(result)
+
+    if jobs == 1 or len(files) <= 1:
+        for rel in files:
+            _collect(_run_task(rel, src_dir, out_dir, cache_dir, codegen_options))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            futures = [pool.submit(_run_task, rel, src_dir, out_dir, cache_dir, codegen_options) for rel in files]
+            for fut in as_completed(futures):
+                _collect(fut.result())
+
+    if cache is not None:
+        cache.evict()
+
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for r in results if r[1] is not None)
+    hits = sum(1 for r in results if r[3])
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    report(
+        f"\n{len(results)} arquivo(s): {len(results) - failed} ok ({hits} do cache), "
+        f"{failed} com erro em {elapsed:.2f}s ({rate:.1f} arquivos/s)"
+    )
+    results.sort()
+    return results
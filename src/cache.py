@@ -0,0 +1,102 @@
+﻿import os
+import hashlib
+import tempfile
+from . import __version__
+from .parsetab import _lr_signature
+
+DEFAULT_CACHE_DIR = ".transpile_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_signature = None
+
+
+def transpiler_signature():
+    """
+    Assinatura do transpilador: versão, gramática (_lr_signature) e o
+    conteúdo dos módulos do pacote. Qualquer mudança no lexer, parser ou
+    codegen invalida as entradas antigas do cache.
+    """
+    global _signature
+    if _signature is None:
+        h = hashlib.sha256()
+        h.update(__version__.encode())
+        h.update(_lr_signature.encode())
+        pkg_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(pkg_dir)):
+            if name.endswith(".py") and name != "parsetab.py":
+                with open(os.path.join(pkg_dir, name), 'rb') as f:
+                    h.update(f.read())
+        _signature = h.hexdigest()
+    return _signature
+
+
+class BuildCache:
+    """
+    Cache em disco de saídas Julia, indexado pelo hash do código R + assinatura
+    do transpilador. Cada entrada é um arquivo <hash>.jl; o mtime marca o
+    último uso e evict() remove as menos usadas até caber em max_bytes.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, source_code, codegen_options=None):
+        h = hashlib.sha256(transpiler_signature().encode())
+        # opções de geração mudam a saída: entram na chave
+        h.update(repr(sorted((codegen_options or {}).items())).encode())
+        h.update(source_code.encode('utf-8'))
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".jl")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                out = f.read()
+        except FileNotFoundError:
+            return None
+        # marca como usada recentemente (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return out
+
+    def put(self, key, julia_code):
+        # escreve num temporário e renomeia: workers concorrentes nunca leem entrada parcial
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(julia_code)
+        os.replace(tmp, self._path(key))
+
+    def evict(self):
+        """Remove as entradas usadas há mais tempo até o cache caber em max_bytes."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".jl"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        removed = 0
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,106 @@
+﻿import os
+import sys
+import json
+import socket
+from .diagnostics import Diagnostic
+
+# Cliente do servidor de transpilação (daemon.py). Não importa o lexer, o
+# parser nem o codegen: o custo de cada chamada é só a inicialização do
+# Python e uma ida e volta pelo socket.
+#
+#   python -m src.client [--socket ARQ] [--main] script.R [saida.jl]
+#   python -m src.client [--socket ARQ] [--main] -o DIR a.R b.R ...
+#
+# A segunda forma envia todos os arquivos pela mesma conexão (DIR/a.jl, ...):
+# a inicialização do Python, que domina o tempo do cliente, é paga uma vez.
+
+DEFAULT_SOCKET = ".transpile.sock"
+
+
+class Client:
+    """
+    Conexão com o servidor; pode ser usada para vários pedidos seguidos:
+
+        with Client() as c:
+            resp = c.request(path="a.R")   # {"ok", "julia", "diagnostics"}
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self._file = self.sock.makefile('rwb')
+
+    def request(self, **req):
+        self._file.write(json.dumps(req).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("o servidor fechou a conexão")
+        return json.loads(line)
+
+    def close(self):
+        self._file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # argparse custaria alguns ms a mais na inicialização
+    sock_path = DEFAULT_SOCKET
+    out_dir = None
+    wrap_main = False
+    args = []
+    it = iter(argv)
+    for a in it:
+        if a == "--socket":
+            sock_path = next(it, None)
+        elif a in ("-o", "--out-dir"):
+            out_dir = next(it, None)
+        elif a == "--main":
+            wrap_main = True
+        else:
+            args.append(a)
+    if sock_path is None or not args or (out_dir is None and len(args) > 2):
+        print("uso: python -m src.client [--socket ARQ] [--main] script.R [saida.jl]\n"
+              "     python -m src.client [--socket ARQ] [--main] -o DIR a.R b.R ...",
+              file=sys.stderr)
+        return 2
+
+    # o servidor pode estar em outro diretório: caminhos absolutos
+    if out_dir is not None:
+        jobs = [(path, os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + ".jl"))
+                for path in args]
+    else:
+        jobs = [(args[0], args[1] if len(args) == 2 else None)]
+
+    status = 0
+    try:
+        with Client(sock_path) as c:
+            for path, output in jobs:
+                req = {"path": os.path.abspath(path), "main": wrap_main}
+                if output is not None:
+                    req["output"] = os.path.abspath(output)
+                resp = c.request(**req)
+                if "error" in resp:
+                    print(resp["error"], file=sys.stderr)
+                else:
+                    for d in resp["diagnostics"]:
+                        print(Diagnostic(**d), file=sys.stderr)
+                    if "julia" in resp:
+                        sys.stdout.write(resp["julia"])
+                if not resp["ok"]:
+                    status = 1
+    except OSError as e:
+        print(f"Servidor indisponível em {sock_path}: {e}", file=sys.stderr)
+        return 2
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,140 @@
 ﻿from .ast_nodes import *
+from .scope import assigned_vars, function_exists_names, function_free_vars
+from .typeinfer import MAYBE_DICT, TypeInference, elem_type, is_array
+
+# tabela de despacho: classe do gerador -> {tipo do nó -> método gen_*}
+# montada sob demanda, uma vez por (classe, tipo de nó)
+_DISPATCH = {}
+# idem para os moldes parts_* das expressões compostas (ver _generate_expr)
+_PARTS = {}
+# idem para os emit_* dos comandos que escrevem no buffer de saída
+_EMITTERS = {}
+
+
+class RecordAsDict:
+    """
+    Item dos moldes parts_*: um list(...) com chaves fixas que deve ser gerado
+    como Dict, e não como NamedTuple (ver JuliaCodeGen._escaping).
+    """
+    __slots__ = ('call',)
+
+    def __init__(self, call):
+        self.call = call
+
+
+class Conversions:
+    """
+    Item do corpo de main() no lugar de uma definição içada para fora dela:
+    só as conversões em Dict pedidas antes da definição (ver
+    TypeInference.converted e _emit_main).
+    """
+    __slots__ = ('stmt',)
+
+    def __init__(self, stmt):
+        self.stmt = stmt
+
+
+def empty_vector(stmt):
+    """O nome v se stmt é `v <- c()`; senão None."""
+    if stmt.__class__ is Assign:
+        expr = stmt.expr
+        if expr.__class__ is Call and expr.name == "c" and not expr.args:
+            return stmt.name
+    return None
+
+
+def recreated(stmt):
+    """
+    Os vetores que o prelúdio do laço stmt (já inferido) cria de novo
+    (`v = T[]` ou `v = Vector{T}(undef, n)`, ver growth.GrowthPlan). Um
+    `v <- c()` logo antes dele não precisa ser gerado.
+    """
+    plan = stmt.body.growth if isinstance(stmt, (For, While)) else None
+    if plan is None:
+        return ()
+    return {name for name, _elem, _count, mode in plan.prelude if mode in ("empty", "undef")}
+
+
+def join_parts(parts):
+    """
+    Os códigos (não vazios) de trechos seguidos de um programa, na ordem,
+    a partir dos (código, cauda, recriados) de JuliaCodeGen.generate_parts:
+    a cauda de um trecho some quando o trecho seguinte a recria.
+    """
+    tail = None
+    for code, next_tail, fresh in parts:
+        if fresh is None:
+            continue  # trecho sem comandos
+        if tail is not None and tail[0] not in fresh:
+            yield tail[1]
+        if code:
+            yield code
+        tail = next_tail
+    if tail is not None:
+        yield tail[1]
+
+
+def _joined(sep, items):
+    """Junta os moldes em items (sequências de partes), com sep entre eles."""
+    parts = []
+    for i, item in enumerate(items):
+        if i:
+            parts.append(sep)
+        parts.extend(item)
+    return parts
+
 
 class JuliaCodeGen:
-    def __init__(self):
+    # Map operadores R → Julia
+    OP_MAP = {"&": "&&", "|": "||", "&&": "&&", "||": "||", ":": ":"}
+    # operadores com vetores: em R são elemento a elemento → broadcast com ponto
+    # (&& e || continuam escalares, como no R)
+    BROADCAST_OP_MAP = {"&": ".&", "|": ".|", "&&": "&&", "||": "||"}
+    # funções vetorizadas do R que em Julia precisam de f.(x) para vetores
+    ELEMENTWISE_CALLS = {"sqrt", "exp", "log", "abs", "sin", "cos", "tan", "floor"}
+    # funções que recebem um registro (NamedTuple) sem convertê-lo em Dict
+    RECORD_CALLS = {"print", "length"}
+
+    def __init__(self, wrap_main=False):
         self.indent_level = 0
         # guarda nomes de structs (capitalizados) já emitidos para evitar duplicação
         self._created_structs = set()
+        # wrap_main: o script vai dentro de uma função main() (ver _emit_main)
+        self.wrap_main = wrap_main
+        # definições içadas para o escopo global (structs) no modo wrap_main
+        self._hoisted = []
+        # True enquanto gera o corpo de main(): laços já estão em escopo local
+        self._in_main = False
+        # variáveis locais de main() (exists("x") delas vira @isdefined(x))
+        self._main_locals = frozenset()
+        # tipos inferidos (jl_type) para os comandos de nível superior
+        self.typer = TypeInference()
+        # `v <- c(v, ...)` dos laços sendo gerados que viram push!/append!
+        self._appends = {}
+        self._handlers = _DISPATCH.setdefault(type(self), {})
+        self._parts = _PARTS.setdefault(type(self), {})
+        self._emitters = _EMITTERS.setdefault(type(self), {})
 
 
     # ------------------- HELPERS -------------------
+    def _define_struct(self, name):
+        """
+        Código do struct `name` na primeira vez que é pedido ("" nas demais).
+        No modo wrap_main o struct é içado para o topo do arquivo (structs não
+        podem ser definidos dentro de funções) e também devolve "".
+
+        O campo é paramétrico (value::T): cada objeto guarda um valor de tipo
+        concreto, qualquer que seja o tipo passado ao construtor.
+        """
+        if name in self._created_structs:
+            return ""
+        self._created_structs.add(name)
+        code = f"struct {name}{{T}}\n    value::T\nend"
+        if self.wrap_main:
+            self._hoisted.append(code)
+            return ""
+        return code
+
     def is_number(self, s):
         try:
             float(s)
@@ -16,14 +143,26 @@ class JuliaCodeGen:
             return False
 
     # ------------------- TYPE CHECKS -------------------
-    def gen_IsDouble(self, node):
-        return f"{self.generate(node.expr)} isa Float64"
+    # Expressões compostas não têm gen_*: cada parts_* devolve o molde do nó
+    # (strings e nós filhos, na ordem de saída) e _generate_expr o expande.
+    def parts_IsDouble(self, node):
+        return (node.expr, " isa Float64")
 
-    def gen_IsInteger(self, node):
-        return f"{self.generate(node.expr)} isa Int"
+    def parts_IsInteger(self, node):
+        return (node.expr, " isa Int")
 
     # ------------------- ASSIGNMENT -------------------
     def gen_Assign(self, node):
+        mode = self._appends.get(node)
+        if mode is not None:
+            # v <- c(v, x) num laço: acrescenta no próprio vetor (ver growth.py)
+            args = ", ".join(self.generate(a) for a in node.expr.args[1:])
+            return f"{mode}({node.name}, {args})"
+
+        if node in self.typer.escaped:
+            # registro numa variável lida por funções (ver TypeInference.shared)
+            return f"{node.name} = {self._escaping(node.expr)}"
+
         expr_code = self.generate(node.expr)
 
         # Detecta criação de S3 object: structure(..., class="myclass")
@@ -38,10 +177,7 @@ class JuliaCodeGen:
                 class_name_cap = class_name.capitalize()
 
                 # Cria o struct apenas uma vez
-                struct_code = ""
-                if class_name_cap not in self._created_structs:
-                    struct_code = f"struct {class_name_cap}\n    value\nend"
-                    self._created_structs.add(class_name_cap)
+                struct_code = self._define_struct(class_name_cap)
 
                 assign_code = f"{node.name} = {class_name_cap}({value_expr})"
                 if struct_code:
@@ -73,47 +209,216 @@ class JuliaCodeGen:
     def gen_AssignIndex(self, node):
         target = self.generate(node.target)
         index = self.generate(node.index)
-        value = self.generate(node.expr)
+        value = self._escaping(node.expr)
 
-        # Somente converter se for array (não env, não DataFrame)
-        if index.startswith('"') and index.endswith('"') and target.startswith("v"):
-            return (
-                f"{target} = Dict(string(i) => {target}[i] for i in eachindex({target}))\n"
-                f"{target}[{index}] = {value}"
-            )
+        # v["k"] <- x com v ainda vetor ou registro: converte em Dict aqui, uma
+        # única vez (a inferência de tipos passa a ver v como Dict depois)
+        t = node.target.jl_type
+        if self.typer.named_store_converts(t) and isinstance(node.index, StringLiteral):
+            return f"{self._to_dict(target, t)}\n{self.indent()}{target}[{index}] = {value}"
 
         return f"{target}[{index}] = {value}"
 
-    # ------------------- ACCESS -------------------
-    def gen_DollarAccess(self, node):
-        target = self.generate(node.target)
-        field = node.field
-        return f'{target}["{field}"]'
+    def _dict_of(self, code):
+        return f"Dict{{String,Any}}(string(i) => x for (i, x) in pairs({code}))"
+
+    def _to_dict(self, name, t=None):
+        if t == MAYBE_DICT:
+            # convertido em só um ramo de um if: pode já ser Dict
+            return f"{name} isa AbstractDict || ({name} = {self._dict_of(name)})"
+        return f"{name} = {self._dict_of(name)}"
+
+    def _escaping(self, node):
+        """
+        Código de um valor que sai do alcance da inferência de tipos (argumento
+        de função, valor guardado em outro container). Lá ele será acessado
+        como Dict (x["k"]), então registros (NamedTuple) são convertidos.
+        """
+        return self._expand(self._escaping_parts(node))
 
-    def gen_IndexOp(self, node):
-        return f"{self.generate(node.target)}[{self.generate(node.index)}]"
+    def _escaping_parts(self, node):
+        """Molde de _escaping(node), para os parts_*."""
+        if self.typer.record_fields(node.jl_type) is None:
+            return (node,)
+        if isinstance(node, Call) and node.name == "list":
+            return (RecordAsDict(node),)
+        return ("Dict{String,Any}(string(i) => x for (i, x) in pairs(", node, "))")
+
+    # ------------------- ACCESS -------------------
+    # Em registros (list com chaves fixas, ver TypeInference.record_of)
+    # x$campo é acesso direto ao campo do NamedTuple; nos demais casos,
+    # x["campo"].
+    def parts_DollarAccess(self, node):
+        fields = self.typer.record_fields(node.target.jl_type)
+        if fields is None:
+            return (node.target, f'["{node.field}"]')
+        if node.field in fields:
+            return (node.target, f".{node.field}")
+        # campo inexistente: NULL no R
+        return ("get(", node.target, f", :{node.field}, nothing)")
+
+    def parts_IndexOp(self, node):
+        fields = self.typer.record_fields(node.target.jl_type)
+        if fields is not None and isinstance(node.index, StringLiteral) and node.index.value in fields:
+            return (node.target, f".{node.index.value}")
+        return (node.target, "[", node.index, "]")
 
     # ------------------- PROGRAM / BLOCK -------------------
     def indent(self):
         return "    " * self.indent_level
 
-    def gen_Program(self, node):
-        lines = []
-        for s in node.stmts:
-            out = self.generate(s)
-            if out:
-                lines.append(out)
-        return "\n".join(lines)
+    # Comandos com corpo não devolvem strings: cada emit_* escreve seus pedaços
+    # num único buffer de saída (uma lista), repassado aos blocos aninhados.
+    # Assim cada caractere é produzido uma vez só, em vez de ser recopiado a
+    # cada nível de aninhamento. generate() continua devolvendo a string.
+    def _emit_stmts(self, stmts, out, prefix, convert=True):
+        first = True
+        converted = self.typer.converted
+        for k, s in enumerate(stmts):
+            if s is None:
+                continue
+            hoisted = s.__class__ is Conversions
+            if hoisted:
+                s = s.stmt
+            elif s.__class__ is Assign and self._recreated_next(s, stmts, k + 1):
+                continue
+            if convert and s in converted:
+                # registros que viram Dict antes do comando
+                for name, t in converted[s]:
+                    if not first:
+                        out.append("\n")
+                    out.append(prefix)
+                    out.append(self._to_dict(name, t))
+                    first = False
+            if hoisted:
+                continue
+            emit = self._emitters.get(s.__class__)
+            if emit is None and s.__class__ not in self._handlers:
+                self._resolve_handler(s.__class__)
+                emit = self._emitters.get(s.__class__)
+            if emit is not None:
+                if not first:
+                    out.append("\n")
+                out.append(prefix)
+                emit(self, s, out)
+            else:
+                code = self.generate(s)
+                if not code:
+                    continue
+                if not first:
+                    out.append("\n")
+                out.append(prefix)
+                out.append(code)
+            first = False
+
+    @staticmethod
+    def _recreated_next(stmt, stmts, k):
+        # `v <- c()` cujo próximo comando é um laço que cria v de novo
+        name = empty_vector(stmt)
+        if name is None:
+            return False
+        while k < len(stmts) and stmts[k] is None:
+            k += 1
+        return k < len(stmts) and name in recreated(stmts[k])
+
+    def generate_stmt(self, stmt):
+        """Gera um comando de nível superior (modo streaming), inferindo tipos antes."""
+        typer = self.typer
+        typer.visit_stmt(stmt)
+        out = []
+        self._emit_stmts((stmt,), out, "")
+        # as marcas de escaped/converted são dos nós deste comando: guardá-las
+        # manteria viva a AST de todos os comandos já gerados
+        typer.escaped = set()
+        typer.converted = {}
+        return "".join(out)
+
+    def generate_parts(self, stmts):
+        """
+        Gera um trecho de um programa maior cujos tipos self.typer já inferiu,
+        sem visitá-lo de novo (modos paralelo e incremental: o estado do typer
+        passa de um trecho ao seguinte antes da geração). Devolve (código,
+        cauda, recriados). Se o último comando é `v <- c()`, o código dele
+        vai à parte, em cauda = (v, código), pois some se o trecho seguinte
+        começa por um laço que recria v; recriados são os vetores que o
+        primeiro comando recria (None num trecho sem comandos). join_parts
+        junta os trechos.
+        """
+        stmts = [s for s in stmts if s is not None]
+        if not stmts:
+            return "", None, None
+        tail = None
+        name = empty_vector(stmts[-1])
+        if name is not None:
+            out = []
+            self._emit_stmts(stmts[-1:], out, "")
+            tail = (name, "".join(out))
+            stmts.pop()
+        out = []
+        self._emit_stmts(stmts, out, "")
+        return "".join(out), tail, recreated(stmts[0]) if stmts else set()
+
+    def emit_Program(self, node, out):
+        self.typer.visit_program(node)
+        if self.wrap_main:
+            self._emit_main(node, out)
+            return
+        self._emit_stmts(node.stmts, out, "")
+
+    def _emit_main(self, node, out):
+        """
+        Modo wrap_main: só definições (structs e funções) ficam no escopo
+        global; o resto do script vira o corpo de uma função main(), chamada
+        no fim. Em Julia, código em escopo global trabalha com variáveis
+        globais sem tipo (lentas); dentro de main() elas são locais e tipadas.
+        Variáveis do script lidas por funções (ou consultadas nelas com
+        exists("x")) continuam globais (global x).
+        """
+        defs = [s for s in node.stmts if isinstance(s, (FunctionDecl, S3FunctionDecl))]
+        body = [s for s in node.stmts if s is not None and not isinstance(s, (FunctionDecl, S3FunctionDecl))]
+        # as conversões pedidas antes de uma definição ficam no corpo, no lugar dela
+        converted = self.typer.converted
+        items = [Conversions(s) if isinstance(s, (FunctionDecl, S3FunctionDecl)) else s
+                 for s in node.stmts
+                 if s is not None and (s in converted or not isinstance(s, (FunctionDecl, S3FunctionDecl)))]
+
+        defs_out = []
+        self._emit_stmts(defs, defs_out, "", convert=False)
 
-    def gen_Block(self, node):
-        lines = []
+        assigned = assigned_vars(Block(body))
+        shared = sorted((function_free_vars(node.stmts) | function_exists_names(node.stmts))
+                        & assigned)
+
+        self._main_locals = frozenset(assigned.difference(shared))
+
+        self.indent_level += 1
+        self._in_main = True
+        body_out = []
+        self._emit_stmts(items, body_out, self.indent())
+        self._in_main = False
+        self.indent_level -= 1
+
+        for code in self._hoisted:
+            out.append(code)
+            out.append("\n")
+        if defs_out:
+            out.extend(defs_out)
+            out.append("\n")
+        out.append("function main()\n")
+        if shared:
+            out.append(f"    global {', '.join(shared)}\n")
+        out.extend(body_out)
+        out.append("\nend\n\nmain()")
+
+    def emit_Block(self, node, out):
         self.indent_level += 1
-        for s in node.stmts:
-            out = self.generate(s)
-            if out:
-                lines.append(self.indent() + out)
+        self._emit_stmts(node.stmts, out, self.indent())
         self.indent_level -= 1
-        return "\n".join(lines)
+
+    def gen_Block(self, node):
+        out = []
+        self.emit_Block(node, out)
+        return "".join(out)
 
     def gen_ExprStmt(self, node):
         return self.generate(node.expr)
@@ -136,88 +441,124 @@ class JuliaCodeGen:
     def gen_Var(self, node):
         return node.name
 
-    def gen_UnaryOp(self, node):
-        expr_code = self.generate(node.expr)
+    def parts_UnaryOp(self, node):
         if node.op == "!":
-            return f"(!{expr_code})"
+            if is_array(node.expr.jl_type):
+                return ("(.!", node.expr, ")")
+            return ("(!", node.expr, ")")
         elif node.op == "-":
-            return f"(-{expr_code})"
+            return ("(-", node.expr, ")")
         else:
-            return f"{node.op}{expr_code}"
+            return (node.op, node.expr)
 
 
 
-    def gen_BinaryOp(self, node):
-        # Map operadores R → Julia
-        op_map = {"&": "&&", "|": "||", "&&": "&&", "||": "||", ":": ":"}
-        op = op_map.get(node.op, node.op)
-
-        left_code = self.generate(node.left)
-        right_code = self.generate(node.right)
+    def parts_BinaryOp(self, node):
+        op = self.OP_MAP.get(node.op, node.op)
 
         if op == ":":
-            return f"{left_code}:{right_code}"
+            return (node.left, ":", node.right)
+
+        # vetor (conhecido ou suspeito, ver typeinfer.ARRAY) em um dos lados:
+        # operadores com ponto, que o Julia funde num único laço sem temporários
+        if is_array(node.left.jl_type) or is_array(node.right.jl_type):
+            op = self.BROADCAST_OP_MAP.get(node.op, "." + node.op)
 
-        return f"({left_code} {op} {right_code})"
+        return ("(", node.left, f" {op} ", node.right, ")")
 
 
     # ------------------- CALLS -------------------
-    def gen_Call(self, node):
+    # Chamadas também são moldes (ver _generate_expr): argumentos são nós
+    # filhos, e não strings geradas antes.
+    def parts_Call(self, node):
         pos = []
         kws = []
+        name = node.name
+
+        # registros passados adiante viram Dict, exceto dentro de outro registro
+        # e nas funções que sabem lidar com eles
+        escape = not (name in self.RECORD_CALLS
+                      or (name == "list" and self.typer.record_fields(node.jl_type) is not None))
 
         for a in node.args:
-            if isinstance(a, NamedArg):
-                kws.append((a.name, self.generate(a.value)))
+            if a.__class__ is NamedArg:
+                v = a.value
+                kws.append((a.name, self._escaping_parts(v) if escape else (v,)))
             else:
-                pos.append(self.generate(a))
+                pos.append(self._escaping_parts(a) if escape else (a,))
 
-        name = node.name
-
-        # Detecção do caso "exists(x)" e conversão para "isdefined(Main, :x)"
+        # Detecção do caso "exists(x)" e conversão para "isdefined(Main, :x)";
+        # dentro de main() as variáveis do script são locais: @isdefined(x)
         if name == "exists":
-            arg = pos[0] if pos else ""
-            return f"isdefined(Main, Symbol({arg}))"
+            first = node.args[0] if node.args else None
+            if (self._in_main and first.__class__ is StringLiteral
+                    and first.value in self._main_locals and first.value.isidentifier()):
+                return (f"@isdefined({first.value})",)
+            arg = pos[0] if pos else ()
+            return ("isdefined(Main, Symbol(", *arg, "))")
 
         # Caso para print(x) → println(x)
         if name == "print":
-            arg = pos[0] if pos else ""
+            arg = pos[0] if pos else ()
 
             # Se for print(paste(...))
-            if isinstance(node.args[0], Call) and node.args[0].name == "paste":
-                paste_args = [self.generate(a) for a in node.args[0].args]
+            if node.args and isinstance(node.args[0], Call) and node.args[0].name == "paste":
+                paste_args = [(a,) for a in node.args[0].args]
                 # Em Julia, basta passar os argumentos separados por vírgula
-                return f"println({', '.join(paste_args)})"
+                return ("println(", *_joined(", ", paste_args), ")")
 
             # Caso normal
-            return f"println({arg})"
+            return ("println(", *arg, ")")
 
-        # Caso para c(...) → vetor numérico
+        # Caso para c(...) → vetor numérico (tipado quando o tipo dos elementos é conhecido)
         if name == "c":
-            return f"[{', '.join(pos)}]"
+            elem = elem_type(node.jl_type)
+            # com algum vetor entre os argumentos, c() concatena: [v; x]
+            sep = "; " if any(is_array(a.jl_type) for a in node.args) else ", "
+            return (f"{elem or ''}[", *_joined(sep, pos), "]")
 
         # Caso para matrix(data, nrow=?, ncol=?) → reshape(data, nrow, div(length(data), nrow))
         if name == "matrix":
-            data = pos[0] if pos else "[]"
-            nrow = next((v for k, v in kws if k == "nrow"), None)
+            # data e nrow aparecem duas vezes: gerados uma vez só
+            data = self._expand(pos[0]) if pos else "[]"
+            nrow = next((self._expand(v) for k, v in kws if k == "nrow"), None)
             if nrow:
-                return f"reshape({data}, {nrow}, div(length({data}), {nrow}))"
-            return f"reshape({data}, :, :)"
+                return (f"reshape({data}, {nrow}, div(length({data}), {nrow}))",)
+            return (f"reshape({data}, :, :)",)
 
-        # Caso para list(...) → Dict
+        # Caso para list(...): registro com chaves fixas → NamedTuple; senão Dict
         if name == "list":
-            items = [f"\"{k}\" => {v}" for k, v in kws]
-            return f"Dict({', '.join(items)})"
+            if self.typer.record_fields(node.jl_type) is not None:
+                fields = _joined(", ", [(f"{k} = ", *v) for k, v in kws])
+                return ("(", *fields, ",)") if len(kws) == 1 else ("(", *fields, ")")
+            items = [(f"\"{k}\" => ", *v) for k, v in kws]
+            return ("Dict(", *_joined(", ", items), ")")
 
         # Caso para data.frame(...) → DataFrame(...)
         if name == "data.frame":
-            args = [f"{k} = {v}" for k, v in kws]
-            return f"DataFrame({', '.join(args)})"
+            args = [(f"{k} = ", *v) for k, v in kws]
+            return ("DataFrame(", *_joined(", ", args), ")")
 
         # fallback: retorna chamada Julia genérica
-        args = ", ".join(pos + [f"{k} = {v}" for k, v in kws])
-        return f"{name}({args})"
-
+        if name in self.ELEMENTWISE_CALLS and any(is_array(a.jl_type) for a in node.args):
+            # sqrt(v) → sqrt.(v): entra na mesma fusão dos operadores com ponto
+            parts = [f"{name}.("]
+        else:
+            parts = [f"{name}("]
+        for i, arg in enumerate(pos):
+            if i:
+                parts.append(", ")
+            parts.extend(arg)
+        for k, v in kws:
+            parts.append(f", {k} = " if len(parts) > 1 else f"{k} = ")
+            parts.extend(v)
+        parts.append(")")
+        return parts
+
+    def parts_RecordAsDict(self, item):
+        """list(...) com chaves fixas, mas gerado como Dict (ver _escaping)."""
+        items = [(f"\"{a.name}\" => ", *self._escaping_parts(a.value)) for a in item.call.args]
+        return ("Dict(", *_joined(", ", items), ")")
 
     def gen_Var(self, node):
         name = node.name
@@ -225,126 +566,107 @@ class JuliaCodeGen:
             return name  # mantém as crases
         return name
 
+
     # ------------------- CONTROL FLOW -------------------
-    def gen_If(self, node):
-        # Detecta else if (else cujo bloco é um único If)
-        if node.else_block and len(node.else_block.stmts) == 1 and isinstance(node.else_block.stmts[0], If):
-            inner_if = node.else_block.stmts[0]
-            return "\n".join([
-                f"if {self.generate(node.cond)}",
-                self.gen_Block(node.then_block),
-                f"elseif {self.generate(inner_if.cond)}",
-                self.gen_Block(inner_if.then_block),
-                "else",
-                self.gen_Block(inner_if.else_block),
-                "end"
-            ])
-
-        # if normal
-        out = [
-            f"if {self.generate(node.cond)}",
-            self.gen_Block(node.then_block)
-        ]
-
-        if node.else_block:
-            out += ["else", self.gen_Block(node.else_block)]
-
-        out.append("end")
-        return "\n".join(out)
-
-    def _assigned_vars(self, block):
+    # As linhas de fechamento (else/end) seguem a indentação do próprio comando.
+    def _emit_loop_body(self, node, out):
         """
-        Retorna um set com os nomes das variáveis atribuídas no bloco.
+        Corpo de um for/while. Se a inferência achou vetores crescendo no laço
+        (node.body.growth), os `v <- c(v, x)` do corpo viram push!/append!.
         """
-        vars_ = set()
-
-        for stmt in block.stmts:
-            if isinstance(stmt, Assign):
-                vars_.add(stmt.name)
-
-            if isinstance(stmt, If):
-                vars_ |= self._assigned_vars(stmt.then_block)
-                if stmt.else_block:
-                    vars_ |= self._assigned_vars(stmt.else_block)
-
-            if isinstance(stmt, While):
-                vars_ |= self._assigned_vars(stmt.body)
-
-            if isinstance(stmt, For):
-                vars_ |= self._assigned_vars(stmt.body)
-
-        return vars_
+        plan = node.body.growth
+        if plan is None or not plan.appends:
+            self.emit_Block(node.body, out)
+            return
+        saved = self._appends
+        self._appends = {**saved, **plan.appends}
+        self.emit_Block(node.body, out)
+        self._appends = saved
+
+    def _emit_growth_prelude(self, plan, out):
+        """
+        Linhas antes do laço: pré-alocação dos vetores que crescem nele e
+        conversão em Dict dos vetores usados com chaves de texto.
+        """
+        if plan is None:
+            return
+        ind = self.indent()
+        for name, elem, count, mode in plan.prelude:
+            n = self.generate(count) if count is not None else None
+            if mode == "dict":
+                out.append(f"{self._to_dict(name, elem)}\n{ind}")
+            elif mode == "undef":
+                out.append(f"{name} = Vector{{{elem}}}(undef, {n})\n{ind}")
+            elif mode == "empty":
+                out.append(f"{name} = {elem}[]\n{ind}")
+                if n is not None:
+                    out.append(f"sizehint!({name}, {n})\n{ind}")
+            else:
+                if mode == "hint":
+                    out.append(f"{name} = copy({name})\n{ind}")
+                if n is not None:
+                    out.append(f"sizehint!({name}, length({name}) + {n})\n{ind}")
 
+    def emit_If(self, node, out):
+        ind = self.indent()
+        out.append(f"if {self.generate(node.cond)}\n")
+        self.emit_Block(node.then_block, out)
 
-    def gen_While(self, node):
+        # Detecta else if (else cujo bloco é um único If)
+        if node.else_block and len(node.else_block.stmts) == 1 and isinstance(node.else_block.stmts[0], If):
+            inner_if = node.else_block.stmts[0]
+            out.append(f"\n{ind}elseif {self.generate(inner_if.cond)}\n")
+            self.emit_Block(inner_if.then_block, out)
+            if inner_if.else_block:
+                out.append(f"\n{ind}else\n")
+                self.emit_Block(inner_if.else_block, out)
+        elif node.else_block:
+            out.append(f"\n{ind}else\n")
+            self.emit_Block(node.else_block, out)
+
+        out.append(f"\n{ind}end")
+
+    def emit_While(self, node, out):
+        ind = self.indent()
         cond = self.generate(node.cond)
+        self._emit_growth_prelude(node.body.growth, out)
 
-        assigned = self._assigned_vars(node.body)
-
-        if hasattr(node.cond, "left") and hasattr(node.cond.left, "name"):
-            assigned.add(node.cond.left.name)
+        if self._in_main:
+            # dentro de main() o laço já altera as variáveis locais da função:
+            # o let (que nunca devolveria os valores) não é necessário
+            assigned = set()
+        else:
+            # conjunto pré-calculado pela análise de escopo (copiado: vamos alterá-lo)
+            assigned = set(assigned_vars(node.body))
 
-        # aumenta indentação para o corpo do while
-        self.indent_level += 1
-        body = self.gen_Block(node.body)
-        self.indent_level -= 1
+            if hasattr(node.cond, "left") and hasattr(node.cond.left, "name"):
+                assigned.add(node.cond.left.name)
 
         if assigned:
             lets = ", ".join(f"{v} = {v}" for v in sorted(assigned))
-            return "\n".join([
-                f"let {lets}",
-                f"    while {cond}",
-                body,
-                f"    end",
-                "end"
-            ])
-
-        return "\n".join([
-            f"while {cond}",
-            body,
-            "end"
-        ])
-
-    def _body_assigns_var(self, block):
-        """
-        Retorna True se o corpo do while contém alguma atribuição (x = ...)
-        Isso indica mutação e exige escopo (let) em Julia.
-        """
-        for stmt in block.stmts:
-            # atribuição direta: x <- ...
-            if isinstance(stmt, Assign):
-                return True
-
-            # if dentro do while
-            if isinstance(stmt, If):
-                if self._body_assigns_var(stmt.then_block):
-                    return True
-                if stmt.else_block and self._body_assigns_var(stmt.else_block):
-                    return True
-
-            # while aninhado
-            if isinstance(stmt, While):
-                if self._body_assigns_var(stmt.body):
-                    return True
-
-            # for aninhado
-            if isinstance(stmt, For):
-                if self._body_assigns_var(stmt.body):
-                    return True
-
-        return False
-
+            out.append(f"let {lets}\n{ind}    while {cond}\n")
+            # aumenta indentação para o corpo do while
+            self.indent_level += 1
+            self._emit_loop_body(node, out)
+            self.indent_level -= 1
+            out.append(f"\n{ind}    end\n{ind}end")
+        else:
+            out.append(f"while {cond}\n")
+            self._emit_loop_body(node, out)
+            out.append(f"\n{ind}end")
 
-    def gen_For(self, node):
+    def emit_For(self, node, out):
+        self._emit_growth_prelude(node.body.growth, out)
         if node.start_expr is not None:
             start = self.generate(node.start_expr)
             end = self.generate(node.end_expr)
-            header = f"for {node.var} in {start}:{end}"
+            out.append(f"for {node.var} in {start}:{end}\n")
         else:
-            header = f"for {node.var} in {self.generate(node.end_expr)}"
-        return "\n".join([header, self.gen_Block(node.body), "end"])
+            out.append(f"for {node.var} in {self.generate(node.end_expr)}\n")
+        self._emit_loop_body(node, out)
+        out.append(f"\n{self.indent()}end")
 
-    def gen_FunctionDecl(self, node):
+    def emit_FunctionDecl(self, node, out):
         # node.name pode estar com crases: '`+.myclass`' ou sem crases dependendo do lexer
         name_raw = node.name
         name_stripped = name_raw.strip("`") if isinstance(name_raw, str) else name_raw
@@ -358,30 +680,28 @@ class JuliaCodeGen:
                 cls_cap = cls.capitalize()
 
                 # garante que o struct exista (evita duplicações)
-                struct_code = ""
-                if cls_cap not in self._created_structs:
-                    struct_code = f"struct {cls_cap}\n    value\nend"
-                    self._created_structs.add(cls_cap)
+                struct_code = self._define_struct(cls_cap)
 
                 # gera o corpo da função
                 body_code = self.generate(node.body)
 
                 # se body_code for multi-linha, usamos begin/end
                 if "\n" in body_code:
-                    func_code = f"import Base: {op}\n{op}(a::{cls_cap}, b::{cls_cap}) = begin\n{body_code}\nend"
+                    func_code = f"import Base: {op}\n{op}(a::{cls_cap}, b::{cls_cap}) = begin\n{body_code}\n{self.indent()}end"
                 else:
                     func_code = f"import Base: {op}\n{op}(a::{cls_cap}, b::{cls_cap}) = {body_code}"
 
                 # se precisamos emitir struct, colocamos antes da função
                 if struct_code:
-                    return f"{struct_code}\n{func_code}"
-                return func_code
+                    out.append(f"{struct_code}\n")
+                out.append(func_code)
+                return
 
         # fallback: geração normal de função (mantém comportamento existente)
         params = ", ".join(node.params)
-        return "\n".join([f"function {node.name}({params})",
-                        self.gen_Block(node.body),
-                        "end"])
+        out.append(f"function {node.name}({params})\n")
+        self.emit_Block(node.body, out)
+        out.append(f"\n{self.indent()}end")
 
 
     def gen_Return(self, node):
@@ -391,7 +711,64 @@ class JuliaCodeGen:
     def generate(self, node):
         if node is None:
             return None
-        method = "gen_" + node.__class__.__name__
-        if not hasattr(self, method):
-            raise NotImplementedError(f"No codegen for {node.__class__.__name__}")
-        return getattr(self, method)(node)
+        handler = self._handlers.get(node.__class__)
+        if handler is None:
+            handler = self._resolve_handler(node.__class__)
+        return handler(self, node)
+
+    def _resolve_handler(self, node_type):
+        cls = type(self)
+        parts = getattr(cls, "parts_" + node_type.__name__, None)
+        emit = getattr(cls, "emit_" + node_type.__name__, None)
+        if parts is not None:
+            self._parts[node_type] = parts
+            handler = cls._generate_expr
+        elif emit is not None:
+            self._emitters[node_type] = emit
+            handler = cls._generate_emitted
+        else:
+            handler = getattr(cls, "gen_" + node_type.__name__, None)
+        if handler is None:
+            raise NotImplementedError(f"No codegen for {node_type.__name__}")
+        self._handlers[node_type] = handler
+        return handler
+
+    def _generate_emitted(self, node):
+        out = []
+        self._emitters[node.__class__](self, node, out)
+        return "".join(out)
+
+    def _generate_expr(self, root):
+        """
+        Gera uma expressão composta sem recursão: uma pilha explícita expande
+        os moldes parts_* em ordem de saída e os pedaços são unidos uma única
+        vez no final. Cadeias como a + b + c + ... (árvores muito profundas à
+        esquerda) ou f(g(h(...))) não estouram o limite de recursão nem
+        recopiam a string a cada nível.
+        """
+        return self._expand((root,))
+
+    def _expand(self, parts):
+        """Expande um molde (sequência de strings e nós) numa string."""
+        parts_of = self._parts
+        handlers = self._handlers
+        out = []
+        append = out.append
+        # pilha com o molde de cada nível em expansão (o do topo é o corrente)
+        stack = [iter(parts)]
+        while stack:
+            for item in stack[-1]:
+                cls = item.__class__
+                if cls is str:
+                    append(item)
+                    continue
+                parts = parts_of.get(cls)
+                if parts is not None:
+                    stack.append(iter(parts(self, item)))
+                    break
+                # folhas (ou tipo ainda não resolvido)
+                handler = handlers.get(cls)
+                append(handler(self, item) if handler is not None else self.generate(item))
+            else:
+                stack.pop()
+        return "".join(out)
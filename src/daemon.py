@@ -0,0 +1,209 @@
+﻿import os
+import sys
+import json
+import stat
+import socketserver
+from .transpile import get_transpiler
+from .diagnostics import Diagnostics
+from .client import Client, DEFAULT_SOCKET
+
+# Servidor de transpilação de longa duração. Cada chamada de
+# "python -m src.transpile" paga a inicialização do Python, a importação do
+# pacote e a carga das tabelas do PLY para converter um arquivo; aqui isso
+# acontece uma vez e os pedidos seguintes só pagam o lexer/parser/codegen.
+#
+# Protocolo: uma linha JSON por pedido e uma por resposta, via socket Unix
+# (python -m src.daemon [--socket ARQ]) ou stdin/stdout (--stdio).
+#
+#   pedido:   {"id": 1, "path": "a.R"}          ou {"source": "x <- 1\n"}
+#             opcionais: "output" (grava o .jl em vez de devolvê-lo),
+#                        "main" (como --main), "file" (nome nos diagnósticos)
+#   resposta: {"id": 1, "ok": true, "julia": "...", "diagnostics": [...]}
+#             ok é false se houver diagnósticos; falhas (arquivo inexistente,
+#             JSON inválido...) vêm em "error".
+#
+# Caminhos relativos são resolvidos no diretório do servidor.
+
+
+def handle_request(line):
+    """Atende um pedido (uma linha JSON) e devolve o dicionário da resposta."""
+    try:
+        req = json.loads(line)
+        if not isinstance(req, dict):
+            raise ValueError("o pedido deve ser um objeto JSON")
+    except ValueError as e:
+        return {"ok": False, "error": f"pedido inválido: {e}"}
+
+    resp = {"id": req["id"]} if "id" in req else {}
+    try:
+        path = req.get("path")
+        if "source" in req:
+            src = req["source"]
+        elif path is not None:
+            with open(path, 'r', encoding='utf-8') as f:
+                src = f.read()
+        else:
+            raise ValueError('o pedido precisa de "source" ou "path"')
+
+        codegen_options = {"wrap_main": True} if req.get("main") else {}
+        diagnostics = Diagnostics(req.get("file", path))
+        jc = get_transpiler().transpile(src, diagnostics, **codegen_options)
+
+        resp["ok"] = len(diagnostics) == 0
+        output = req.get("output")
+        if output is not None:
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(jc)
+            resp["output"] = output
+        else:
+            resp["julia"] = jc
+        resp["diagnostics"] = [d.to_dict() for d in diagnostics.sorted()]
+    except Exception as e:
+        resp["ok"] = False
+        resp["error"] = f"{e.__class__.__name__}: {e}"
+    return resp
+
+
+def _warm_up():
+    # carrega tabelas e módulos importados sob demanda antes do 1º pedido
+    get_transpiler().transpile("x <- c(1, 2)\nfor (i in x) {\n  y <- i\n}\n")
+
+
+def serve_stdio(inp=None, out=None):
+    """Atende pedidos lidos de inp (padrão: stdin) até o fim da entrada."""
+    inp = inp or sys.stdin
+    out = out or sys.stdout
+    _warm_up()
+    for line in inp:
+        if line.strip():
+            out.write(json.dumps(handle_request(line)) + "\n")
+            out.flush()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # vários pedidos por conexão; cada thread tem o seu Transpiler
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(json.dumps(handle_request(line)).encode() + b"\n")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _in_use(path):
+    try:
+        Client(path).close()
+        return True
+    except OSError:
+        return False
+
+
+def serve_unix(path=DEFAULT_SOCKET, ready=None):
+    """
+    Atende pedidos no socket Unix `path` até ser interrompido (Ctrl+C/SIGTERM).
+    Um socket antigo deixado por um servidor que não está mais rodando é
+    substituído; se houver um servidor ativo, levanta OSError.
+    """
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode) or _in_use(path):
+            raise OSError(f"{path} já existe e está em uso")
+        os.unlink(path)
+    _warm_up()
+    with _Server(path, _Handler) as server:
+        try:
+            if ready is not None:
+                ready()
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+
+def _bench(paths):
+    """
+    Latência por arquivo: CLI a frio (um processo python -m src.transpile por
+    arquivo), cliente fino (um processo python -m src.client por arquivo,
+    servidor já rodando), cliente fino com todos os arquivos (-o DIR) e
+    pedido numa conexão já aberta.
+    """
+    import glob
+    import statistics
+    import subprocess
+    import tempfile
+    import time
+
+    paths = [os.path.abspath(p) for p in (paths or sorted(glob.glob("RProjectExamples/*.R")))]
+    py = sys.executable
+    tmp = tempfile.mkdtemp()
+    out = os.path.join(tmp, "saida.jl")
+    sock = os.path.join(tmp, "bench.sock")
+
+    def timed(run):
+        samples = []
+        for path in paths:
+            t0 = time.perf_counter()
+            run(path)
+            samples.append((time.perf_counter() - t0) * 1000)
+        return samples
+
+    def quiet(cmd):
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    results = [("CLI a frio", timed(lambda p: quiet([py, "-m", "src.transpile", p, out])))]
+
+    server = subprocess.Popen([py, "-m", "src.daemon", "--socket", sock], stderr=subprocess.DEVNULL)
+    try:
+        while not os.path.exists(sock):
+            time.sleep(0.01)
+        results.append(("cliente fino", timed(lambda p: quiet([py, "-m", "src.client", "--socket", sock, p, out]))))
+        t0 = time.perf_counter()
+        quiet([py, "-m", "src.client", "--socket", sock, "-o", tmp] + paths)
+        results.append(("cliente, lote", [(time.perf_counter() - t0) * 1000 / len(paths)]))
+        with Client(sock) as c:
+            results.append(("conexão aberta", timed(lambda p: c.request(path=p, output=out))))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{len(paths)} arquivo(s), ms por arquivo:")
+    for name, samples in results:
+        print(f"  {name:<15} mediana {statistics.median(samples):8.2f}  média {statistics.mean(samples):8.2f}")
+
+
+def main(argv=None):
+    import argparse
+    import signal
+
+    ap = argparse.ArgumentParser(
+        prog="daemon",
+        description="Servidor de transpilação R → Julia (JSON lines), com lexer/parser já carregados.",
+    )
+    ap.add_argument("--socket", default=DEFAULT_SOCKET,
+                    help=f"socket Unix onde escutar (padrão: {DEFAULT_SOCKET})")
+    ap.add_argument("--stdio", action="store_true",
+                    help="lê pedidos de stdin e escreve respostas em stdout")
+    ap.add_argument("--bench", nargs="*", metavar="ARQ.R", default=None,
+                    help="compara a latência do CLI a frio com a do servidor e sai")
+    args = ap.parse_args(argv)
+
+    if args.bench is not None:
+        _bench(args.bench)
+        return
+    if args.stdio:
+        serve_stdio()
+        return
+    # SIGTERM encerra como Ctrl+C, removendo o socket
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        serve_unix(args.socket, ready=lambda: print(f"Escutando em {args.socket}", file=sys.stderr))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Não foi possível iniciar o servidor: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
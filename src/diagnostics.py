@@ -0,0 +1,69 @@
+﻿import sys
+
+# Códigos dos diagnósticos
+ILLEGAL_CHARACTER = "E001"   # lexer: caractere que não começa nenhum token
+UNEXPECTED_TOKEN = "E002"    # parser: token fora de lugar
+UNEXPECTED_EOF = "E003"      # parser: a entrada termina no meio de um comando
+
+
+def column(data, lexpos):
+    """Coluna (a partir de 1) da posição lexpos em data."""
+    return lexpos - data.rfind('\n', 0, lexpos)
+
+
+class Diagnostic:
+    """Um erro encontrado na conversão, com arquivo, linha, coluna e código."""
+    __slots__ = ('file', 'line', 'column', 'code', 'message')
+
+    def __init__(self, file, line, column, code, message):
+        self.file = file
+        self.line = line
+        self.column = column
+        self.code = code
+        self.message = message
+
+    def to_dict(self):
+        return {"file": self.file, "line": self.line, "column": self.column,
+                "code": self.code, "message": self.message}
+
+    def __str__(self):
+        return f"{self.file or '<entrada>'}:{self.line}:{self.column}: {self.code} {self.message}"
+
+    __repr__ = __str__
+
+
+class Diagnostics:
+    """
+    Lista dos diagnósticos de uma conversão. Passada ao Transpiler, faz o
+    lexer e o parser registrarem os erros aqui em vez de imprimir/abortar:
+    o parser retoma no comando seguinte e o Julia dos comandos válidos
+    continua sendo gerado.
+    """
+
+    def __init__(self, file=None):
+        self.file = file
+        self.items = []
+
+    def add(self, code, message, line, column):
+        self.items.append(Diagnostic(self.file, line, column, code, message))
+
+    def truncate(self, n):
+        """Descarta os diagnósticos a partir do n-ésimo (tentativa refeita)."""
+        del self.items[n:]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        # na ordem em que foram encontrados
+        return iter(self.items)
+
+    def sorted(self):
+        """Os diagnósticos em ordem de posição no arquivo."""
+        return sorted(self.items, key=lambda d: (d.line, d.column))
+
+    def report(self, out=None):
+        """Imprime um diagnóstico por linha, em ordem de posição (padrão: stderr)."""
+        out = out or sys.stderr
+        for d in self.sorted():
+            print(d, file=out)
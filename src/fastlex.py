@@ -0,0 +1,148 @@
+﻿import re
+from functools import partial
+from .lexer import reserved
+from .diagnostics import ILLEGAL_CHARACTER, column
+
+# Lexer alternativo ao do PLY, com o mesmo fluxo de tokens (tipo, valor, linha,
+# lexpos) e a mesma interface usada pelo parser (input/token/lineno/lexdata).
+#
+# O PLY testa os caracteres ignorados um a um em Python, cria um LexToken e
+# chama uma função Python para cada ID, número, string e quebra de linha.
+# Aqui uma única regex já pula os espaços e os tokens são objetos com
+# __slots__. As alternativas mais frequentes vêm primeiro; entre regras que
+# casam no mesmo caractere inicial vale a ordem do PLY (FLOAT antes de INT,
+# CR_ID antes de BACKTICK, '<-' e '<=' antes de '<', '==' antes de '=').
+
+_RULES = (
+    ('ID', r'[A-Za-z_][A-Za-z0-9_\.]*'),
+    ('NEWLINE', r'\n+'),
+    ('LPAREN', r'\('),
+    ('RPAREN', r'\)'),
+    ('COMMA', r','),
+    ('ASSIGN_ARROW', r'<-'),
+    ('STRING_LITERAL', r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''),
+    ('FLOAT_LITERAL', r'\d+\.\d+(?:[eE][+-]?\d+)?'),
+    ('INT_LITERAL', r'\d+L?'),
+    ('COMMENT', r'\#.*'),
+    ('CR_ID', r'`[^`]+`'),
+    ('OR', r'\|\||\|'),
+    ('AND', r'&&|&'),
+    ('PLUS', r'\+'),
+    ('MUL', r'\*'),
+    ('POW', r'\^'),
+    ('EQ', r'=='),
+    ('NE', r'!='),
+    ('LE', r'<='),
+    ('GE', r'>='),
+    ('LBRACE', r'\{'),
+    ('RBRACE', r'\}'),
+    ('LBRACK', r'\['),
+    ('RBRACK', r'\]'),
+    ('DOLLAR', r'\$'),
+    ('MINUS', r'-'),
+    ('DIV', r'/'),
+    ('ASSIGN_EQ', r'='),
+    ('LT', r'<'),
+    ('GT', r'>'),
+    ('SEMICOLON', r';'),
+    ('COLON', r':'),
+    ('BACKTICK', r'`'),
+    ('NOT', r'!'),
+    ('ERROR', r'[^ \t\r\n]'),  # espaço no fim do texto não é erro
+)
+
+_MASTER = re.compile(
+    r'[ \t\r]*(?:' + '|'.join(f'(?P<{name}>{rx})' for name, rx in _RULES) + ')'
+)
+
+# tokens cujo tipo é o nome do grupo e o valor é o próprio texto
+_PLAIN = frozenset(name for name, _ in _RULES) - {
+    'FLOAT_LITERAL', 'CR_ID', 'INT_LITERAL', 'STRING_LITERAL', 'ID', 'NEWLINE', 'COMMENT', 'ERROR',
+}
+
+
+class Token:
+    """Token leve, com os mesmos atributos do LexToken do PLY."""
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __str__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+    __repr__ = __str__
+
+
+class FastLexer:
+    """
+    Substituto do lexer do PLY: parser.parse(texto, lexer=FastLexer()).
+    Como o do PLY, guarda o estado da análise; use um por thread (clone()).
+    Com diagnostics (ver diagnostics.py), caracteres ilegais são registrados
+    lá em vez de impressos.
+    """
+
+    def __init__(self):
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lineno = 1
+        self.diagnostics = None
+
+    def clone(self):
+        c = FastLexer()
+        c.lineno = self.lineno
+        return c
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        # token() devolve None no fim, como o do PLY (next com valor padrão,
+        # sem try/except por token)
+        self.token = partial(next, self._scan(data), None)
+
+    def token(self):
+        return None
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def _scan(self, data):
+        reserved_get = reserved.get
+        plain = _PLAIN
+        lineno = self.lineno
+        for m in _MASTER.finditer(data):
+            kind = m.lastgroup
+            text = m[kind]
+            start = m.end() - len(text)
+            if kind in plain:
+                yield Token(kind, text, lineno, start)
+            elif kind == 'ID':
+                upper = text.upper()
+                if upper == 'TRUE' or upper == 'FALSE':
+                    yield Token('BOOL_LITERAL', upper == 'TRUE', lineno, start)
+                else:
+                    yield Token(reserved_get(text, 'ID'), text, lineno, start)
+            elif kind == 'NEWLINE':
+                yield Token('NEWLINE', text, lineno, start)
+                lineno = self.lineno = lineno + len(text)
+            elif kind == 'INT_LITERAL':
+                yield Token('INT_LITERAL', int(text[:-1] if text[-1] == 'L' else text), lineno, start)
+            elif kind == 'FLOAT_LITERAL':
+                yield Token('FLOAT_LITERAL', float(text), lineno, start)
+            elif kind == 'STRING_LITERAL':
+                yield Token('STRING_LITERAL', text[1:-1], lineno, start)
+                # strings podem ocupar várias linhas
+                lineno = self.lineno = lineno + text.count('\n')
+            elif kind == 'CR_ID':
+                yield Token('ID', text, lineno, start)
+            elif kind == 'ERROR':
+                if self.diagnostics is None:
+                    print(f"Illegal character '{text}' at line {lineno}")
+                else:
+                    self.diagnostics.add(ILLEGAL_CHARACTER, f"Illegal character '{text}'",
+                                         lineno, column(data, start))
+            # COMMENT: ignorado
+        self.lexpos = len(data)
@@ -0,0 +1,350 @@
+﻿from .ast_nodes import *
+from .scope import _EXPR_CHILDREN, _STMT_EXPRS, _inner_blocks
+from .typeinfer import BOOL, EMPTY, FLOAT, INT, STRING, elem_type, is_array, join
+
+# Vetores que crescem dentro de laços. Em R é comum
+#
+#     v <- c()                      v <- c()
+#     for (i in 1:n) {              for (i in 1:n) {
+#       v <- c(v, i^2)                v[i] <- i^2
+#     }                             }
+#
+# Traduzido ao pé da letra, o primeiro recria o vetor inteiro a cada volta
+# (O(n²)) e o segundo nem funciona em Julia (v[i] fora dos limites). A análise
+# abaixo reconhece os dois padrões e o gerador troca o primeiro por push!/append!
+# e o segundo por um vetor pré-alocado com Vector{T}(undef, n).
+#
+# O mesmo plano guarda as conversões de vetor em Dict (v["k"] <- x) içadas
+# para antes de um laço (ver TypeInference._to_dict_before).
+
+_SCALARS = (INT, FLOAT, BOOL, STRING)
+
+
+class GrowthPlan:
+    """
+    Reescritas de um laço (guardado em loop.body.growth).
+
+    prelude: linhas emitidas antes do comando, como (nome, tipo, tamanho, modo);
+        modo "empty" → `v = T[]` (+ sizehint! se o tamanho for conhecido),
+        "hint" → `v = copy(v)` (+ sizehint!), "reserve" → só sizehint! (num
+        laço dentro de outro que já criou ou copiou v),
+        "undef" → `v = Vector{T}(undef, n)`,
+        "dict" → converte o vetor v (cujo tipo vai no lugar de T) em Dict.
+    appends: {Assign: "push!" | "append!"} para os `v <- c(v, ...)` do laço.
+    """
+    __slots__ = ('prelude', 'appends')
+
+    def __init__(self):
+        self.prelude = []
+        self.appends = {}
+
+
+def _nested_stmts(stmt):
+    """Comandos dentro de um if/laço, incluindo os aninhados (sem funções)."""
+    stack = [s for block in _inner_blocks(stmt) for s in block.stmts]
+    while stack:
+        stmt = stack.pop()
+        if stmt is None:
+            continue
+        yield stmt
+        for inner in _inner_blocks(stmt):
+            stack.extend(inner.stmts)
+
+
+def _exits_early(loop):
+    """True se o laço pode parar antes da última volta ou pular uma (break, next, return)."""
+    for stmt in _nested_stmts(loop):
+        if isinstance(stmt, Return):
+            return True
+        if isinstance(stmt, ExprStmt) and isinstance(stmt.expr, Var) and stmt.expr.name in ("break", "next"):
+            return True
+    return False
+
+
+def _bare_reads(stmts, name):
+    """True se `name` é lido no laço fora de um acesso v[...]."""
+    stack = []
+    for stmt in stmts:
+        exprs = _STMT_EXPRS.get(stmt.__class__)
+        if exprs is None:
+            continue
+        for e in exprs(stmt):
+            # o alvo de v[i] <- x não é uma leitura de v
+            if isinstance(stmt, AssignIndex) and e is stmt.target:
+                continue
+            if e is not None:
+                stack.append(e)
+    while stack:
+        e = stack.pop()
+        if isinstance(e, Var):
+            if e.name == name:
+                return True
+            continue
+        if isinstance(e, IndexOp) and isinstance(e.target, Var) and e.target.name == name:
+            stack.append(e.index)
+            continue
+        children = _EXPR_CHILDREN.get(e.__class__)
+        if children is not None:
+            stack.extend(c for c in children(e) if c is not None)
+    return False
+
+
+# funções que só leem o vetor (não guardam uma referência a ele)
+_READ_ONLY = frozenset(("length", "print", "cat", "sum", "mean", "max", "min"))
+
+
+def _aliases(stmts, name, growth):
+    """
+    True se `name` é lido no laço de um jeito que pode guardar o próprio
+    vetor (w <- v, f(v), list(a = v), ...): com push!/append! essa outra
+    referência mudaria junto, e em R ela é uma cópia. Não contam o v de
+    c(v, ...) nas atribuições `growth`, os acessos v[...], as operações
+    (v + 1 cria outro vetor) e as funções de _READ_ONLY.
+    """
+    stack = []
+    for stmt in stmts:
+        if stmt in growth:
+            stack.extend(stmt.expr.args[1:])
+            continue
+        exprs = _STMT_EXPRS.get(stmt.__class__)
+        if exprs is None:
+            continue
+        for e in exprs(stmt):
+            if isinstance(stmt, AssignIndex) and e is stmt.target:
+                continue
+            if e is not None:
+                stack.append(e)
+    while stack:
+        e = stack.pop()
+        if isinstance(e, Var):
+            if e.name == name:
+                return True
+            continue
+        if isinstance(e, IndexOp) and isinstance(e.target, Var):
+            stack.append(e.index)
+            continue
+        if isinstance(e, (BinaryOp, UnaryOp)) or isinstance(e, Call) and e.name in _READ_ONLY:
+            # operandos que são só o vetor: lidos, não guardados
+            stack.extend(c for c in _EXPR_CHILDREN[e.__class__](e)
+                         if c is not None and not isinstance(c, Var))
+            continue
+        children = _EXPR_CHILDREN.get(e.__class__)
+        if children is not None:
+            stack.extend(c for c in children(e) if c is not None)
+    return False
+
+
+def _own_inner_loops(loop, names):
+    """
+    Os laços dentro de loop que também crescem um vetor de names não o
+    copiam de novo a cada volta: no prelúdio de loop ele já foi criado ou
+    copiado, e nenhuma outra variável o guarda (ver _aliases).
+    """
+    for stmt in _nested_stmts(loop):
+        plan = stmt.body.growth if isinstance(stmt, (For, While)) else None
+        if plan is None:
+            continue
+        prelude = []
+        for entry in plan.prelude:
+            name, elem, count, mode = entry
+            if mode == "hint" and name in names:
+                if count is None:
+                    continue
+                entry = (name, elem, count, "reserve")
+            prelude.append(entry)
+        plan.prelude = prelude
+
+
+class _Writes:
+    """
+    Escritas de um bloco, incluindo as dos if/laços aninhados (sem funções).
+    Calculadas uma vez por bloco (ver _block_writes) e guardadas em
+    block.writes, para que laços aninhados não percorram a mesma subárvore
+    de novo a cada nível.
+
+    assigns: {nome: [v <- c(v, ...)]}, ou None se o nome também é atribuído
+        de outro jeito (ou é a variável de um for aninhado).
+    indexed: {nome: [v[i] <- x]}, ou None se algum índice não é uma variável.
+    stored: nomes usados com chaves de texto (v["k"] <- x), na ordem do código.
+    """
+    __slots__ = ('assigns', 'indexed', 'stored')
+
+    def __init__(self):
+        self.assigns = {}
+        self.indexed = {}
+        self.stored = {}
+
+    def merge(self, other):
+        for name, group in other.assigns.items():
+            _add(self.assigns, name, group)
+        for name, group in other.indexed.items():
+            _add(self.indexed, name, group)
+        for name in other.stored:
+            self.stored.setdefault(name)
+
+
+def _add(groups, name, stmts):
+    # as listas são compartilhadas com os blocos aninhados: nunca mudam no lugar
+    if stmts is None or groups.get(name, ()) is None:
+        groups[name] = None
+    elif name in groups:
+        groups[name] = groups[name] + stmts
+    else:
+        groups[name] = stmts
+
+
+def _block_writes(root):
+    """Preenche block.writes de root e dos blocos dentro dele (de baixo para cima)."""
+    stack = [(root, False)]
+    while stack:
+        block, children_done = stack.pop()
+        if children_done:
+            writes = _Writes()
+            for stmt in block.stmts:
+                if isinstance(stmt, Assign):
+                    _add(writes.assigns, stmt.name, [stmt] if _is_growth(stmt, stmt.name) else None)
+                elif isinstance(stmt, For):
+                    writes.assigns[stmt.var] = None
+                elif isinstance(stmt, AssignIndex) and isinstance(stmt.target, Var):
+                    name = stmt.target.name
+                    _add(writes.indexed, name, [stmt] if isinstance(stmt.index, Var) else None)
+                    if isinstance(stmt.index, StringLiteral):
+                        writes.stored.setdefault(name)
+                for inner in _inner_blocks(stmt):
+                    writes.merge(inner.writes)
+            block.writes = writes
+            continue
+
+        if block.writes is not None:
+            continue
+        stack.append((block, True))
+        for stmt in block.stmts:
+            for inner in _inner_blocks(stmt):
+                stack.append((inner, False))
+    return root.writes
+
+
+def _writes(stmt):
+    """Escritas dentro de um if/laço (todos os seus blocos)."""
+    blocks = [b.writes or _block_writes(b) for b in _inner_blocks(stmt)]
+    if len(blocks) == 1:
+        return blocks[0]
+    writes = _Writes()
+    for w in blocks:
+        writes.merge(w)
+    return writes
+
+
+def named_stores(stmt):
+    """
+    Variáveis usadas com chaves de texto (v["k"] <- x, v$k <- x) dentro do
+    laço stmt e que não são reatribuídas nele.
+    """
+    writes = _writes(stmt)
+    loop_var = stmt.var if isinstance(stmt, For) else None
+    return [name for name in writes.stored if name not in writes.assigns and name != loop_var]
+
+
+def _trip_count(loop):
+    """Número de voltas de `for (i in 1:n)` (o nó n), ou None se desconhecido."""
+    if isinstance(loop, For) and isinstance(loop.start_expr, IntLiteral) and loop.start_expr.value == 1:
+        return loop.end_expr
+    return None
+
+
+def _append_mode(assign, elem):
+    """
+    "push!"/"append!" se `assign` (v <- c(v, ...)) pode acrescentar no próprio
+    vetor, cujos elementos são do tipo elem; None se não pode.
+    """
+    extra = assign.expr.args[1:]
+    types = [a.jl_type for a in extra]
+    if all(t in _SCALARS for t in types):
+        mode = "push!"
+    elif all(is_array(t) for t in types):
+        mode = "append!"
+        types = [elem_type(t) for t in types]
+    else:
+        return None
+    # o vetor não pode mudar de tipo: Int[] não recebe 2.5
+    if any(t != EMPTY and join(elem, t) != elem for t in types):
+        return None
+    return mode
+
+
+def _is_growth(stmt, name):
+    expr = stmt.expr
+    return (
+        isinstance(expr, Call) and expr.name == "c" and len(expr.args) >= 2
+        and isinstance(expr.args[0], Var) and expr.args[0].name == name
+        and not any(isinstance(a, NamedArg) for a in expr.args)
+    )
+
+
+def plan_growth(loop, entry_env, plan=None):
+    """
+    Procura vetores que crescem no laço (For ou While). entry_env são os tipos
+    das variáveis na entrada do laço e os jl_type dentro dele já devem estar
+    anotados (ver TypeInference). Completa plan (se houver) e devolve o
+    GrowthPlan, ou None se não há nada a reescrever.
+    """
+    writes = _writes(loop)
+    assigns = writes.assigns
+    count = _trip_count(loop)
+    if plan is None:
+        plan = GrowthPlan()
+
+    # v <- c(v, x): todas as atribuições de v no laço têm de ser desse tipo
+    owned = set()
+    for name, group in assigns.items():
+        if group is None or isinstance(loop, For) and name == loop.var:
+            continue
+        entry = entry_env.get(name)
+        inner = group[0].expr.args[0].jl_type
+        elem = elem_type(inner)
+        if elem is None or elem == "Any" or not inner.startswith("Vector{"):
+            continue
+        if entry == EMPTY:
+            mode = "empty"
+        elif entry == inner:
+            mode = "hint"
+        else:
+            continue
+        modes = [_append_mode(s, elem) for s in group]
+        if None in modes:
+            continue
+        # push! muda o vetor no lugar: um que já existia é copiado antes, para
+        # que outras variáveis com o mesmo vetor (w <- v) não mudem junto, e
+        # no laço nenhuma outra pode passar a guardá-lo
+        if _aliases(_nested_stmts(loop), name, set(group)):
+            continue
+        for s, m in zip(group, modes):
+            plan.appends[s] = m
+        plan.prelude.append((name, elem, count, mode))
+        owned.add(name)
+    if owned:
+        _own_inner_loops(loop, owned)
+
+    # v[i] <- x em for (i in 1:n) com v vazio: pré-aloca os n elementos. Só
+    # se toda volta escreve v[i] (comando direto do corpo, sem break/next/
+    # return): senão ficariam elementos sem valor, e em R o vetor seria menor
+    if count is not None and loop.var not in assigns and writes.indexed:
+        direct = set(loop.body.stmts)
+        exits = _exits_early(loop)
+        for name, group in writes.indexed.items():
+            if group is None or name in assigns or entry_env.get(name) != EMPTY:
+                continue
+            if not all(s.index.name == loop.var and s in direct for s in group) or exits:
+                continue
+            if _bare_reads(_nested_stmts(loop), name):
+                continue
+            elem = group[0].expr.jl_type
+            for s in group[1:]:
+                elem = join(elem, s.expr.jl_type)
+            if elem not in _SCALARS:
+                elem = "Any"
+            plan.prelude.append((name, elem, count, "undef"))
+
+    if not plan.prelude and not plan.appends:
+        return None
+    return plan
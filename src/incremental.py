@@ -0,0 +1,268 @@
+﻿from bisect import bisect_right
+from itertools import accumulate
+from .transpile import Transpiler
+from .ast_nodes import Node, Program
+from .codegen import JuliaCodeGen, join_parts
+from .diagnostics import Diagnostics
+
+
+class _Segment:
+    """
+    Um trecho do texto analisado de uma vez (Transpiler.iter_chunks), com o
+    que foi gerado para ele.
+
+    A inferência de tipos e o codegen de um trecho só dependem do estado de
+    entrada (tipos das variáveis e funções, globais lidas por funções,
+    structs já criados) para os nomes que aparecem nele (names). Por isso o
+    trecho guarda, em vez do estado inteiro, só o que muda nele: env,
+    functions e shared restritos a names, e os structs que criou.
+    """
+    __slots__ = ('text', 'lines', 'stmts', 'errors', 'names', 'env', 'functions', 'shared',
+                 'structs', 'code')
+
+    def __init__(self, text, stmts, errors):
+        self.text = text
+        self.lines = text.count('\n')
+        self.stmts = stmts
+        # (código, mensagem, linha relativa ao início do trecho, coluna)
+        self.errors = errors
+        self.names = _names(stmts)
+        self.env = self.functions = {}
+        self.shared = self.structs = frozenset()
+        self.code = ("", None, None)  # ver JuliaCodeGen.generate_parts
+
+    def apply(self, typer):
+        """Leva o typer do estado de entrada ao de saída do trecho."""
+        typer.env.update(self.env)
+        typer.functions.update(self.functions)
+        typer.shared |= self.shared
+
+    def record(self, typer):
+        """Guarda o que o trecho mudou, a partir do typer logo depois dele."""
+        env, functions = typer.env, typer.functions
+        names = self.names
+        self.env = {n: env[n] for n in names if n in env}
+        self.functions = {n: functions[n] for n in names if n in functions}
+        self.shared = frozenset(names & typer.shared)
+
+
+# anotações dos nós (preenchidas depois do parse), que não são nomes do código
+_ANNOTATIONS = {'lineno', 'col', 'jl_type', 'assigned', 'reads', 'growth', 'writes'}
+_FIELDS = {}
+
+
+def _names(stmts):
+    """
+    Todos os textos (nomes, campos, strings) da AST de stmts. Contém todo
+    nome cujo tipo ou definição anterior pode afetar estes comandos.
+    """
+    names = set()
+    stack = list(stmts)
+    while stack:
+        item = stack.pop()
+        if item is None:
+            continue
+        cls = item.__class__
+        if cls is str:
+            names.add(item)
+        elif cls is list or cls is tuple:
+            stack.extend(item)
+        elif isinstance(item, Node):
+            fields = _FIELDS.get(cls)
+            if fields is None:
+                fields = _FIELDS[cls] = [f for c in cls.__mro__ for f in getattr(c, '__slots__', ())
+                                         if f not in _ANNOTATIONS]
+            for f in fields:
+                stack.append(getattr(item, f, None))
+    return frozenset(names)
+
+
+def _struct_names(names):
+    """
+    Os structs que um trecho com estes nomes pode criar ou usar, derivados
+    como no codegen: a classe de structure(..., class="foo") e a parte depois
+    do "." de um método S3 (`+.foo`, com ou sem crases), capitalizadas.
+    """
+    out = set()
+    for n in names:
+        out.add(n.capitalize())
+        if "." in n:
+            out.add(n.strip("`").split(".", 1)[1].capitalize())
+    return out
+
+
+_ABSENT = object()
+
+
+def _state_of(typer, name):
+    return typer.env.get(name, _ABSENT), typer.functions.get(name, _ABSENT), name in typer.shared
+
+
+def _summary(segments):
+    # estado (por nome) depois de uma sequência de trechos, para os nomes
+    # que aparecem nela
+    out = {}
+    for seg in segments:
+        for n in seg.names:
+            out[n] = (seg.env.get(n, _ABSENT), seg.functions.get(n, _ABSENT), n in seg.shared)
+    return out
+
+
+def _iter_lines(text, pos):
+    # as linhas de text a partir de pos, sob demanda (sem copiar o resto)
+    n = len(text)
+    while pos < n:
+        end = text.find('\n', pos)
+        end = n if end < 0 else end + 1
+        yield text[pos:end]
+        pos = end
+
+
+class IncrementalTranspiler:
+    """
+    Transpilação incremental para editores: guarda o texto dividido em
+    trechos de comandos de nível superior (os mesmos do modo streaming), com
+    a AST e o Julia de cada um. update() reanalisa só os trechos tocados pela
+    edição e gera de novo só o código que pode ter mudado; o resultado é
+    sempre idêntico ao de transpile_stream() sobre o texto inteiro (e, sem
+    erros de sintaxe, ao de transpile()).
+
+    A inferência de tipos vai para frente: uma edição pode mudar o tipo de
+    uma variável usada mais adiante. Depois dos trechos editados, segue-se o
+    conjunto dos nomes cujo estado mudou; só os trechos seguintes que usam
+    algum deles são inferidos e gerados de novo, até o conjunto esvaziar.
+
+    Os erros de sintaxe são registrados (veja diagnostics), como no editor se
+    espera de um texto sendo digitado; o Julia dos comandos válidos é gerado.
+    Use uma instância por documento (e por thread).
+    """
+
+    def __init__(self, text="", **codegen_options):
+        if codegen_options.get("wrap_main"):
+            # main() exige ver o programa inteiro (definições são içadas)
+            raise ValueError("o modo incremental não suporta wrap_main")
+        self.text = ""
+        self._transpiler = Transpiler()
+        self._gen = JuliaCodeGen(**codegen_options)
+        self._segments = []
+        self.update(0, 0, text)
+
+    def set_text(self, text):
+        """Troca o texto inteiro (ex.: ao abrir o documento)."""
+        return self.update(0, len(self.text), text)
+
+    def update(self, start, end, new_text):
+        """
+        Aplica uma edição: text[start:end] (posições em caracteres) passa a
+        ser new_text. Retorna o Julia do texto novo.
+        """
+        old = self.text
+        if not 0 <= start <= end <= len(old):
+            raise ValueError(f"edição fora do texto: {start}:{end} (tamanho {len(old)})")
+        text = self.text = old[:start] + new_text + old[end:]
+        delta = len(new_text) - (end - start)
+        segments = self._segments
+        offsets = list(accumulate((s.text for s in segments), lambda acc, t: acc + len(t),
+                                  initial=0))
+
+        # o primeiro trecho tocado; os anteriores não mudam e terminam numa
+        # fronteira, então a divisão recomeça do início dele como se fosse do
+        # início do arquivo
+        first = max(0, min(bisect_right(offsets, start) - 1, len(segments) - 1))
+        pos = offsets[first]
+        line = 1 + sum(s.lines for s in segments[:first])
+
+        # reanalisa até um fim de trecho novo coincidir com um fim de trecho
+        # antigo depois da edição: dali em diante os trechos antigos valem
+        edited_end = start + len(new_text)
+        old_ends = {offsets[k + 1] + delta: k for k in range(first, len(segments))
+                    if offsets[k + 1] >= end}
+        fresh = []
+        last = len(segments) - 1
+        diagnostics = Diagnostics()
+        mark = 0
+        for chunk_line, chunk, stmts in self._transpiler.iter_chunks(
+                _iter_lines(text, pos), diagnostics, line):
+            errors = [(d.code, d.message, d.line - chunk_line, d.column)
+                      for d in diagnostics.items[mark:]]
+            mark = len(diagnostics)
+            fresh.append(_Segment(chunk, stmts, errors))
+            pos += len(chunk)
+            if pos >= edited_end and pos in old_ends:
+                last = old_ends[pos]
+                break
+        replaced = segments[first:last + 1]
+        segments[first:last + 1] = fresh
+
+        self._regenerate(first, fresh, replaced)
+        return self.julia
+
+    def _regenerate(self, first, fresh, replaced):
+        # infere e gera os trechos novos (que começam em `first` e substituem
+        # `replaced`) e os seguintes afetados por eles
+        typer = self._gen.typer
+        segments = self._segments
+        typer.env, typer.functions, typer.shared = {}, {}, set()
+        created = set()
+        for seg in segments[:first]:
+            seg.apply(typer)
+            created |= seg.structs
+        old_created = created.union(*(seg.structs for seg in replaced))
+        names = set().union(*(seg.names for seg in fresh), *(seg.names for seg in replaced))
+        entry = {n: _state_of(typer, n) for n in names}
+
+        for seg in fresh:
+            self._generate(seg, created)
+        before, after = _summary(replaced), _summary(fresh)
+        dirty = {n for n in names if before.get(n, entry[n]) != after.get(n, entry[n])}
+
+        for seg in segments[first + len(fresh):]:
+            if not dirty and created == old_created:
+                break  # daqui em diante o estado é o mesmo de antes
+            if (seg.names & dirty or created != old_created
+                    and _struct_names(seg.names) & (created ^ old_created)):
+                old_created |= seg.structs
+                before = _summary([seg])
+                self._generate(seg, created)
+                after = _summary([seg])
+                dirty -= seg.names
+                dirty.update(n for n in seg.names if before[n] != after[n])
+            else:
+                seg.apply(typer)
+                created |= seg.structs
+                old_created |= seg.structs
+
+    def _generate(self, seg, created):
+        # infere e gera seg a partir do estado atual do typer e dos structs
+        # já criados (atualizado com os de seg)
+        gen = self._gen
+        gen.typer.escaped = set()
+        gen.typer.converted = {}
+        gen._created_structs = set(created)
+        program = Program(seg.stmts)
+        gen.typer.visit_program(program)
+        seg.code = gen.generate_parts(program.stmts)
+        seg.structs = frozenset(gen._created_structs - created)
+        created |= seg.structs
+        seg.record(gen.typer)
+
+    @property
+    def julia(self):
+        """O Julia do texto atual."""
+        return "\n".join(join_parts(s.code for s in self._segments))
+
+    @property
+    def statements(self):
+        """Os comandos de nível superior do texto atual (Program.stmts)."""
+        return [stmt for s in self._segments for stmt in s.stmts]
+
+    @property
+    def diagnostics(self):
+        """Os erros léxicos e de sintaxe do texto atual (um Diagnostics novo)."""
+        diagnostics = Diagnostics()
+        line = 1
+        for s in self._segments:
+            for code, message, offset, col in s.errors:
+                diagnostics.add(code, message, line + offset, col)
+            line += s.lines
+        return diagnostics
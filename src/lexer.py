@@ -1,4 +1,4 @@
-﻿import ply.lex as lex
+﻿from .diagnostics import ILLEGAL_CHARACTER, column
 
 # Palavras reservadas (keywords)
 reserved = {
@@ -88,6 +88,7 @@ def t_INT_LITERAL(t):
 # STRING
 def t_STRING_LITERAL(t):
     r'"([^"\\]|\\.)*"|\'([^\'\\]|\\.)*\''
+    t.lexer.lineno += t.value.count('\n')  # strings podem ocupar várias linhas
     t.value = t.value[1:-1]
     return t
 
@@ -114,18 +115,52 @@ def t_COMMENT(t):
     pass
 
 # Erro
+# Com lexer.diagnostics (ver diagnostics.py) o erro é registrado lá; sem ele,
+# é impresso como antes.
 def t_error(t):
-    print(f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}")
+    diagnostics = getattr(t.lexer, 'diagnostics', None)
+    if diagnostics is None:
+        print(f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}")
+    else:
+        diagnostics.add(ILLEGAL_CHARACTER, f"Illegal character '{t.value[0]}'",
+                        t.lexer.lineno, column(t.lexer.lexdata, t.lexpos))
     t.lexer.skip(1)
 
 def t_ANY_error(t):
-    print(f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}")
-    t.lexer.skip(1)
+    t_error(t)
+
+# -----------------------
+# Construção preguiçosa
+# -----------------------
+# O lexer só é montado no primeiro uso. Com optimize=1 o PLY pula a validação
+# das regras e carrega a regex mestre já pronta de lextab.py (gerado e
+# versionado junto do código), em vez de reconstruí-la a cada processo.
+# Ao mudar as regras de token, apague lextab.py para que seja regenerado.
+_lexer = None
+
+
+def build_lexer():
+    import ply.lex as lex
+    return lex.lex(optimize=1, lextab='lextab')
+
+
+def get_lexer():
+    global _lexer
+    if _lexer is None:
+        _lexer = build_lexer()
+    return _lexer
+
+
+def __getattr__(name):
+    # compatibilidade: "from .lexer import lexer" continua funcionando
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-lexer = lex.lex()
 
 # Debug: imprime tokens
 if __name__ == "__main__":
+    lexer = get_lexer()
     lexer.input("is.double(3.14)")
     while True:
         tok = lexer.token()
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASSIGN_ARROW', 'ASSIGN_EQ', 'BACKTICK', 'BOOL_LITERAL', 'COLON', 'COMMA', 'DIV', 'DOLLAR', 'ELSE', 'EQ', 'FLOAT_LITERAL', 'FOR', 'FUNCTION', 'GE', 'GT', 'ID', 'IF', 'IN', 'INT_LITERAL', 'LBRACE', 'LBRACK', 'LE', 'LPAREN', 'LT', 'MINUS', 'MUL', 'NE', 'NEWLINE', 'NOT', 'OR', 'PLUS', 'POW', 'RBRACE', 'RBRACK', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING_LITERAL', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOAT_LITERAL>\\d+\\.\\d+([eE][+-]?\\d+)?)|(?P<t_CR_ID>`[^`]+`)|(?P<t_INT_LITERAL>\\d+L?)|(?P<t_STRING_LITERAL>"([^"\\\\]|\\\\.)*"|\\\'([^\\\'\\\\]|\\\\.)*\\\')|(?P<t_ID>[A-Za-z_][A-Za-z0-9_\\.]*)|(?P<t_NEWLINE>\\n+)|(?P<t_COMMENT>\\#.*)|(?P<t_OR>(\\|\\||\\|))|(?P<t_AND>(&&|&))|(?P<t_PLUS>\\+)|(?P<t_MUL>\\*)|(?P<t_POW>\\^)|(?P<t_ASSIGN_ARROW><-)|(?P<t_EQ>==)|(?P<t_NE>!=)|(?P<t_LE><=)|(?P<t_GE>>=)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LBRACK>\\[)|(?P<t_RBRACK>\\])|(?P<t_DOLLAR>\\$)|(?P<t_MINUS>-)|(?P<t_DIV>/)|(?P<t_ASSIGN_EQ>=)|(?P<t_LT><)|(?P<t_GT>>)|(?P<t_COMMA>,)|(?P<t_SEMICOLON>;)|(?P<t_COLON>:)|(?P<t_BACKTICK>`)|(?P<t_NOT>!)', [None, ('t_FLOAT_LITERAL', 'FLOAT_LITERAL'), None, ('t_CR_ID', 'CR_ID'), ('t_INT_LITERAL', 'INT_LITERAL'), ('t_STRING_LITERAL', 'STRING_LITERAL'), None, None, ('t_ID', 'ID'), ('t_NEWLINE', 'NEWLINE'), ('t_COMMENT', 'COMMENT'), (None, 'OR'), None, (None, 'AND'), None, (None, 'PLUS'), (None, 'MUL'), (None, 'POW'), (None, 'ASSIGN_ARROW'), (None, 'EQ'), (None, 'NE'), (None, 'LE'), (None, 'GE'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'LBRACK'), (None, 'RBRACK'), (None, 'DOLLAR'), (None, 'MINUS'), (None, 'DIV'), (None, 'ASSIGN_EQ'), (None, 'LT'), (None, 'GT'), (None, 'COMMA'), (None, 'SEMICOLON'), (None, 'COLON'), (None, 'BACKTICK'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': ' \t\r'}
+_lexstateerrorf = {'INITIAL': 't_ANY_error'}
+_lexstateeoff = {}
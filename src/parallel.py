@@ -0,0 +1,190 @@
+﻿import os
+import mmap
+import multiprocessing
+from .transpile import get_transpiler
+from .codegen import JuliaCodeGen, join_parts
+from .typeinfer import TypeInference
+from .stream import statement_ends
+from .diagnostics import Diagnostics
+
+# abaixo disso o custo de iniciar os processos não compensa
+MIN_CHUNK = 256 * 1024
+
+
+def find_chunks(buf, parts):
+    """
+    Divide buf (mmap com o código R em UTF-8) em até `parts` trechos
+    de tamanho parecido, numa única passada. Só corta numa fronteira segura
+    entre comandos de nível superior (stream.statement_ends) e antes de uma
+    linha com código (não comentário nem linha em branco), de modo que cada
+    trecho é uma sequência de comandos completos.
+
+    Retorna [(início, fim, linha_inicial), ...] (posições em bytes).
+    """
+    size = len(buf)
+    target = size / parts
+    chunks = []
+    start, start_line = 0, 1
+    pos = 0
+    lineno = 1
+    cut_ok = False  # a linha anterior terminou numa fronteira
+    for line, boundary in statement_ends(iter(buf.readline, b"")):
+        if (cut_ok and pos - start >= target and len(chunks) < parts - 1
+                and line.lstrip()[:1] not in (b"", b"#")):
+            chunks.append((start, pos, start_line))
+            start, start_line = pos, lineno
+        pos += len(line)
+        lineno += line.count(b"\n")
+        cut_ok = boundary
+    chunks.append((start, size, start_line))
+    return chunks
+
+
+def _read_chunk(path, start, end):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+    if '\r' in text:
+        # como open() em modo texto (newlines universais), que o modo serial usa
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _worker(conn, path, start, end, lineno, codegen_options):
+    """
+    Processo de um trecho. Conversa com transpile_file_parallel pelo pipe:
+    envia se o parse deu certo; recebe o estado do typer do trecho anterior
+    e devolve o seu; envia (código, structs criados); depois, se o processo
+    principal mandar os structs já criados nos trechos anteriores, gera de
+    novo sem eles. None no lugar de uma resposta indica falha (o processo
+    principal refaz tudo em série, que reporta o erro como de costume); None
+    vindo do processo principal manda encerrar.
+    """
+    try:
+        diagnostics = Diagnostics()
+        program = get_transpiler().parse(_read_chunk(path, start, end), lineno, diagnostics)
+        if len(diagnostics):
+            conn.send(None)
+            return
+        conn.send(True)
+        state = conn.recv()
+        if state is None:
+            return
+        gen = JuliaCodeGen(**codegen_options)
+        gen.typer.restore(state)
+        gen.typer.visit_program(program)
+        conn.send(gen.typer.state())
+        conn.send((gen.generate_parts(program.stmts), gen._created_structs))
+        while True:
+            created = conn.recv()
+            if created is None:
+                return
+            gen._created_structs = set(created)
+            conn.send((gen.generate_parts(program.stmts), gen._created_structs - created))
+    except EOFError:
+        pass  # o processo principal terminou
+    except Exception:
+        try:
+            conn.send(None)
+        except OSError:
+            pass
+    finally:
+        conn.close()
+
+
+class _Fallback(Exception):
+    pass
+
+
+def _recv(conn):
+    msg = conn.recv()
+    if msg is None:
+        raise _Fallback
+    return msg
+
+
+def transpile_file_parallel(path, diagnostics=None, workers=None, min_chunk=MIN_CHUNK,
+                            **codegen_options):
+    """
+    Transpila um único arquivo .R grande usando vários processos. O arquivo é
+    lido uma vez (mmap) para achar os pontos de corte (find_chunks) e cada
+    processo faz o lexer e o parse do seu trecho ao mesmo tempo que os outros.
+
+    A inferência de tipos vai para frente, comando a comando: o trecho k
+    precisa do estado do typer ao fim do trecho k-1. Esse estado (pequeno)
+    passa de processo em processo, em ordem; cada processo gera o código do
+    seu trecho assim que repassa o estado, em paralelo com a inferência dos
+    trechos seguintes. Os structs (JuliaCodeGen._created_structs) são juntados
+    na montagem: um trecho que cria um struct já criado antes é gerado de novo
+    sem ele. A saída é idêntica, byte a byte, à de transpile().
+
+    Se algum trecho tiver erro léxico ou de sintaxe (ou algo falhar num
+    processo), o arquivo é transpilado em série, com o comportamento e os
+    diagnostics de sempre. Arquivos menores que 2 × min_chunk também.
+    """
+    if codegen_options.get("wrap_main"):
+        # main() exige ver o programa inteiro (definições são içadas)
+        raise ValueError("o modo paralelo não suporta wrap_main")
+    workers = workers or os.cpu_count() or 1
+    chunks = []
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        parts = min(workers, size // max(min_chunk, 1))
+        if parts >= 2:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                chunks = find_chunks(mm, parts)
+
+    if len(chunks) >= 2:
+        try:
+            return _run_chunks(path, chunks, codegen_options)
+        except _Fallback:
+            pass
+
+    with open(path, 'r', encoding='utf-8') as f:
+        src = f.read()
+    return get_transpiler().transpile(src, diagnostics, **codegen_options)
+
+
+def _run_chunks(path, chunks, codegen_options):
+    ctx = multiprocessing.get_context()
+    procs, conns = [], []
+    try:
+        for start, end, lineno in chunks:
+            conn, child = ctx.Pipe()
+            proc = ctx.Process(target=_worker, daemon=True,
+                               args=(child, path, start, end, lineno, codegen_options))
+            proc.start()
+            child.close()
+            procs.append(proc)
+            conns.append(conn)
+
+        for conn in conns:
+            _recv(conn)
+
+        state = TypeInference().state()
+        for conn in conns:
+            conn.send(state)
+            state = _recv(conn)
+
+        parts = []
+        created = set()
+        for conn in conns:
+            part, structs = _recv(conn)
+            if structs & created:
+                conn.send(created)
+                part, structs = _recv(conn)
+            created |= structs
+            parts.append(part)
+        return "\n".join(join_parts(parts))
+    except EOFError:
+        raise _Fallback  # um processo terminou sem responder
+    finally:
+        # com fork, cada processo herda as pontas dos pipes dos anteriores:
+        # fechar o pipe não basta para avisar o fim
+        for conn in conns:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            conn.close()
+        for proc in procs:
+            proc.join()
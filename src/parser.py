@@ -1,6 +1,7 @@
-﻿import ply.yacc as yacc
-from .lexer import tokens, lexer
+﻿import sys
+from .lexer import tokens
 from .ast_nodes import *
+from .diagnostics import UNEXPECTED_TOKEN
 
 
 precedence = (
@@ -15,12 +16,51 @@ precedence = (
     ('left', 'DOLLAR'),
 )
 
+# -----------------------
+# Posições (linha/coluna)
+# -----------------------
+def _column(lexer, lexpos):
+    # Os tokens chegam em ordem crescente de lexpos, então basta procurar '\n'
+    # desde a última posição consultada; sem isso, uma linha muito longa
+    # (ex.: a + b + c + ... gerado por máquina) custaria O(n²).
+    data = lexer.lexdata
+    cache = getattr(lexer, '_col_cache', None)
+    if cache is not None and cache[0] is data and cache[1] <= lexpos:
+        _data, start, line_start = cache
+    else:
+        start, line_start = 0, 0
+    nl = data.rfind('\n', start, lexpos)
+    if nl >= 0:
+        line_start = nl + 1
+    lexer._col_cache = (data, lexpos, line_start)
+    return lexpos - line_start + 1
+
+
+def _pos(node, p, i):
+    """
+    Copia para node a posição do símbolo p[i]: de um token, usa lineno e
+    lexpos (coluna a partir de 1); de um nó já construído, copia a dele.
+    """
+    sym = p.slice[i]
+    lexpos = getattr(sym, 'lexpos', None)
+    if lexpos is not None:
+        node.lineno = sym.lineno
+        node.col = _column(p.lexer, lexpos)
+    elif isinstance(p[i], Node):
+        node.lineno = p[i].lineno
+        node.col = p[i].col
+    return node
+
+
 # -----------------------
 # Program
 # -----------------------
 def p_program(p):
     'program : statements'
     p[0] = Program(p[1])
+    if p[1]:
+        p[0].lineno = p[1][0].lineno
+        p[0].col = p[1][0].col
 
 
 # -----------------------
@@ -42,10 +82,22 @@ def p_statements_multiple(p):
         new_stmt = p[2]
     else:
         new_stmt = p[3]
-    if new_stmt is None:
-        p[0] = p[1]
-    else:
-        p[0] = p[1] + [new_stmt]
+    # append in-place: p[1] + [x] copiaria a lista a cada redução (O(n²))
+    if new_stmt is not None:
+        p[1].append(new_stmt)
+    p[0] = p[1]
+
+
+# Recuperação de erros (só com Recovery, ver abaixo): o comando com erro vira
+# 'error' e é descartado. O 'error' só aparece no início da lista ou depois de
+# um separador, para que o trecho já lido do comando com erro não seja
+# reduzido a um comando incompleto.
+def p_statements_error(p):
+    '''statements : error
+                  | statements NEWLINE error
+                  | statements SEMICOLON error'''
+    p[0] = [] if len(p) == 2 else p[1]
+    p.parser.errok()  # o próximo erro volta a ser reportado
 
 
 # -----------------------
@@ -56,24 +108,24 @@ def p_statement_assignment(p):
                  | ID ASSIGN_EQ expression'''
     # ID may be a token object or a raw string
     name = p[1].value if hasattr(p[1], 'value') else str(p[1])
-    p[0] = Assign(name, p[3])
+    p[0] = _pos(Assign(name, p[3]), p, 1)
 
 
 def p_statement_assignment_index(p):
     # matches: expr [ index ] <- expr
     'statement : expression LBRACK expression RBRACK ASSIGN_ARROW expression'
-    p[0] = AssignIndex(p[1], p[3], p[6])
+    p[0] = _pos(AssignIndex(p[1], p[3], p[6]), p, 1)
 
 
 # Assignment via $ : e$x <- value
 def p_statement_assignment_dollar(p):
     'statement : expression DOLLAR ID ASSIGN_ARROW expression'
     field = p[3].value if hasattr(p[3], "value") else p[3]
-    p[0] = AssignIndex(
+    p[0] = _pos(AssignIndex(
         p[1],                          # target
-        StringLiteral(field),          # index (string)
+        _pos(StringLiteral(field), p, 3),  # index (string)
         p[5]                           # value
-    )
+    ), p, 1)
 
 
 # -----------------------
@@ -81,7 +133,7 @@ def p_statement_assignment_dollar(p):
 # -----------------------
 def p_statement_expr(p):
     'statement : expression'
-    p[0] = ExprStmt(p[1])
+    p[0] = _pos(ExprStmt(p[1]), p, 1)
 
 
 # Empty statements
@@ -113,7 +165,7 @@ def p_expression_binop(p):
                   | expression AND expression
                   | expression OR expression
                   | expression COLON expression'''
-    p[0] = BinaryOp(p[2], p[1], p[3])
+    p[0] = _pos(BinaryOp(p[2], p[1], p[3]), p, 1)
 
 
 # -----------------------
@@ -122,7 +174,7 @@ def p_expression_binop(p):
 def p_expression_unary(p):
     '''expression : NOT expression
                   | MINUS expression %prec NOT'''
-    p[0] = UnaryOp(p[1], p[2])
+    p[0] = _pos(UnaryOp(p[1], p[2]), p, 1)
 
 
 # -----------------------
@@ -140,19 +192,19 @@ def p_expression_number(p):
     '''expression : INT_LITERAL
                   | FLOAT_LITERAL'''
     if isinstance(p[1], int):
-        p[0] = IntLiteral(p[1])
+        p[0] = _pos(IntLiteral(p[1]), p, 1)
     else:
-        p[0] = FloatLiteral(p[1])
+        p[0] = _pos(FloatLiteral(p[1]), p, 1)
 
 
 def p_expression_string(p):
     'expression : STRING_LITERAL'
-    p[0] = StringLiteral(p[1])
+    p[0] = _pos(StringLiteral(p[1]), p, 1)
 
 
 def p_expression_bool(p):
     'expression : BOOL_LITERAL'
-    p[0] = BoolLiteral(p[1])
+    p[0] = _pos(BoolLiteral(p[1]), p, 1)
 
 
 # -----------------------
@@ -161,7 +213,7 @@ def p_expression_bool(p):
 def p_expression_var(p):
     'expression : ID'
     name = p[1].value if hasattr(p[1], 'value') else p[1]
-    p[0] = Var(name)
+    p[0] = _pos(Var(name), p, 1)
 
 
 # -----------------------
@@ -171,11 +223,11 @@ def p_expression_is_check(p):
     'expression : ID LPAREN expression RPAREN'
     name = p[1].value if hasattr(p[1], 'value') else str(p[1])
     if name == 'is.double':
-        p[0] = IsDouble(p[3])
+        p[0] = _pos(IsDouble(p[3]), p, 1)
     elif name == 'is.integer':
-        p[0] = IsInteger(p[3])
+        p[0] = _pos(IsInteger(p[3]), p, 1)
     else:
-        p[0] = Call(name, [p[3]])
+        p[0] = _pos(Call(name, [p[3]]), p, 1)
 
 
 # -----------------------
@@ -184,18 +236,19 @@ def p_expression_is_check(p):
 def p_expression_call_noargs(p):
     'expression : ID LPAREN RPAREN'
     name = p[1].value if hasattr(p[1], 'value') else str(p[1])
-    p[0] = Call(name, [])
+    p[0] = _pos(Call(name, []), p, 1)
 
 
 def p_expression_call(p):
     'expression : ID LPAREN arg_list RPAREN'
     name = p[1].value if hasattr(p[1], 'value') else str(p[1])
-    p[0] = Call(name, p[3])
+    p[0] = _pos(Call(name, p[3]), p, 1)
 
 
 def p_arg_list_multiple(p):
     'arg_list : arg_list COMMA arg'
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 
 def p_arg_list_single(p):
@@ -206,7 +259,7 @@ def p_arg_list_single(p):
 def p_arg_named(p):
     'arg : ID ASSIGN_EQ expression'
     name = p[1].value if hasattr(p[1], 'value') else str(p[1])
-    p[0] = NamedArg(name, p[3])
+    p[0] = _pos(NamedArg(name, p[3]), p, 1)
 
 
 def p_arg_positional(p):
@@ -221,9 +274,9 @@ def p_statement_if(p):
     '''statement : IF LPAREN expression RPAREN block
                  | IF LPAREN expression RPAREN block ELSE block'''
     if len(p) == 6:
-        p[0] = If(p[3], p[5], None)
+        p[0] = _pos(If(p[3], p[5], None), p, 1)
     else:
-        p[0] = If(p[3], p[5], p[7])
+        p[0] = _pos(If(p[3], p[5], p[7]), p, 1)
 
 
 # -----------------------
@@ -231,12 +284,12 @@ def p_statement_if(p):
 # -----------------------
 def p_block_braces(p):
     'block : LBRACE statements RBRACE'
-    p[0] = Block(p[2])
+    p[0] = _pos(Block(p[2]), p, 1)
 
 
 def p_block_statement(p):
     'block : statement'
-    p[0] = Block([p[1]])
+    p[0] = _pos(Block([p[1]]), p, 1)
 
 
 # -----------------------
@@ -244,7 +297,7 @@ def p_block_statement(p):
 # -----------------------
 def p_statement_while(p):
     'statement : WHILE LPAREN expression RPAREN block'
-    p[0] = While(p[3], p[5])
+    p[0] = _pos(While(p[3], p[5]), p, 1)
 
 
 # -----------------------
@@ -260,7 +313,7 @@ def p_statement_for(p):
     else:
         start = None
         end = rng
-    p[0] = For(var_name, start, end, p[7])
+    p[0] = _pos(For(var_name, start, end, p[7]), p, 1)
 
 
 # -----------------------
@@ -270,26 +323,27 @@ def p_statement_function_decl(p):
     'statement : ID ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN block'
     name = p[1].value if hasattr(p[1], 'value') else p[1]
     # params are at p[5], body (block) is at p[7]
-    p[0] = FunctionDecl(name, p[5], p[7])
+    p[0] = _pos(FunctionDecl(name, p[5], p[7]), p, 1)
 
 
 def p_statement_function_decl_no_params(p):
     'statement : ID ASSIGN_ARROW FUNCTION LPAREN RPAREN block'
     name = p[1].value if hasattr(p[1], 'value') else p[1]
     # no params -> params = [], body (block) is at p[6]
-    p[0] = FunctionDecl(name, [], p[6])
+    p[0] = _pos(FunctionDecl(name, [], p[6]), p, 1)
 
 
 def p_statement_s3_function(p):
     'statement : BACKTICK ID BACKTICK ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN block'
     # separa operador e classe
     op, cls = p[2].split(".")
-    p[0] = S3FunctionDecl(op, cls.capitalize(), p[7], p[9])
+    p[0] = _pos(S3FunctionDecl(op, cls.capitalize(), p[7], p[9]), p, 1)
 
 
 def p_param_list_multiple(p):
     'param_list : param_list COMMA ID'
-    p[0] = p[1] + [p[3].value if hasattr(p[3], 'value') else p[3]]
+    p[1].append(p[3].value if hasattr(p[3], 'value') else p[3])
+    p[0] = p[1]
 
 
 def p_param_list_single(p):
@@ -302,7 +356,7 @@ def p_param_list_single(p):
 # -----------------------
 def p_expression_index(p):
     'expression : expression LBRACK expression RBRACK'
-    p[0] = IndexOp(p[1], p[3])
+    p[0] = _pos(IndexOp(p[1], p[3]), p, 1)
 
 
 # -----------------------
@@ -311,7 +365,7 @@ def p_expression_index(p):
 def p_expression_dollar(p):
     'expression : expression DOLLAR ID'
     name = p[3].value if hasattr(p[3], 'value') else p[3]
-    p[0] = DollarAccess(p[1], name)
+    p[0] = _pos(DollarAccess(p[1], name), p, 1)
 
 
 # -----------------------
@@ -319,17 +373,120 @@ def p_expression_dollar(p):
 # -----------------------
 def p_statement_return(p):
     'statement : RETURN expression'
-    p[0] = Return(p[2])
+    p[0] = _pos(Return(p[2]), p, 1)
 
 
 # -----------------------
 # Error
 # -----------------------
+class IncompleteInputError(SyntaxError):
+    """Erro no fim da entrada: o trecho lido termina no meio de um comando."""
+
+
 def p_error(p):
     if p:
         raise SyntaxError(f"Syntax error at token {p.type} ({p.value!r}) line {getattr(p, 'lineno','unknown')}")
     else:
-        raise SyntaxError("Syntax error at EOF")
-
-
-parser = yacc.yacc()
+        raise IncompleteInputError("Syntax error at EOF")
+
+
+# tokens em que a análise pode retomar depois de um erro
+_SYNC = frozenset(('NEWLINE', 'SEMICOLON', 'RBRACE'))
+
+
+class Recovery:
+    """
+    Modo tolerante a erros do parser:
+
+        r = Recovery(lexer.token, diagnostics, parser)
+        parser.errorfunc = r.error
+        parser.parse(..., lexer=lexer, tokenfunc=r.token)
+
+    Cada token inesperado é registrado em diagnostics e o resto do comando é
+    descartado até o próximo NEWLINE, ';' ou '}', que volta para a entrada;
+    as produções com 'error' fazem o parser retomar ali. Um '}' sem '{' é
+    só descartado. O fim inesperado da entrada continua levantando
+    IncompleteInputError (o PLY não se recupera dele).
+    """
+
+    def __init__(self, next_token, diagnostics, parser):
+        self.next_token = next_token
+        self.diagnostics = diagnostics
+        self.parser = parser
+        self._pushback = None
+        self._last = None  # token do último erro
+        self._depth = 0    # '{' abertos nos tokens já entregues ao parser
+
+    def token(self):
+        tok = self._pushback
+        if tok is None:
+            tok = self.next_token()
+            if tok is not None:
+                if tok.type == 'LBRACE':
+                    self._depth += 1
+                elif tok.type == 'RBRACE':
+                    self._depth -= 1
+        else:
+            self._pushback = None
+        return tok
+
+    def _discard(self):
+        # errok() faz o PLY usar o token devolvido no lugar do que deu erro
+        self.parser.errok()
+        return self.token()
+
+    def error(self, p):
+        if not p:
+            raise IncompleteInputError("Syntax error at EOF")
+        if p is self._last:
+            # o mesmo token de novo logo depois da recuperação (já registrado):
+            # sem descartá-lo o parser repetiria o erro para sempre
+            return self._discard()
+        self._last = p
+        self.diagnostics.add(UNEXPECTED_TOKEN, f"Syntax error at token {p.type} ({p.value!r})",
+                             p.lineno, _column(p.lexer, p.lexpos))
+        if p.type == 'RBRACE' and self._depth < 0:
+            # '}' sem '{': a recuperação normal desempilharia até o início do
+            # programa, perdendo os comandos anteriores
+            self._depth = 0
+            return self._discard()
+        if p.type not in _SYNC:
+            tok = self.token()
+            while tok is not None and tok.type not in _SYNC:
+                tok = self.token()
+            self._pushback = tok
+
+
+# -----------------------
+# Construção preguiçosa
+# -----------------------
+# As tabelas LALR vêm prontas de parsetab.py. optimize=1 aceita a tabela sem
+# recalcular/validar a gramática, e write_tables=False / debug=False garantem
+# que nada (parsetab.py, parser.out) é escrito no diretório do código.
+# Depois de mudar a gramática, regenere com: python -m src.parser
+_parser = None
+
+
+def build_parser(optimize=1, write_tables=False):
+    import ply.yacc as yacc
+    return yacc.yacc(module=sys.modules[__name__], optimize=optimize,
+                     write_tables=write_tables, debug=False)
+
+
+def get_parser():
+    global _parser
+    if _parser is None:
+        _parser = build_parser()
+    return _parser
+
+
+def __getattr__(name):
+    # compatibilidade: "from .parser import parser" continua funcionando
+    if name == 'parser':
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    # regenera parsetab.py a partir da gramática atual
+    build_parser(optimize=0, write_tables=True)
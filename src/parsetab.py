@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'rightASSIGN_ARROWASSIGN_EQleftORleftANDrightNOTnonassocEQNELTLEGTGEleftPLUSMINUSleftMULDIVrightPOWleftDOLLARAND ASSIGN_ARROW ASSIGN_EQ BACKTICK BOOL_LITERAL COLON COMMA DIV DOLLAR ELSE EQ FLOAT_LITERAL FOR FUNCTION GE GT ID IF IN INT_LITERAL LBRACE LBRACK LE LPAREN LT MINUS MUL NE NEWLINE NOT OR PLUS POW RBRACE RBRACK RETURN RPAREN SEMICOLON STRING_LITERAL WHILEprogram : statementsstatements : statementstatements : statements statement\n                  | statements SEMICOLON statement\n                  | statements NEWLINE statementstatement : ID ASSIGN_ARROW expression\n                 | ID ASSIGN_EQ expressionstatement : expression LBRACK expression RBRACK ASSIGN_ARROW expressionstatement : expression DOLLAR ID ASSIGN_ARROW expressionstatement : expressionstatement : SEMICOLONstatement : NEWLINEexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression MUL expression\n                  | expression DIV expression\n                  | expression POW expression\n                  | expression EQ expression\n                  | expression NE expression\n                  | expression LT expression\n                  | expression LE expression\n                  | expression GT expression\n                  | expression GE expression\n                  | expression AND expression\n                  | expression OR expression\n                  | expression COLON expressionexpression : NOT expression\n                  | MINUS expression %prec NOTexpression : LPAREN expression RPARENexpression : INT_LITERAL\n                  | FLOAT_LITERALexpression : STRING_LITERALexpression : BOOL_LITERALexpression : IDexpression : ID LPAREN expression RPARENexpression : ID LPAREN RPARENexpression : ID LPAREN arg_list RPARENarg_list : arg_list COMMA argarg_list : argarg : ID ASSIGN_EQ expressionarg : expressionstatement : IF LPAREN expression RPAREN block\n                 | IF LPAREN expression RPAREN block ELSE blockblock : LBRACE statements RBRACEblock : statementstatement : WHILE LPAREN expression RPAREN blockstatement : FOR LPAREN ID IN expression RPAREN blockstatement : ID ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN blockstatement : ID ASSIGN_ARROW FUNCTION LPAREN RPAREN blockstatement : BACKTICK ID BACKTICK ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN blockparam_list : param_list COMMA IDparam_list : IDexpression : expression LBRACK expression RBRACKexpression : expression DOLLAR IDstatement : RETURN expression'
+_lr_signature = 'rightASSIGN_ARROWASSIGN_EQleftORleftANDrightNOTnonassocEQNELTLEGTGEleftPLUSMINUSleftMULDIVrightPOWleftDOLLARAND ASSIGN_ARROW ASSIGN_EQ BACKTICK BOOL_LITERAL COLON COMMA DIV DOLLAR ELSE EQ FLOAT_LITERAL FOR FUNCTION GE GT ID IF IN INT_LITERAL LBRACE LBRACK LE LPAREN LT MINUS MUL NE NEWLINE NOT OR PLUS POW RBRACE RBRACK RETURN RPAREN SEMICOLON STRING_LITERAL WHILEprogram : statementsstatements : statementstatements : statements statement\n                  | statements SEMICOLON statement\n                  | statements NEWLINE statementstatements : error\n                  | statements NEWLINE error\n                  | statements SEMICOLON errorstatement : ID ASSIGN_ARROW expression\n                 | ID ASSIGN_EQ expressionstatement : expression LBRACK expression RBRACK ASSIGN_ARROW expressionstatement : expression DOLLAR ID ASSIGN_ARROW expressionstatement : expressionstatement : SEMICOLONstatement : NEWLINEexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression MUL expression\n                  | expression DIV expression\n                  | expression POW expression\n                  | expression EQ expression\n                  | expression NE expression\n                  | expression LT expression\n                  | expression LE expression\n                  | expression GT expression\n                  | expression GE expression\n                  | expression AND expression\n                  | expression OR expression\n                  | expression COLON expressionexpression : NOT expression\n                  | MINUS expression %prec NOTexpression : LPAREN expression RPARENexpression : INT_LITERAL\n                  | FLOAT_LITERALexpression : STRING_LITERALexpression : BOOL_LITERALexpression : IDexpression : ID LPAREN expression RPARENexpression : ID LPAREN RPARENexpression : ID LPAREN arg_list RPARENarg_list : arg_list COMMA argarg_list : argarg : ID ASSIGN_EQ expressionarg : expressionstatement : IF LPAREN expression RPAREN block\n                 | IF LPAREN expression RPAREN block ELSE blockblock : LBRACE statements RBRACEblock : statementstatement : WHILE LPAREN expression RPAREN blockstatement : FOR LPAREN ID IN expression RPAREN blockstatement : ID ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN blockstatement : ID ASSIGN_ARROW FUNCTION LPAREN RPAREN blockstatement : BACKTICK ID BACKTICK ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN blockparam_list : param_list COMMA IDparam_list : IDexpression : expression LBRACK expression RBRACKexpression : expression DOLLAR IDstatement : RETURN expression'
     
-_lr_action_items = {'ID':([0,2,3,4,5,6,7,9,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,84,85,86,87,88,89,90,91,93,94,95,99,104,105,106,107,108,109,110,113,114,115,116,117,118,119,120,121,123,124,125,127,128,],[6,6,-2,-11,-12,-34,-10,44,47,44,44,44,-30,-31,-32,-33,-3,6,6,44,44,56,44,62,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-34,44,82,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,44,93,97,44,-35,-37,102,-53,44,6,-54,6,44,6,44,-9,-42,6,-45,-53,-46,6,122,-49,-8,6,6,6,97,-48,-43,-44,-47,6,-50,]),'SEMICOLON':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[4,21,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,4,4,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,4,-54,4,4,-9,-42,4,-45,-53,-46,4,-49,-8,4,21,4,-48,-43,-44,-47,4,-50,]),'NEWLINE':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[5,22,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,5,5,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,5,-54,5,5,-9,-42,5,-45,-53,-46,5,-49,-8,5,22,5,-48,-43,-44,-47,5,-50,]),'IF':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[8,8,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,8,8,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,8,-54,8,8,-9,-42,8,-45,-53,-46,8,-49,-8,8,8,8,-48,-43,-44,-47,8,-50,]),'WHILE':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[10,10,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,10,10,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,10,-54,10,10,-9,-42,10,-45,-53,-46,10,-49,-8,10,10,10,-48,-43,-44,-47,10,-50,]),'FOR':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[11,11,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,11,11,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,11,-54,11,11,-9,-42,11,-45,-53,-46,11,-49,-8,11,11,11,-48,-43,-44,-47,11,-50,]),'BACKTICK':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,47,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[12,12,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,12,12,-34,83,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,12,-54,12,12,-9,-42,12,-45,-53,-46,12,-49,-8,12,12,12,-48,-43,-44,-47,12,-50,]),'RETURN':([0,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,91,93,94,99,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[13,13,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,13,13,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,13,-54,13,13,-9,-42,13,-45,-53,-46,13,-49,-8,13,13,13,-48,-43,-44,-47,13,-50,]),'NOT':([0,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,85,86,87,88,89,90,91,93,94,95,99,104,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[15,15,-2,-11,-12,-34,-10,15,15,15,15,-30,-31,-32,-33,-3,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,-34,15,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,15,15,-35,-37,15,-53,15,15,-54,15,15,15,15,-9,-42,15,-45,-53,-46,15,-49,-8,15,15,15,-48,-43,-44,-47,15,-50,]),'MINUS':([0,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,48,49,50,51,52,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,85,86,87,88,89,90,91,92,93,94,95,99,100,102,103,104,105,106,107,108,109,110,111,113,115,116,117,118,119,121,123,124,125,127,128,],[14,14,-2,-11,-12,-34,29,14,14,14,14,-30,-31,-32,-33,-3,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,29,-34,14,29,29,29,-4,-5,29,29,-34,29,-36,29,-54,-13,-14,-15,-16,-17,29,29,29,29,29,29,29,29,29,29,-29,14,29,14,-35,-37,14,-53,14,14,29,-54,14,14,14,29,-34,29,14,29,-42,14,-45,-53,-46,29,14,-49,29,14,14,14,-48,-43,-44,-47,14,-50,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,48,49,50,51,52,53,54,55,56,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,85,86,87,88,89,90,91,93,94,95,99,102,104,105,106,107,108,109,110,112,113,115,116,117,118,119,121,123,124,125,127,128,],[9,9,-2,-11,-12,25,-10,42,9,45,46,9,9,9,-30,-31,-32,-33,-3,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,25,9,-55,-28,-27,-4,-5,-6,84,-7,25,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,9,9,-35,-37,9,-53,9,9,-54,9,9,9,25,9,-9,-42,9,-45,-53,-46,120,9,-49,-8,9,9,9,-48,-43,-44,-47,9,-50,]),'INT_LITERAL':([0,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,85,86,87,88,89,90,91,93,94,95,99,104,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[16,16,-2,-11,-12,-34,-10,16,16,16,16,-30,-31,-32,-33,-3,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-34,16,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,16,16,-35,-37,16,-53,16,16,-54,16,16,16,16,-9,-42,16,-45,-53,-46,16,-49,-8,16,16,16,-48,-43,-44,-47,16,-50,]),'FLOAT_LITERAL':([0,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,85,86,87,88,89,90,91,93,94,95,99,104,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[17,17,-2,-11,-12,-34,-10,17,17,17,17,-30,-31,-32,-33,-3,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-34,17,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,17,17,-35,-37,17,-53,17,17,-54,17,17,17,17,-9,-42,17,-45,-53,-46,17,-49,-8,17,17,17,-48,-43,-44,-47,17,-50,]),'STRING_LITERAL':([0,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,85,86,87,88,89,90,91,93,94,95,99,104,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[18,18,-2,-11,-12,-34,-10,18,18,18,18,-30,-31,-32,-33,-3,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-34,18,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,18,18,-35,-37,18,-53,18,18,-54,18,18,18,18,-9,-42,18,-45,-53,-46,18,-49,-8,18,18,18,-48,-43,-44,-47,18,-50,]),'BOOL_LITERAL':([0,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,85,86,87,88,89,90,91,93,94,95,99,104,105,106,107,108,109,110,113,115,116,117,118,119,121,123,124,125,127,128,],[19,19,-2,-11,-12,-34,-10,19,19,19,19,-30,-31,-32,-33,-3,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-34,19,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,19,19,-35,-37,19,-53,19,19,-54,19,19,19,19,-9,-42,19,-45,-53,-46,19,-49,-8,19,19,19,-48,-43,-44,-47,19,-50,]),'$end':([1,2,3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,93,105,106,108,109,110,115,116,121,123,124,125,128,],[0,-1,-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,-11,-12,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,-54,-9,-42,-45,-53,-46,-49,-8,-48,-43,-44,-47,-50,]),'RBRACE':([3,4,5,6,7,16,17,18,19,20,21,22,44,48,49,50,51,52,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,93,105,106,108,109,110,115,116,118,121,123,124,125,128,],[-2,-11,-12,-34,-10,-30,-31,-32,-33,-3,-11,-12,-34,-55,-28,-27,-4,-5,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,-54,-9,-42,-45,-53,-46,-49,-8,124,-48,-43,-44,-47,-50,]),'ELSE':([4,5,6,7,16,17,18,19,44,48,49,50,53,55,58,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,89,93,105,106,108,109,110,115,116,121,123,124,125,128,],[-11,-12,-34,-10,-30,-31,-32,-33,-34,-55,-28,-27,-6,-7,-36,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-53,-54,-9,117,-45,-53,-46,-49,-8,-48,-43,-44,-47,-50,]),'ASSIGN_ARROW':([6,62,83,89,],[23,90,96,104,]),'ASSIGN_EQ':([6,56,102,],[24,85,85,]),'LBRACK':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,26,-30,-31,-32,-33,79,-34,79,-28,-27,79,79,-34,79,-36,79,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,79,79,-29,79,-35,-37,-53,79,-54,79,-34,79,79,-53,79,79,]),'DOLLAR':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,27,-30,-31,-32,-33,80,-34,80,80,80,80,80,-34,80,-36,80,-54,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-29,80,-35,-37,-53,80,-54,80,-34,80,80,-53,80,80,]),'PLUS':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,28,-30,-31,-32,-33,28,-34,28,28,28,28,28,-34,28,-36,28,-54,-13,-14,-15,-16,-17,28,28,28,28,28,28,28,28,28,28,-29,28,-35,-37,-53,28,-54,28,-34,28,28,-53,28,28,]),'MUL':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,30,-30,-31,-32,-33,30,-34,30,30,30,30,30,-34,30,-36,30,-54,30,30,-15,-16,-17,30,30,30,30,30,30,30,30,30,30,-29,30,-35,-37,-53,30,-54,30,-34,30,30,-53,30,30,]),'DIV':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,31,-30,-31,-32,-33,31,-34,31,31,31,31,31,-34,31,-36,31,-54,31,31,-15,-16,-17,31,31,31,31,31,31,31,31,31,31,-29,31,-35,-37,-53,31,-54,31,-34,31,31,-53,31,31,]),'POW':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,32,-30,-31,-32,-33,32,-34,32,32,32,32,32,-34,32,-36,32,-54,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-29,32,-35,-37,-53,32,-54,32,-34,32,32,-53,32,32,]),'EQ':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,33,-30,-31,-32,-33,33,-34,33,33,33,33,33,-34,33,-36,33,-54,-13,-14,-15,-16,-17,None,None,None,None,None,None,33,33,33,33,-29,33,-35,-37,-53,33,-54,33,-34,33,33,-53,33,33,]),'NE':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,34,-30,-31,-32,-33,34,-34,34,34,34,34,34,-34,34,-36,34,-54,-13,-14,-15,-16,-17,None,None,None,None,None,None,34,34,34,34,-29,34,-35,-37,-53,34,-54,34,-34,34,34,-53,34,34,]),'LT':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,35,-30,-31,-32,-33,35,-34,35,35,35,35,35,-34,35,-36,35,-54,-13,-14,-15,-16,-17,None,None,None,None,None,None,35,35,35,35,-29,35,-35,-37,-53,35,-54,35,-34,35,35,-53,35,35,]),'LE':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,36,-30,-31,-32,-33,36,-34,36,36,36,36,36,-34,36,-36,36,-54,-13,-14,-15,-16,-17,None,None,None,None,None,None,36,36,36,36,-29,36,-35,-37,-53,36,-54,36,-34,36,36,-53,36,36,]),'GT':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,37,-30,-31,-32,-33,37,-34,37,37,37,37,37,-34,37,-36,37,-54,-13,-14,-15,-16,-17,None,None,None,None,None,None,37,37,37,37,-29,37,-35,-37,-53,37,-54,37,-34,37,37,-53,37,37,]),'GE':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,38,-30,-31,-32,-33,38,-34,38,38,38,38,38,-34,38,-36,38,-54,-13,-14,-15,-16,-17,None,None,None,None,None,None,38,38,38,38,-29,38,-35,-37,-53,38,-54,38,-34,38,38,-53,38,38,]),'AND':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,39,-30,-31,-32,-33,39,-34,39,-28,-27,39,39,-34,39,-36,39,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,39,39,39,-29,39,-35,-37,-53,39,-54,39,-34,39,39,-53,39,39,]),'OR':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,40,-30,-31,-32,-33,40,-34,40,-28,-27,40,40,-34,40,-36,40,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,40,40,-29,40,-35,-37,-53,40,-54,40,-34,40,40,-53,40,40,]),'COLON':([6,7,16,17,18,19,43,44,48,49,50,53,55,56,57,58,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,86,87,89,92,93,100,102,103,105,109,111,116,],[-34,41,-30,-31,-32,-33,41,-34,41,-28,-27,41,41,-34,41,-36,41,-54,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,41,41,-29,41,-35,-37,-53,41,-54,41,-34,41,41,-53,41,41,]),'RPAREN':([16,17,18,19,25,43,44,49,50,56,57,58,59,60,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,84,86,87,93,97,98,100,101,102,103,109,111,122,126,],[-30,-31,-32,-33,58,78,-34,-28,-27,-34,86,-36,87,-39,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,91,-29,94,99,-35,-37,-54,-52,113,-40,-38,-34,-41,-53,119,-51,127,]),'COMMA':([16,17,18,19,44,49,50,56,57,58,59,60,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,93,97,98,100,101,102,103,109,122,126,],[-30,-31,-32,-33,-34,-28,-27,-34,-41,-36,88,-39,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,-54,-52,114,-40,-38,-34,-41,-53,-51,114,]),'RBRACK':([16,17,18,19,44,49,50,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,86,87,92,93,109,],[-30,-31,-32,-33,-34,-28,-27,-36,89,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-29,-35,-37,109,-54,-53,]),'FUNCTION':([23,96,],[54,112,]),'IN':([82,],[95,]),'LBRACE':([91,94,99,113,117,119,127,],[107,107,107,107,107,107,107,]),}
+_lr_action_items = {'error':([0,22,23,110,],[6,53,55,6,]),'ID':([0,2,3,4,5,6,7,8,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,87,88,89,90,91,92,93,94,96,97,98,102,107,108,109,110,111,112,113,116,117,118,119,120,121,122,123,124,126,127,128,130,131,],[7,7,-2,-14,-15,-6,-37,-13,45,48,45,45,45,-33,-34,-35,-36,-3,7,7,45,45,59,45,65,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-37,45,85,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,45,96,100,45,-38,-40,105,-56,45,7,-57,7,45,7,45,-12,-45,7,-48,-56,-49,7,125,-52,-11,7,7,7,100,-51,-46,-47,-50,7,-53,]),'SEMICOLON':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[4,22,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,4,4,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,4,-57,4,4,-12,-45,4,-48,-56,-49,4,-52,-11,4,22,4,-51,-46,-47,-50,4,-53,]),'NEWLINE':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[5,23,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,5,5,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,5,-57,5,5,-12,-45,5,-48,-56,-49,5,-52,-11,5,23,5,-51,-46,-47,-50,5,-53,]),'IF':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[9,9,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,9,9,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,9,-57,9,9,-12,-45,9,-48,-56,-49,9,-52,-11,9,9,9,-51,-46,-47,-50,9,-53,]),'WHILE':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[11,11,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,11,11,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,11,-57,11,11,-12,-45,11,-48,-56,-49,11,-52,-11,11,11,11,-51,-46,-47,-50,11,-53,]),'FOR':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[12,12,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,12,12,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,12,-57,12,12,-12,-45,12,-48,-56,-49,12,-52,-11,12,12,12,-51,-46,-47,-50,12,-53,]),'BACKTICK':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,48,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[13,13,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,13,13,-37,86,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,13,-57,13,13,-12,-45,13,-48,-56,-49,13,-52,-11,13,13,13,-51,-46,-47,-50,13,-53,]),'RETURN':([0,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,94,96,97,102,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[14,14,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,14,14,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,14,-57,14,14,-12,-45,14,-48,-56,-49,14,-52,-11,14,14,14,-51,-46,-47,-50,14,-53,]),'NOT':([0,2,3,4,5,6,7,8,10,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,88,89,90,91,92,93,94,96,97,98,102,107,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[16,16,-2,-14,-15,-6,-37,-13,16,16,16,16,-33,-34,-35,-36,-3,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-37,16,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,16,16,-38,-40,16,-56,16,16,-57,16,16,16,16,-12,-45,16,-48,-56,-49,16,-52,-11,16,16,16,-51,-46,-47,-50,16,-53,]),'MINUS':([0,2,3,4,5,6,7,8,10,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,49,50,51,52,53,54,55,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,84,88,89,90,91,92,93,94,95,96,97,98,102,103,105,106,107,108,109,110,111,112,113,114,116,118,119,120,121,122,124,126,127,128,130,131,],[15,15,-2,-14,-15,-6,-37,30,15,15,15,15,-33,-34,-35,-36,-3,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,30,-37,15,30,30,30,-4,-8,-5,-7,30,30,-37,30,-39,30,-57,-16,-17,-18,-19,-20,30,30,30,30,30,30,30,30,30,30,-32,15,30,15,-38,-40,15,-56,15,15,30,-57,15,15,15,30,-37,30,15,30,-45,15,-48,-56,-49,30,15,-52,30,15,15,15,-51,-46,-47,-50,15,-53,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,49,50,51,52,53,54,55,56,57,58,59,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,88,89,90,91,92,93,94,96,97,98,102,105,107,108,109,110,111,112,113,115,116,118,119,120,121,122,124,126,127,128,130,131,],[10,10,-2,-14,-15,-6,26,-13,43,10,46,47,10,10,10,-33,-34,-35,-36,-3,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,26,10,-58,-31,-30,-4,-8,-5,-7,-9,87,-10,26,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,10,10,-38,-40,10,-56,10,10,-57,10,10,10,26,10,-12,-45,10,-48,-56,-49,123,10,-52,-11,10,10,10,-51,-46,-47,-50,10,-53,]),'INT_LITERAL':([0,2,3,4,5,6,7,8,10,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,88,89,90,91,92,93,94,96,97,98,102,107,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[17,17,-2,-14,-15,-6,-37,-13,17,17,17,17,-33,-34,-35,-36,-3,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-37,17,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,17,17,-38,-40,17,-56,17,17,-57,17,17,17,17,-12,-45,17,-48,-56,-49,17,-52,-11,17,17,17,-51,-46,-47,-50,17,-53,]),'FLOAT_LITERAL':([0,2,3,4,5,6,7,8,10,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,88,89,90,91,92,93,94,96,97,98,102,107,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[18,18,-2,-14,-15,-6,-37,-13,18,18,18,18,-33,-34,-35,-36,-3,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-37,18,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,18,18,-38,-40,18,-56,18,18,-57,18,18,18,18,-12,-45,18,-48,-56,-49,18,-52,-11,18,18,18,-51,-46,-47,-50,18,-53,]),'STRING_LITERAL':([0,2,3,4,5,6,7,8,10,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,88,89,90,91,92,93,94,96,97,98,102,107,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[19,19,-2,-14,-15,-6,-37,-13,19,19,19,19,-33,-34,-35,-36,-3,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-37,19,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,19,19,-38,-40,19,-56,19,19,-57,19,19,19,19,-12,-45,19,-48,-56,-49,19,-52,-11,19,19,19,-51,-46,-47,-50,19,-53,]),'BOOL_LITERAL':([0,2,3,4,5,6,7,8,10,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,88,89,90,91,92,93,94,96,97,98,102,107,108,109,110,111,112,113,116,118,119,120,121,122,124,126,127,128,130,131,],[20,20,-2,-14,-15,-6,-37,-13,20,20,20,20,-33,-34,-35,-36,-3,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-37,20,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,20,20,-38,-40,20,-56,20,20,-57,20,20,20,20,-12,-45,20,-48,-56,-49,20,-52,-11,20,20,20,-51,-46,-47,-50,20,-53,]),'$end':([1,2,3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,96,108,109,111,112,113,118,119,124,126,127,128,131,],[0,-1,-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,-14,-15,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,-57,-12,-45,-48,-56,-49,-52,-11,-51,-46,-47,-50,-53,]),'RBRACE':([3,4,5,6,7,8,17,18,19,20,21,22,23,45,49,50,51,52,53,54,55,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,96,108,109,111,112,113,118,119,121,124,126,127,128,131,],[-2,-14,-15,-6,-37,-13,-33,-34,-35,-36,-3,-14,-15,-37,-58,-31,-30,-4,-8,-5,-7,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,-57,-12,-45,-48,-56,-49,-52,-11,127,-51,-46,-47,-50,-53,]),'ELSE':([4,5,7,8,17,18,19,20,45,49,50,51,56,58,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,92,96,108,109,111,112,113,118,119,124,126,127,128,131,],[-14,-15,-37,-13,-33,-34,-35,-36,-37,-58,-31,-30,-9,-10,-39,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-56,-57,-12,120,-48,-56,-49,-52,-11,-51,-46,-47,-50,-53,]),'ASSIGN_ARROW':([7,65,86,92,],[24,93,99,107,]),'ASSIGN_EQ':([7,59,105,],[25,88,88,]),'LBRACK':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,27,-33,-34,-35,-36,82,-37,82,-31,-30,82,82,-37,82,-39,82,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,82,82,-32,82,-38,-40,-56,82,-57,82,-37,82,82,-56,82,82,]),'DOLLAR':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,28,-33,-34,-35,-36,83,-37,83,83,83,83,83,-37,83,-39,83,-57,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-32,83,-38,-40,-56,83,-57,83,-37,83,83,-56,83,83,]),'PLUS':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,29,-33,-34,-35,-36,29,-37,29,29,29,29,29,-37,29,-39,29,-57,-16,-17,-18,-19,-20,29,29,29,29,29,29,29,29,29,29,-32,29,-38,-40,-56,29,-57,29,-37,29,29,-56,29,29,]),'MUL':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,31,-33,-34,-35,-36,31,-37,31,31,31,31,31,-37,31,-39,31,-57,31,31,-18,-19,-20,31,31,31,31,31,31,31,31,31,31,-32,31,-38,-40,-56,31,-57,31,-37,31,31,-56,31,31,]),'DIV':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,32,-33,-34,-35,-36,32,-37,32,32,32,32,32,-37,32,-39,32,-57,32,32,-18,-19,-20,32,32,32,32,32,32,32,32,32,32,-32,32,-38,-40,-56,32,-57,32,-37,32,32,-56,32,32,]),'POW':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,33,-33,-34,-35,-36,33,-37,33,33,33,33,33,-37,33,-39,33,-57,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-32,33,-38,-40,-56,33,-57,33,-37,33,33,-56,33,33,]),'EQ':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,34,-33,-34,-35,-36,34,-37,34,34,34,34,34,-37,34,-39,34,-57,-16,-17,-18,-19,-20,None,None,None,None,None,None,34,34,34,34,-32,34,-38,-40,-56,34,-57,34,-37,34,34,-56,34,34,]),'NE':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,35,-33,-34,-35,-36,35,-37,35,35,35,35,35,-37,35,-39,35,-57,-16,-17,-18,-19,-20,None,None,None,None,None,None,35,35,35,35,-32,35,-38,-40,-56,35,-57,35,-37,35,35,-56,35,35,]),'LT':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,36,-33,-34,-35,-36,36,-37,36,36,36,36,36,-37,36,-39,36,-57,-16,-17,-18,-19,-20,None,None,None,None,None,None,36,36,36,36,-32,36,-38,-40,-56,36,-57,36,-37,36,36,-56,36,36,]),'LE':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,37,-33,-34,-35,-36,37,-37,37,37,37,37,37,-37,37,-39,37,-57,-16,-17,-18,-19,-20,None,None,None,None,None,None,37,37,37,37,-32,37,-38,-40,-56,37,-57,37,-37,37,37,-56,37,37,]),'GT':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,38,-33,-34,-35,-36,38,-37,38,38,38,38,38,-37,38,-39,38,-57,-16,-17,-18,-19,-20,None,None,None,None,None,None,38,38,38,38,-32,38,-38,-40,-56,38,-57,38,-37,38,38,-56,38,38,]),'GE':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,39,-33,-34,-35,-36,39,-37,39,39,39,39,39,-37,39,-39,39,-57,-16,-17,-18,-19,-20,None,None,None,None,None,None,39,39,39,39,-32,39,-38,-40,-56,39,-57,39,-37,39,39,-56,39,39,]),'AND':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,40,-33,-34,-35,-36,40,-37,40,-31,-30,40,40,-37,40,-39,40,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,40,40,40,-32,40,-38,-40,-56,40,-57,40,-37,40,40,-56,40,40,]),'OR':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,41,-33,-34,-35,-36,41,-37,41,-31,-30,41,41,-37,41,-39,41,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,41,41,-32,41,-38,-40,-56,41,-57,41,-37,41,41,-56,41,41,]),'COLON':([7,8,17,18,19,20,44,45,49,50,51,56,58,59,60,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,89,90,92,95,96,103,105,106,108,112,114,119,],[-37,42,-33,-34,-35,-36,42,-37,42,-31,-30,42,42,-37,42,-39,42,-57,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,42,42,-32,42,-38,-40,-56,42,-57,42,-37,42,42,-56,42,42,]),'RPAREN':([17,18,19,20,26,44,45,50,51,59,60,61,62,63,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,87,89,90,96,100,101,103,104,105,106,112,114,125,129,],[-33,-34,-35,-36,61,81,-37,-31,-30,-37,89,-39,90,-42,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,94,-32,97,102,-38,-40,-57,-55,116,-43,-41,-37,-44,-56,122,-54,130,]),'COMMA':([17,18,19,20,45,50,51,59,60,61,62,63,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,96,100,101,103,104,105,106,112,125,129,],[-33,-34,-35,-36,-37,-31,-30,-37,-44,-39,91,-42,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,-57,-55,117,-43,-41,-37,-44,-56,-54,117,]),'RBRACK':([17,18,19,20,45,50,51,61,64,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,89,90,95,96,112,],[-33,-34,-35,-36,-37,-31,-30,-39,92,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-32,-38,-40,112,-57,-56,]),'FUNCTION':([24,99,],[57,115,]),'IN':([85,],[98,]),'LBRACE':([94,97,102,116,120,122,130,],[110,110,110,110,110,110,110,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statements':([0,107,],[2,118,]),'statement':([0,2,21,22,91,94,99,107,113,117,118,119,127,],[3,20,51,52,108,108,108,3,108,108,20,108,108,]),'expression':([0,2,9,13,14,15,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,79,85,88,90,91,94,95,99,104,107,113,117,118,119,127,],[7,7,43,48,49,50,7,7,53,55,57,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,81,92,100,103,105,7,7,111,7,116,7,7,7,7,7,7,]),'arg_list':([25,],[59,]),'arg':([25,88,],[60,101,]),'param_list':([84,120,],[98,126,]),'block':([91,94,99,113,117,119,127,],[106,110,115,121,123,125,128,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statements':([0,110,],[2,121,]),'statement':([0,2,22,23,94,97,102,110,116,120,121,122,130,],[3,21,52,54,111,111,111,3,111,111,21,111,111,]),'expression':([0,2,10,14,15,16,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,82,88,91,93,94,97,98,102,107,110,116,120,121,122,130,],[8,8,44,49,50,51,8,8,56,58,60,64,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,95,103,106,108,8,8,114,8,119,8,8,8,8,8,8,]),'arg_list':([26,],[62,]),'arg':([26,91,],[63,104,]),'param_list':([87,123,],[101,129,]),'block':([94,97,102,116,120,122,130,],[109,113,118,124,126,128,131,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,59 +27,62 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statements','program',1,'p_program','parser.py',22),
-  ('statements -> statement','statements',1,'p_statements_single','parser.py',30),
-  ('statements -> statements statement','statements',2,'p_statements_multiple','parser.py',38),
-  ('statements -> statements SEMICOLON statement','statements',3,'p_statements_multiple','parser.py',39),
-  ('statements -> statements NEWLINE statement','statements',3,'p_statements_multiple','parser.py',40),
-  ('statement -> ID ASSIGN_ARROW expression','statement',3,'p_statement_assignment','parser.py',55),
-  ('statement -> ID ASSIGN_EQ expression','statement',3,'p_statement_assignment','parser.py',56),
-  ('statement -> expression LBRACK expression RBRACK ASSIGN_ARROW expression','statement',6,'p_statement_assignment_index','parser.py',63),
-  ('statement -> expression DOLLAR ID ASSIGN_ARROW expression','statement',5,'p_statement_assignment_dollar','parser.py',70),
-  ('statement -> expression','statement',1,'p_statement_expr','parser.py',83),
-  ('statement -> SEMICOLON','statement',1,'p_statement_semicolon_only','parser.py',89),
-  ('statement -> NEWLINE','statement',1,'p_statement_newline_only','parser.py',94),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','parser.py',102),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','parser.py',103),
-  ('expression -> expression MUL expression','expression',3,'p_expression_binop','parser.py',104),
-  ('expression -> expression DIV expression','expression',3,'p_expression_binop','parser.py',105),
-  ('expression -> expression POW expression','expression',3,'p_expression_binop','parser.py',106),
-  ('expression -> expression EQ expression','expression',3,'p_expression_binop','parser.py',107),
-  ('expression -> expression NE expression','expression',3,'p_expression_binop','parser.py',108),
-  ('expression -> expression LT expression','expression',3,'p_expression_binop','parser.py',109),
-  ('expression -> expression LE expression','expression',3,'p_expression_binop','parser.py',110),
-  ('expression -> expression GT expression','expression',3,'p_expression_binop','parser.py',111),
-  ('expression -> expression GE expression','expression',3,'p_expression_binop','parser.py',112),
-  ('expression -> expression AND expression','expression',3,'p_expression_binop','parser.py',113),
-  ('expression -> expression OR expression','expression',3,'p_expression_binop','parser.py',114),
-  ('expression -> expression COLON expression','expression',3,'p_expression_binop','parser.py',115),
-  ('expression -> NOT expression','expression',2,'p_expression_unary','parser.py',123),
-  ('expression -> MINUS expression','expression',2,'p_expression_unary','parser.py',124),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',132),
-  ('expression -> INT_LITERAL','expression',1,'p_expression_number','parser.py',140),
-  ('expression -> FLOAT_LITERAL','expression',1,'p_expression_number','parser.py',141),
-  ('expression -> STRING_LITERAL','expression',1,'p_expression_string','parser.py',149),
-  ('expression -> BOOL_LITERAL','expression',1,'p_expression_bool','parser.py',154),
-  ('expression -> ID','expression',1,'p_expression_var','parser.py',162),
-  ('expression -> ID LPAREN expression RPAREN','expression',4,'p_expression_is_check','parser.py',171),
-  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_call_noargs','parser.py',185),
-  ('expression -> ID LPAREN arg_list RPAREN','expression',4,'p_expression_call','parser.py',191),
-  ('arg_list -> arg_list COMMA arg','arg_list',3,'p_arg_list_multiple','parser.py',197),
-  ('arg_list -> arg','arg_list',1,'p_arg_list_single','parser.py',202),
-  ('arg -> ID ASSIGN_EQ expression','arg',3,'p_arg_named','parser.py',207),
-  ('arg -> expression','arg',1,'p_arg_positional','parser.py',213),
-  ('statement -> IF LPAREN expression RPAREN block','statement',5,'p_statement_if','parser.py',221),
-  ('statement -> IF LPAREN expression RPAREN block ELSE block','statement',7,'p_statement_if','parser.py',222),
-  ('block -> LBRACE statements RBRACE','block',3,'p_block_braces','parser.py',233),
-  ('block -> statement','block',1,'p_block_statement','parser.py',238),
-  ('statement -> WHILE LPAREN expression RPAREN block','statement',5,'p_statement_while','parser.py',246),
-  ('statement -> FOR LPAREN ID IN expression RPAREN block','statement',7,'p_statement_for','parser.py',254),
-  ('statement -> ID ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN block','statement',7,'p_statement_function_decl','parser.py',270),
-  ('statement -> ID ASSIGN_ARROW FUNCTION LPAREN RPAREN block','statement',6,'p_statement_function_decl_no_params','parser.py',277),
-  ('statement -> BACKTICK ID BACKTICK ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN block','statement',9,'p_statement_s3_function','parser.py',284),
-  ('param_list -> param_list COMMA ID','param_list',3,'p_param_list_multiple','parser.py',291),
-  ('param_list -> ID','param_list',1,'p_param_list_single','parser.py',296),
-  ('expression -> expression LBRACK expression RBRACK','expression',4,'p_expression_index','parser.py',304),
-  ('expression -> expression DOLLAR ID','expression',3,'p_expression_dollar','parser.py',312),
-  ('statement -> RETURN expression','statement',2,'p_statement_return','parser.py',321),
+  ('program -> statements','program',1,'p_program','parser.py',59),
+  ('statements -> statement','statements',1,'p_statements_single','parser.py',70),
+  ('statements -> statements statement','statements',2,'p_statements_multiple','parser.py',78),
+  ('statements -> statements SEMICOLON statement','statements',3,'p_statements_multiple','parser.py',79),
+  ('statements -> statements NEWLINE statement','statements',3,'p_statements_multiple','parser.py',80),
+  ('statements -> error','statements',1,'p_statements_error','parser.py',96),
+  ('statements -> statements NEWLINE error','statements',3,'p_statements_error','parser.py',97),
+  ('statements -> statements SEMICOLON error','statements',3,'p_statements_error','parser.py',98),
+  ('statement -> ID ASSIGN_ARROW expression','statement',3,'p_statement_assignment','parser.py',107),
+  ('statement -> ID ASSIGN_EQ expression','statement',3,'p_statement_assignment','parser.py',108),
+  ('statement -> expression LBRACK expression RBRACK ASSIGN_ARROW expression','statement',6,'p_statement_assignment_index','parser.py',115),
+  ('statement -> expression DOLLAR ID ASSIGN_ARROW expression','statement',5,'p_statement_assignment_dollar','parser.py',122),
+  ('statement -> expression','statement',1,'p_statement_expr','parser.py',135),
+  ('statement -> SEMICOLON','statement',1,'p_statement_semicolon_only','parser.py',141),
+  ('statement -> NEWLINE','statement',1,'p_statement_newline_only','parser.py',146),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','parser.py',154),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','parser.py',155),
+  ('expression -> expression MUL expression','expression',3,'p_expression_binop','parser.py',156),
+  ('expression -> expression DIV expression','expression',3,'p_expression_binop','parser.py',157),
+  ('expression -> expression POW expression','expression',3,'p_expression_binop','parser.py',158),
+  ('expression -> expression EQ expression','expression',3,'p_expression_binop','parser.py',159),
+  ('expression -> expression NE expression','expression',3,'p_expression_binop','parser.py',160),
+  ('expression -> expression LT expression','expression',3,'p_expression_binop','parser.py',161),
+  ('expression -> expression LE expression','expression',3,'p_expression_binop','parser.py',162),
+  ('expression -> expression GT expression','expression',3,'p_expression_binop','parser.py',163),
+  ('expression -> expression GE expression','expression',3,'p_expression_binop','parser.py',164),
+  ('expression -> expression AND expression','expression',3,'p_expression_binop','parser.py',165),
+  ('expression -> expression OR expression','expression',3,'p_expression_binop','parser.py',166),
+  ('expression -> expression COLON expression','expression',3,'p_expression_binop','parser.py',167),
+  ('expression -> NOT expression','expression',2,'p_expression_unary','parser.py',175),
+  ('expression -> MINUS expression','expression',2,'p_expression_unary','parser.py',176),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',184),
+  ('expression -> INT_LITERAL','expression',1,'p_expression_number','parser.py',192),
+  ('expression -> FLOAT_LITERAL','expression',1,'p_expression_number','parser.py',193),
+  ('expression -> STRING_LITERAL','expression',1,'p_expression_string','parser.py',201),
+  ('expression -> BOOL_LITERAL','expression',1,'p_expression_bool','parser.py',206),
+  ('expression -> ID','expression',1,'p_expression_var','parser.py',214),
+  ('expression -> ID LPAREN expression RPAREN','expression',4,'p_expression_is_check','parser.py',223),
+  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_call_noargs','parser.py',237),
+  ('expression -> ID LPAREN arg_list RPAREN','expression',4,'p_expression_call','parser.py',243),
+  ('arg_list -> arg_list COMMA arg','arg_list',3,'p_arg_list_multiple','parser.py',249),
+  ('arg_list -> arg','arg_list',1,'p_arg_list_single','parser.py',255),
+  ('arg -> ID ASSIGN_EQ expression','arg',3,'p_arg_named','parser.py',260),
+  ('arg -> expression','arg',1,'p_arg_positional','parser.py',266),
+  ('statement -> IF LPAREN expression RPAREN block','statement',5,'p_statement_if','parser.py',274),
+  ('statement -> IF LPAREN expression RPAREN block ELSE block','statement',7,'p_statement_if','parser.py',275),
+  ('block -> LBRACE statements RBRACE','block',3,'p_block_braces','parser.py',286),
+  ('block -> statement','block',1,'p_block_statement','parser.py',291),
+  ('statement -> WHILE LPAREN expression RPAREN block','statement',5,'p_statement_while','parser.py',299),
+  ('statement -> FOR LPAREN ID IN expression RPAREN block','statement',7,'p_statement_for','parser.py',307),
+  ('statement -> ID ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN block','statement',7,'p_statement_function_decl','parser.py',323),
+  ('statement -> ID ASSIGN_ARROW FUNCTION LPAREN RPAREN block','statement',6,'p_statement_function_decl_no_params','parser.py',330),
+  ('statement -> BACKTICK ID BACKTICK ASSIGN_ARROW FUNCTION LPAREN param_list RPAREN block','statement',9,'p_statement_s3_function','parser.py',337),
+  ('param_list -> param_list COMMA ID','param_list',3,'p_param_list_multiple','parser.py',344),
+  ('param_list -> ID','param_list',1,'p_param_list_single','parser.py',350),
+  ('expression -> expression LBRACK expression RBRACK','expression',4,'p_expression_index','parser.py',358),
+  ('expression -> expression DOLLAR ID','expression',3,'p_expression_dollar','parser.py',366),
+  ('statement -> RETURN expression','statement',2,'p_statement_return','parser.py',375),
 ]
@@ -0,0 +1,163 @@
+﻿from .ast_nodes import *
+
+# filhos de cada tipo de expressão (para coletar as variáveis lidas)
+_EXPR_CHILDREN = {
+    BinaryOp: lambda n: (n.left, n.right),
+    UnaryOp: lambda n: (n.expr,),
+    IndexOp: lambda n: (n.target, n.index),
+    DollarAccess: lambda n: (n.target,),
+    IsDouble: lambda n: (n.expr,),
+    IsInteger: lambda n: (n.expr,),
+    Call: lambda n: n.args,
+    NamedArg: lambda n: (n.value,),
+}
+
+# expressões que pertencem ao próprio comando (não aos blocos dele)
+_STMT_EXPRS = {
+    Assign: lambda s: (s.expr,),
+    ExprStmt: lambda s: (s.expr,),
+    Return: lambda s: (s.expr,),
+    AssignIndex: lambda s: (s.target, s.index, s.expr),
+    If: lambda s: (s.cond,),
+    While: lambda s: (s.cond,),
+    For: lambda s: (s.start_expr, s.end_expr),
+}
+
+
+def _inner_blocks(stmt):
+    """Blocos que compartilham o escopo do comando (corpo de if/while/for)."""
+    if isinstance(stmt, If):
+        if stmt.else_block is not None:
+            return (stmt.then_block, stmt.else_block)
+        return (stmt.then_block,)
+    if isinstance(stmt, (While, For)):
+        return (stmt.body,)
+    return ()
+
+
+def _function_body(stmt):
+    """Corpo de função: escopo próprio, analisado mas não somado ao de fora."""
+    if isinstance(stmt, (FunctionDecl, S3FunctionDecl)):
+        return stmt.body
+    return None
+
+
+def _collect_reads(exprs, reads):
+    stack = [e for e in exprs if e is not None]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, Var):
+            reads.add(e.name)
+            continue
+        children = _EXPR_CHILDREN.get(e.__class__)
+        if children is not None:
+            stack.extend(c for c in children(e) if c is not None)
+
+
+def analyze_scopes(root):
+    """
+    Calcula, numa única passada, as variáveis atribuídas (Assign) e lidas (Var)
+    de cada Block sob root (Program ou Block) e guarda em block.assigned /
+    block.reads. Os conjuntos de um bloco incluem os dos if/while/for
+    aninhados, mas não os de corpos de função. Blocos já analisados são
+    reaproveitados, então chamar de novo numa subárvore não custa nada.
+    """
+    if isinstance(root, Program):
+        root = Block(root.stmts)
+    stack = [(root, False)]
+    while stack:
+        block, children_done = stack.pop()
+        if children_done:
+            assigned = set()
+            reads = set()
+            for stmt in block.stmts:
+                if stmt is None:
+                    continue
+                if isinstance(stmt, Assign):
+                    assigned.add(stmt.name)
+                exprs = _STMT_EXPRS.get(stmt.__class__)
+                if exprs is not None:
+                    _collect_reads(exprs(stmt), reads)
+                for inner in _inner_blocks(stmt):
+                    assigned |= inner.assigned
+                    reads |= inner.reads
+            block.assigned = assigned
+            block.reads = reads
+            continue
+
+        if block.assigned is not None:
+            continue
+        stack.append((block, True))
+        for stmt in block.stmts:
+            if stmt is None:
+                continue
+            for inner in _inner_blocks(stmt):
+                stack.append((inner, False))
+            body = _function_body(stmt)
+            if body is not None:
+                stack.append((body, False))
+    return root
+
+
+def assigned_vars(block):
+    """Variáveis atribuídas no bloco (e nos if/while/for dentro dele)."""
+    if block.assigned is None:
+        analyze_scopes(block)
+    return block.assigned
+
+
+def function_free_vars(stmts):
+    """
+    Variáveis lidas por alguma função declarada em stmts (em qualquer nível)
+    que não são parâmetros nem locais dela, isto é, que vêm de fora.
+    """
+    free = set()
+    stack = [s for s in stmts if s is not None]
+    while stack:
+        stmt = stack.pop()
+        body = _function_body(stmt)
+        if body is not None:
+            analyze_scopes(body)
+            params = set(stmt.params)
+            free |= body.reads - body.assigned - params
+            stack.extend(s for s in body.stmts if s is not None)
+            continue
+        for inner in _inner_blocks(stmt):
+            stack.extend(s for s in inner.stmts if s is not None)
+    return free
+
+
+def function_exists_names(stmts):
+    """
+    Nomes consultados com exists("x") (string literal) dentro de alguma função
+    declarada em stmts: como as variáveis lidas, precisam ser visíveis de fora.
+    """
+    names = set()
+    stack = [s for s in stmts if s is not None]
+    in_function = [False] * len(stack)
+    while stack:
+        stmt, inside = stack.pop(), in_function.pop()
+        body = _function_body(stmt)
+        if body is not None:
+            inner, inside = body.stmts, True
+        else:
+            inner = [s for b in _inner_blocks(stmt) for s in b.stmts]
+            exprs = _STMT_EXPRS.get(stmt.__class__)
+            if inside and exprs is not None:
+                _collect_exists(exprs(stmt), names)
+        inner = [s for s in inner if s is not None]
+        stack.extend(inner)
+        in_function.extend([inside] * len(inner))
+    return names
+
+
+def _collect_exists(exprs, names):
+    stack = [e for e in exprs if e is not None]
+    while stack:
+        e = stack.pop()
+        if (e.__class__ is Call and e.name == "exists" and e.args
+                and e.args[0].__class__ is StringLiteral):
+            names.add(e.args[0].value)
+        children = _EXPR_CHILDREN.get(e.__class__)
+        if children is not None:
+            stack.extend(c for c in children(e) if c is not None)
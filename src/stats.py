@@ -0,0 +1,56 @@
+﻿from .ast_nodes import Node
+
+
+class TranspileStats:
+    """
+    Medidas de uma transpilação, fase a fase (ver Transpiler.transpile_with_stats).
+
+    lex: tempo e nº de tokens; parse: tempo e nº de nós da AST; codegen
+    (inclui a inferência de tipos): tempo e tamanho da saída em bytes.
+    Tempos em segundos (relógio de parede).
+    """
+    __slots__ = ('source_bytes', 'lex_seconds', 'tokens', 'parse_seconds',
+                 'nodes', 'codegen_seconds', 'output_bytes')
+
+    def __init__(self):
+        self.source_bytes = 0
+        self.lex_seconds = 0.0
+        self.tokens = 0
+        self.parse_seconds = 0.0
+        self.nodes = 0
+        self.codegen_seconds = 0.0
+        self.output_bytes = 0
+
+    @property
+    def total_seconds(self):
+        return self.lex_seconds + self.parse_seconds + self.codegen_seconds
+
+    def to_dict(self):
+        """Forma serializável em JSON (usada por --profile)."""
+        return {
+            "source_bytes": self.source_bytes,
+            "total_seconds": self.total_seconds,
+            "phases": {
+                "lex": {"seconds": self.lex_seconds, "tokens": self.tokens},
+                "parse": {"seconds": self.parse_seconds, "nodes": self.nodes},
+                "codegen": {"seconds": self.codegen_seconds, "output_bytes": self.output_bytes},
+            },
+        }
+
+
+def count_nodes(root):
+    """Nº de nós da AST sob root (inclusive), sem recursão."""
+    count = 0
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Node):
+            count += 1
+            for cls in type(item).__mro__:
+                for slot in getattr(cls, '__slots__', ()):
+                    value = getattr(item, slot, None)
+                    if isinstance(value, (Node, list, tuple)):
+                        stack.append(value)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return count
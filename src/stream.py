@@ -0,0 +1,84 @@
+﻿import re
+
+# caracteres que mudam o estado da varredura (ver tokens em lexer.py):
+# agrupadores, delimitadores de string / nome com crase, comentário e escape
+_SIGNIFICANT = re.compile(r'[()\[\]{}"\'`#\\]')
+# a mesma varredura sobre bytes (ex.: um arquivo mapeado com mmap); em UTF-8
+# esses caracteres nunca aparecem dentro de um caractere multibyte
+_SIGNIFICANT_BYTES = re.compile(_SIGNIFICANT.pattern.encode())
+_OPEN, _CLOSE, _QUOTE, _COMMENT, _ESCAPE = range(5)
+_KINDS = {'(': _OPEN, '[': _OPEN, '{': _OPEN, ')': _CLOSE, ']': _CLOSE, '}': _CLOSE,
+          '"': _QUOTE, "'": _QUOTE, '`': _QUOTE, '#': _COMMENT, '\\': _ESCAPE}
+_KINDS_BYTES = {c.encode(): kind for c, kind in _KINDS.items()}
+
+
+def statement_ends(lines):
+    """
+    Gera (linha, fronteira) para cada linha de um código R (str ou bytes):
+    fronteira é True quando a linha termina fora de strings, nomes com crase
+    e (), [] ou {}, isto é, num ponto seguro entre comandos de nível superior.
+    Comentários (#) são ignorados.
+    """
+    depth = 0
+    quote = None
+    significant = kinds = None
+
+    for line in lines:
+        if kinds is None:
+            binary = isinstance(line, bytes)
+            significant = _SIGNIFICANT_BYTES if binary else _SIGNIFICANT
+            kinds = _KINDS_BYTES if binary else _KINDS
+            backtick = b'`' if binary else '`'
+        pos = 0
+        while True:
+            m = significant.search(line, pos)
+            if m is None:
+                break
+            c = m.group()
+            pos = m.end()
+            kind = kinds[c]
+            if quote is not None:
+                if kind == _ESCAPE and quote != backtick:
+                    pos += 1  # pula o caractere escapado
+                elif c == quote:
+                    quote = None
+            elif kind == _COMMENT:
+                break
+            elif kind == _OPEN:
+                depth += 1
+            elif kind == _CLOSE:
+                depth -= 1
+            elif kind == _QUOTE:
+                quote = c
+
+        if quote is None and depth <= 0:
+            depth = 0
+            yield line, True
+        else:
+            yield line, False
+
+
+def split_statements(lines, start_line=1):
+    """
+    Agrupa as linhas de um código R em trechos que terminam numa fronteira
+    segura entre comandos de nível superior (veja statement_ends).
+
+    Gera tuplas (linha_inicial, texto). Cada trecho contém um ou mais comandos
+    completos, exceto quando um cabeçalho (if/while/for/function) fica sozinho
+    na linha; quem consome os trechos deve juntar um trecho incompleto ao
+    seguinte.
+    """
+    pending = []
+    lineno = start_line
+    chunk_start = start_line
+
+    for line, boundary in statement_ends(lines):
+        pending.append(line)
+        lineno += line.count('\n')
+        if boundary:
+            yield chunk_start, "".join(pending)
+            pending = []
+            chunk_start = lineno
+
+    if pending:
+        yield chunk_start, "".join(pending)
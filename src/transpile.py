@@ -1,16 +1,315 @@
 ﻿import sys
 import os
-from .lexer import lexer
-from .parser import parser
-from .codegen import JuliaCodeGen
+import copy
+import threading
+import time
+from .fastlex import FastLexer
+from .parser import get_parser, p_error, Recovery, IncompleteInputError
+from .ast_nodes import Program
+from .codegen import JuliaCodeGen, empty_vector, join_parts, recreated
+from .stream import split_statements
+from .stats import TranspileStats, count_nodes
+from .diagnostics import Diagnostics, UNEXPECTED_EOF, column
 
-def transpile(source_code):
-    lexer.input(source_code)
-    ast = parser.parse(source_code, lexer=lexer)
-    gen = JuliaCodeGen()
-    return gen.generate(ast)
 
-def main():
+class Transpiler:
+    """
+    Transpilador R → Julia com estado próprio de lexer e parser.
+
+    O lexer e o parser de módulo guardam o estado da análise (posição,
+    lineno, pilhas do LR) nos próprios objetos, então não podem ser usados
+    por duas threads ao mesmo tempo. Cada Transpiler trabalha sobre um
+    clone do lexer e uma cópia rasa do parser (as tabelas LALR, somente
+    leitura, continuam compartilhadas). Use uma instância por thread.
+
+    O lexer padrão é o FastLexer (fastlex.py), que gera os mesmos tokens que
+    o do PLY; passe lexer=get_lexer() para usar o do PLY.
+    """
+
+    def __init__(self, lexer=None):
+        self.lexer = (lexer or FastLexer()).clone()
+        self.parser = copy.copy(get_parser())
+
+    def parse(self, source_code, lineno=1, diagnostics=None):
+        """
+        Sem diagnostics, o primeiro erro de sintaxe levanta SyntaxError. Com um
+        Diagnostics, os erros são registrados nele, a análise continua no
+        comando seguinte e a AST traz só os comandos válidos.
+        """
+        if diagnostics is None:
+            self.lexer.lineno = lineno
+            return self.parser.parse(source_code, lexer=self.lexer)
+        mark = len(diagnostics)
+        try:
+            return self._parse_recovering(source_code, lineno, diagnostics)
+        except IncompleteInputError:
+            # o PLY não se recupera de um fim de entrada no meio de um comando;
+            # refaz comando a comando (como no streaming) e guarda os completos
+            diagnostics.truncate(mark)
+            lines = source_code.splitlines(keepends=True)
+            return Program(list(self.iter_statements(lines, diagnostics, lineno)))
+
+    def _parse_recovering(self, source_code, lineno, diagnostics, tokenfunc=None):
+        self.lexer.lineno = lineno
+        self.lexer.diagnostics = diagnostics
+        if source_code is not None:
+            self.lexer.input(source_code)
+        recovery = Recovery(tokenfunc or self.lexer.token, diagnostics, self.parser)
+        self.parser.errorfunc = recovery.error
+        try:
+            program = self.parser.parse(lexer=self.lexer, tokenfunc=recovery.token)
+        finally:
+            self.lexer.diagnostics = None
+            self.parser.errorfunc = p_error
+        if program is None:
+            # erro de novo logo antes do fim: o PLY desiste e devolve None
+            raise IncompleteInputError("Syntax error at EOF")
+        return program
+
+    def transpile(self, source_code, diagnostics=None, **codegen_options):
+        """
+        codegen_options são repassadas ao JuliaCodeGen (ex.: wrap_main=True).
+        Com diagnostics, veja parse(): o Julia dos comandos válidos é gerado
+        mesmo que haja erros.
+        """
+        ast = self.parse(source_code, diagnostics=diagnostics)
+        gen = JuliaCodeGen(**codegen_options)
+        return gen.generate(ast)
+
+    def transpile_with_stats(self, source_code, codegen_profile=None, diagnostics=None,
+                             **codegen_options):
+        """
+        Como transpile(), mas devolve (código, TranspileStats) com o tempo de
+        cada fase. Os tokens são lidos todos antes do parse (tokenfunc), para
+        que o tempo do lexer não se misture ao do parser. Com codegen_profile
+        (caminho de arquivo), a geração de código roda sob cProfile e as
+        estatísticas são gravadas lá (veja com python -m pstats).
+        """
+        stats = TranspileStats()
+        stats.source_bytes = len(source_code.encode('utf-8'))
+
+        mark = len(diagnostics) if diagnostics is not None else 0
+        t0 = time.perf_counter()
+        self.lexer.lineno = 1
+        self.lexer.diagnostics = diagnostics
+        self.lexer.input(source_code)
+        try:
+            tokens = list(iter(self.lexer.token, None))
+        finally:
+            self.lexer.diagnostics = None
+        t1 = time.perf_counter()
+        replay = iter(tokens)
+        tokenfunc = lambda: next(replay, None)
+        if diagnostics is None:
+            ast = self.parser.parse(lexer=self.lexer, tokenfunc=tokenfunc)
+        else:
+            try:
+                ast = self._parse_recovering(None, 1, diagnostics, tokenfunc)
+            except IncompleteInputError:
+                diagnostics.truncate(mark)  # inclui os do lexer: o texto é relido
+                ast = self.parse(source_code, diagnostics=diagnostics)
+        t2 = time.perf_counter()
+
+        gen = JuliaCodeGen(**codegen_options)
+        if codegen_profile is not None:
+            import cProfile
+            prof = cProfile.Profile()
+            t3 = time.perf_counter()
+            prof.enable()
+            code = gen.generate(ast)
+            prof.disable()
+            t4 = time.perf_counter()
+            prof.dump_stats(codegen_profile)
+        else:
+            t3 = time.perf_counter()
+            code = gen.generate(ast)
+            t4 = time.perf_counter()
+
+        stats.lex_seconds = t1 - t0
+        stats.tokens = len(tokens)
+        stats.parse_seconds = t2 - t1
+        stats.nodes = count_nodes(ast)
+        stats.codegen_seconds = t4 - t3
+        stats.output_bytes = len(code.encode('utf-8'))
+        return code, stats
+
+    def iter_statements(self, lines, diagnostics=None, start_line=1):
+        """
+        Gera os comandos de nível superior um a um, lendo `lines` (ex.: um
+        arquivo aberto) sob demanda. Só o comando corrente fica em memória.
+        Com diagnostics, os erros são registrados em vez de levantados.
+        """
+        for _lineno, _text, stmts in self.iter_chunks(lines, diagnostics, start_line):
+            yield from stmts
+
+    def iter_chunks(self, lines, diagnostics=None, start_line=1):
+        """
+        Como iter_statements, mas gera (linha_inicial, texto, comandos) para
+        cada trecho analisado de uma vez (veja stream.split_statements). Os
+        textos, em ordem, cobrem toda a entrada (um trecho final só com
+        comentários vem com a lista de comandos vazia).
+        """
+        if diagnostics is None:
+            parse = self.parse
+        else:
+            parse = lambda text, lineno: self._parse_recovering(text, lineno, diagnostics)
+        pending = []
+        start = start_line
+        parsed_any = False
+        for lineno, text in split_statements(lines, start_line):
+            if not pending:
+                start = lineno
+            pending.append(text)
+            mark = len(diagnostics) if diagnostics is not None else 0
+            try:
+                program = parse("".join(pending), start)
+            except IncompleteInputError:
+                if diagnostics is not None:
+                    diagnostics.truncate(mark)  # o trecho será relido
+                continue  # cabeçalho sem corpo: junta com o próximo trecho
+            parsed_any = True
+            yield start, "".join(pending), program.stmts
+            pending = []
+
+        if pending:
+            text = "".join(pending)
+            try:
+                program = parse(text, start)
+            except IncompleteInputError:
+                # só comentários/espaços depois do último comando
+                self.lexer.lineno = start
+                self.lexer.input(text)
+                if diagnostics is not None:
+                    self.lexer.diagnostics = Diagnostics()  # já registrados acima
+                try:
+                    first = self.lexer.token()
+                finally:
+                    self.lexer.diagnostics = None
+                if diagnostics is not None:
+                    if first is not None:
+                        diagnostics.add(UNEXPECTED_EOF, "Syntax error at EOF",
+                                        first.lineno, column(text, first.lexpos))
+                    yield start, text, []
+                    return
+                if parsed_any and first is None:
+                    yield start, text, []
+                    return
+                raise
+            yield start, text, program.stmts
+
+    def transpile_stream(self, lines, out, diagnostics=None, **codegen_options):
+        """
+        Versão em streaming de transpile(): lê comandos de `lines` e escreve o
+        Julia de cada um em `out` assim que é gerado. A saída é idêntica à de
+        transpile() sobre o texto inteiro.
+        """
+        if codegen_options.get("wrap_main"):
+            # main() exige ver o programa inteiro (definições são içadas)
+            raise ValueError("o modo streaming não suporta wrap_main")
+        gen = JuliaCodeGen(**codegen_options)
+
+        def parts():
+            # um `v <- c()` só é escrito quando se vê o comando seguinte
+            # (ver JuliaCodeGen.generate_parts)
+            for stmt in self.iter_statements(lines, diagnostics):
+                code = gen.generate_stmt(stmt)
+                name = empty_vector(stmt)
+                if name is not None:
+                    yield "", (name, code), ()
+                else:
+                    yield code, None, recreated(stmt)
+
+        first = True
+        for code in join_parts(parts()):
+            if not first:
+                out.write("\n")
+            out.write(code)
+            first = False
+
+
+_local = threading.local()
+
+
+def get_transpiler():
+    """Retorna o Transpiler da thread atual, criando-o no primeiro uso."""
+    tr = getattr(_local, "transpiler", None)
+    if tr is None:
+        tr = _local.transpiler = Transpiler()
+    return tr
+
+
+def transpile(source_code, diagnostics=None, **codegen_options):
+    return get_transpiler().transpile(source_code, diagnostics, **codegen_options)
+
+
+def transpile_with_stats(source_code, codegen_profile=None, diagnostics=None, **codegen_options):
+    """(código, TranspileStats); veja Transpiler.transpile_with_stats."""
+    return get_transpiler().transpile_with_stats(source_code, codegen_profile, diagnostics,
+                                                 **codegen_options)
+
+def _transpile_single(infile, outfile=None, stream=False, profile=None, codegen_profile=None,
+                      parallel=False, jobs=None, **codegen_options):
+    # definir outfile padrão
+    if outfile is None:
+        os.makedirs("juliaExamples", exist_ok=True)
+        base_name = os.path.splitext(os.path.basename(infile))[0]
+        outfile = f"juliaExamples/{base_name}.jl"
+
+    # erros léxicos/de sintaxe são acumulados e listados no fim; o Julia dos
+    # comandos válidos é gravado mesmo assim
+    diagnostics = Diagnostics(infile)
+
+    if stream:
+        with open(infile, 'r', encoding='utf-8') as fin, \
+                open(outfile, 'w', encoding='utf-8') as fout:
+            get_transpiler().transpile_stream(fin, fout, diagnostics, **codegen_options)
+        _report(diagnostics, outfile)
+        return diagnostics
+
+    if parallel:
+        from .parallel import transpile_file_parallel
+        jc = transpile_file_parallel(infile, diagnostics, jobs, **codegen_options)
+        with open(outfile, 'w', encoding='utf-8') as f:
+            f.write(jc)
+        _report(diagnostics, outfile)
+        return diagnostics
+
+    with open(infile, 'r', encoding='utf-8') as f:
+        src = f.read()
+
+    if profile is None and codegen_profile is None:
+        jc = transpile(src, diagnostics, **codegen_options)
+    else:
+        jc, stats = transpile_with_stats(src, codegen_profile, diagnostics, **codegen_options)
+
+    with open(outfile, 'w', encoding='utf-8') as f:
+        f.write(jc)
+
+    _report(diagnostics, outfile)
+
+    if profile is not None:
+        import json
+        report = {"file": infile}
+        report.update(stats.to_dict())
+        report["diagnostics"] = [d.to_dict() for d in diagnostics.sorted()]
+        with open(profile, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Perfil por fase salvo em: {profile}")
+    if codegen_profile is not None:
+        print(f"Perfil cProfile do codegen salvo em: {codegen_profile}")
+    return diagnostics
+
+
+def _report(diagnostics, outfile):
+    if len(diagnostics) == 0:
+        print(f"\nTranspilação concluída! Código Julia salvo em: {outfile}")
+        return
+    diagnostics.report()
+    print(f"\nTranspilação concluída com {len(diagnostics)} erro(s); os comandos com erro "
+          f"foram omitidos. Código Julia salvo em: {outfile}")
+
+
+def _interactive():
     # pasta onde estão os exemplos R
     r_dir = "RProjectExamples"
 
@@ -40,45 +339,68 @@ def main():
         print("Escolha inválida.")
         sys.exit(1)
 
-    infile = os.path.join(r_dir, r_files[choice - 1])
+    _transpile_single(os.path.join(r_dir, r_files[choice - 1]))
 
-    # criar pasta juliaExamples
-    os.makedirs("juliaExamples", exist_ok=True)
 
-    base_name = os.path.splitext(os.path.basename(infile))[0]
-    outfile = f"juliaExamples/{base_name}.jl"
+def main(argv=None):
+    import argparse
 
-    with open(infile, 'r', encoding='utf-8') as f:
-        src = f.read()
+    ap = argparse.ArgumentParser(
+        prog="transpile",
+        description="Transpila código R para Julia. Sem argumentos, abre o modo interativo.",
+    )
+    ap.add_argument("input", nargs="?", help="arquivo .R ou diretório com arquivos .R")
+    ap.add_argument("output", nargs="?", help="arquivo .jl ou diretório de saída")
+    ap.add_argument("-j", "--jobs", type=int, default=None,
+                    help="processos usados no modo diretório e com --parallel (padrão: nº de CPUs)")
+    ap.add_argument("--main", action="store_true", dest="wrap_main",
+                    help="coloca o script numa função main() (evita globais lentas em Julia)")
+    ap.add_argument("--stream", action="store_true",
+                    help="processa um arquivo comando a comando, com memória limitada")
+    ap.add_argument("--parallel", action="store_true",
+                    help="divide um arquivo grande em trechos convertidos em paralelo")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="ignora o cache e retranspila todos os arquivos")
+    ap.add_argument("--cache-dir", default=None,
+                    help="diretório do cache do modo diretório (padrão: .transpile_cache)")
+    ap.add_argument("--profile", metavar="ARQ.json", default=None,
+                    help="grava em JSON tempo, nº de tokens/nós e tamanho da saída de cada fase")
+    ap.add_argument("--profile-codegen", metavar="ARQ.prof", default=None,
+                    help="roda o codegen sob cProfile e grava as estatísticas (python -m pstats)")
+    args = ap.parse_args(argv)
+    codegen_options = {"wrap_main": True} if args.wrap_main else {}
 
-    jc = transpile(src)
+    if args.input is None:
+        _interactive()
+        return
 
-    with open(outfile, 'w', encoding='utf-8') as f:
-        f.write(jc)
+    profiling = args.profile is not None or args.profile_codegen is not None
 
-    print(f"\nTranspilação concluída! Código Julia salvo em: {outfile}")
+    if os.path.isdir(args.input):
+        if args.output is None:
+            ap.error("o modo diretório exige o diretório de saída")
+        if profiling:
+            ap.error("--profile e --profile-codegen valem só para um arquivo")
+        from .batch import transpile_dir
+        from .cache import BuildCache, DEFAULT_CACHE_DIR
+        cache = None if args.no_cache else BuildCache(args.cache_dir or DEFAULT_CACHE_DIR)
+        results = transpile_dir(args.input, args.output, jobs=args.jobs, cache=cache,
+                                codegen_options=codegen_options)
+        if any(r[1] is not None for r in results):
+            sys.exit(1)
+        return
 
-    if len(sys.argv) < 2:
-        print('Usage: python src/transpile.py path/to/file.R [output.jl]')
+    if args.stream and args.wrap_main:
+        ap.error("--stream e --main não podem ser usados juntos")
+    if args.stream and profiling:
+        ap.error("--profile e --profile-codegen não funcionam com --stream")
+    if args.parallel and (args.stream or args.wrap_main or profiling):
+        ap.error("--parallel não pode ser usado com --stream, --main ou --profile")
+    diagnostics = _transpile_single(args.input, args.output, stream=args.stream,
+                                    profile=args.profile, codegen_profile=args.profile_codegen,
+                                    parallel=args.parallel, jobs=args.jobs, **codegen_options)
+    if len(diagnostics):
         sys.exit(1)
-    
-    infile = sys.argv[1]
-    # criar pasta juliaExamples
-    os.makedirs("juliaExamples", exist_ok=True)
-    
-    # definir outfile padrão
-    base_name = os.path.splitext(os.path.basename(infile))[0]
-    outfile = sys.argv[2] if len(sys.argv) > 2 else f"juliaExamples/{base_name}.jl"
-    
-    with open(infile, 'r', encoding='utf-8') as f:
-        src = f.read()
-    
-    jc = transpile(src)
-    
-    with open(outfile, 'w', encoding='utf-8') as f:
-        f.write(jc)
-    
-    print(f'Transpilação concluída! Código Julia salvo em: {outfile}')
 
 if __name__ == '__main__':
     main()
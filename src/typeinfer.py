@@ -0,0 +1,609 @@
+﻿import re
+
+from .ast_nodes import *
+from .scope import function_free_vars
+
+# Tipos são strings com o nome Julia ("Int", "Float64", "Vector{Int}", ...).
+# None significa desconhecido / não concreto.
+INT = "Int"
+FLOAT = "Float64"
+BOOL = "Bool"
+STRING = "String"
+RANGE = "UnitRange{Int}"
+# vetor (ou matriz/intervalo) com tipo dos elementos desconhecido
+ARRAY = "AbstractArray"
+# c() sem argumentos: vetor vazio, que em Julia ([]) aceita qualquer elemento
+EMPTY = "Vector{Any}"
+# vetor usado com chaves de texto (v["k"] <- x): vira um Dict no codegen
+DICT = "Dict{String,Any}"
+# Dict num caminho e ainda vetor/registro em outro (v["k"] <- x em só um ramo
+# de um if): o próximo v["k"] <- x converte v só se ele ainda não for Dict
+MAYBE_DICT = "Union{Dict{String,Any}, AbstractArray, NamedTuple}"
+
+_FIELD_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+_JULIA_KEYWORDS = {
+    "baremodule", "begin", "break", "catch", "const", "continue", "do", "else",
+    "elseif", "end", "export", "false", "finally", "for", "function", "global",
+    "if", "import", "let", "local", "macro", "module", "quote", "return",
+    "struct", "true", "try", "using", "while",
+}
+
+_NUMERIC_RANK = {BOOL: 0, INT: 1, FLOAT: 2}
+
+# marca "variável ainda sem atribuição" (diferente de None = tipo desconhecido)
+_UNSET = object()
+
+
+def vector_of(elem):
+    return f"Vector{{{elem}}}" if elem is not None else None
+
+
+def elem_type(t):
+    """Tipo dos elementos de um vetor/matriz/intervalo, ou None."""
+    if t is None:
+        return None
+    if t == RANGE:
+        return INT
+    for prefix in ("Vector{", "Matrix{"):
+        if t.startswith(prefix):
+            return t[len(prefix):-1]
+    return None
+
+
+def is_array(t):
+    """True para vetores, matrizes e intervalos (valores com vários elementos)."""
+    return t == ARRAY or elem_type(t) is not None
+
+
+def is_field_name(name):
+    """True se name pode ser campo de NamedTuple em Julia (nome.campo)."""
+    return bool(_FIELD_NAME.match(name)) and name not in _JULIA_KEYWORDS
+
+
+def join(a, b):
+    """Menor tipo que cobre a e b (promoção numérica de Julia) ou None."""
+    if a is _UNSET:
+        return b
+    if b is _UNSET or a == b:
+        return a
+    if a is None or b is None:
+        return None
+    # vetor que começou vazio e cresceu: vale o tipo do que foi acrescentado
+    if a == EMPTY and is_array(b):
+        return b
+    if b == EMPTY and is_array(a):
+        return a
+    if a in _NUMERIC_RANK and b in _NUMERIC_RANK:
+        return a if _NUMERIC_RANK[a] > _NUMERIC_RANK[b] else b
+    if is_array(a) and is_array(b):
+        ea, eb = elem_type(a), elem_type(b)
+        if ea is not None and eb is not None:
+            return vector_of(join(ea, eb))
+        return ARRAY
+    return None
+
+
+_ARITH = ("+", "-", "*", "^")
+_COMPARE = ("==", "!=", "<", "<=", ">", ">=")
+_LOGICAL = ("&", "|", "&&", "||")
+
+
+
+def _float_map(args):
+    # funções matemáticas do R são vetorizadas: vetor entra, vetor sai
+    if args and is_array(args[0]):
+        return vector_of(FLOAT)
+    return FLOAT
+
+
+def _same_array(args):
+    return args[0] if args and is_array(args[0]) else ARRAY
+
+
+def _sum(args):
+    # em Julia, a soma de Bool (ou de inteiros) dá Int, como no R
+    if len(args) != 1:
+        return None
+    elem = elem_type(args[0]) if is_array(args[0]) else args[0]
+    if elem in (BOOL, INT):
+        return INT
+    return FLOAT if elem == FLOAT else None
+
+
+# tipo de retorno de algumas funções do R, a partir dos argumentos
+_CALL_RESULTS = {
+    "length": lambda args: INT,
+    "nchar": lambda args: INT,
+    "sqrt": _float_map,
+    "exp": _float_map,
+    "log": _float_map,
+    "mean": lambda args: FLOAT,
+    "paste": lambda args: STRING,
+    "paste0": lambda args: STRING,
+    "toupper": lambda args: STRING,
+    "tolower": lambda args: STRING,
+    "as.integer": lambda args: INT,
+    "as.numeric": lambda args: FLOAT,
+    "as.double": lambda args: FLOAT,
+    "as.character": lambda args: STRING,
+    "exists": lambda args: BOOL,
+    "sum": _sum,
+    "max": lambda args: elem_type(args[0]) if len(args) == 1 else None,
+    "min": lambda args: elem_type(args[0]) if len(args) == 1 else None,
+    "abs": lambda args: args[0] if len(args) == 1 and (args[0] in _NUMERIC_RANK or is_array(args[0])) else None,
+    "seq": lambda args: ARRAY,
+    "rep": lambda args: ARRAY,
+    "rev": _same_array,
+    "sort": _same_array,
+}
+
+
+class TypeInference:
+    """
+    Inferência local de tipos, para frente, comando a comando.
+
+    Cada expressão visitada recebe seu tipo em node.jl_type. A atribuição
+    substitui o tipo da variável; os ramos de um if são visitados cada um com
+    sua cópia do ambiente e os tipos se juntam (join) no fim, e o corpo dos
+    laços é revisitado até o ambiente da entrada ficar estável. O resultado de
+    um comando só depende dos anteriores, então visitar o programa inteiro ou
+    um comando por vez (streaming) dá o mesmo.
+    """
+
+    MAX_LOOP_PASSES = 4
+
+    def __init__(self):
+        self.env = {}
+        self.functions = {}   # nome -> tipo de retorno
+        self._in_loop = False # dentro de um laço: o ponto fixo é o do laço de fora
+        self._returns = None  # tipos dos return da função corrente
+        # variáveis cujos registros ficam como Dict: globais lidas por funções
+        # já declaradas (lá o tipo é desconhecido) e registros que mudam de
+        # tipo conforme o caminho (ver _merge); os Assign de registros
+        # guardados nelas como Dict; e as conversões em Dict dos registros
+        # que elas já tinham, emitidas antes de cada comando
+        # ({comando: [(nome, tipo)]}, ver _convert_shared)
+        self.shared = set()
+        self.escaped = set()
+        self.converted = {}
+        # list(a=..., b=...) com chaves fixas vira NamedTuple; os campos de
+        # cada tipo de registro criado ficam aqui ({tipo: {campo: tipo do campo}})
+        self.records = {}
+
+    def state(self):
+        """
+        O que passa de um comando de nível superior para o seguinte (tipos das
+        variáveis e funções, globais lidas por funções, campos dos registros),
+        em objetos que podem ser enviados a outro processo. Veja parallel.py.
+        """
+        return self.env, self.functions, self.shared, self.records
+
+    def restore(self, state):
+        """Continua a inferência a partir de um state() (de outro processo)."""
+        env, functions, shared, records = state
+        self.env = dict(env)
+        self.functions = dict(functions)
+        self.shared = set(shared)
+        self.records = dict(records)
+
+    # ------------------- REGISTROS -------------------
+    def record_of(self, fields):
+        """Tipo NamedTuple para [(campo, tipo), ...] (tipos None viram Any)."""
+        names = ", ".join(f":{name}" for name, _ in fields)
+        if len(fields) == 1:
+            names += ","
+        types = ", ".join(t or "Any" for _, t in fields)
+        t = f"NamedTuple{{({names}), Tuple{{{types}}}}}"
+        self.records.setdefault(t, dict(fields))
+        return t
+
+    def record_fields(self, t):
+        """{campo: tipo} de um registro (list com chaves fixas), ou None."""
+        return self.records.get(t) if t is not None else None
+
+    def named_store_converts(self, t):
+        """True se v["k"] <- x num valor do tipo t exige converter v em Dict."""
+        return is_array(t) or t == MAYBE_DICT or t in self.records
+
+    # ------------------- COMANDOS -------------------
+    def visit_program(self, node):
+        for s in node.stmts:
+            self.visit_stmt(s)
+
+    def visit_stmt(self, stmt):
+        if stmt is None:
+            return
+        method = getattr(self, "stmt_" + stmt.__class__.__name__, None)
+        if method is not None:
+            method(stmt)
+
+    def _visit_block(self, block):
+        if block is not None:
+            for s in block.stmts:
+                self.visit_stmt(s)
+
+    def stmt_Assign(self, stmt):
+        t = self.expr(stmt.expr)
+        if stmt.name in self.shared and self.record_fields(t) is not None:
+            # dentro das funções o acesso é x["k"]: o registro fica como Dict
+            self.escaped.add(stmt)
+            t = DICT
+        self.env[stmt.name] = t
+
+    def stmt_AssignIndex(self, stmt):
+        target = self.expr(stmt.target)
+        self.expr(stmt.index)
+        self.expr(stmt.expr)
+        if _is_named_store(stmt) and self.named_store_converts(target):
+            # v["k"] <- x num vetor ou registro: o codegen converte v em Dict
+            # aqui (uma vez)
+            self.env[stmt.target.name] = DICT
+
+    def stmt_ExprStmt(self, stmt):
+        self.expr(stmt.expr)
+
+    def stmt_Return(self, stmt):
+        t = self.expr(stmt.expr)
+        if self._returns is not None:
+            self._returns.append(t)
+
+    def _to_dict_before(self, loop):
+        """
+        Vetores usados com chaves de texto dentro de um laço (e não
+        reatribuídos nele) viram Dict antes do laço, uma vez só, em vez de a
+        cada volta. Anota em loop.body.growth. Num if a conversão fica no
+        ramo que guarda a chave: antes dele, o outro ramo também veria um Dict.
+        """
+        from .growth import GrowthPlan, named_stores
+        names = [n for n in named_stores(loop) if self.named_store_converts(self.env.get(n))]
+        if not names:
+            loop.body.growth = None
+            return
+        plan = GrowthPlan()
+        for name in names:
+            plan.prelude.append((name, self.env[name], None, "dict"))
+            self.env[name] = DICT
+        loop.body.growth = plan
+
+    def _compound(self, stmt, visit):
+        """
+        Visita o if/laço stmt com visit(). Se nele um registro passou a mudar
+        de tipo conforme o caminho (ver _merge), visita de novo: agora as
+        atribuições da variável são Dict e o registro que ela tinha na entrada
+        é convertido antes do comando.
+        """
+        self.converted.pop(stmt, None)
+        entry = self.env
+        while True:
+            shared = len(self.shared)
+            self.env = dict(entry)
+            visit()
+            if len(self.shared) == shared:
+                return
+            entry = dict(entry)
+            self._convert_shared(stmt, entry, self.shared)
+
+    def _convert_shared(self, stmt, env, names):
+        """
+        Os registros das variáveis em names (de self.shared) viram Dict antes
+        de stmt: daí em diante elas são acessadas como x["k"].
+        """
+        for name in sorted(names):
+            t = env.get(name)
+            if self.record_fields(t) is not None:
+                self.converted.setdefault(stmt, []).append((name, t))
+                env[name] = DICT
+
+    def stmt_If(self, stmt):
+        def visit():
+            self.expr(stmt.cond)
+            before = self.env
+            self.env = dict(before)
+            self._visit_block(stmt.then_block)
+            then_env = self.env
+            self.env = dict(before)
+            self._visit_block(stmt.else_block)
+            self.env = self._merge(then_env, self.env)
+        self._compound(stmt, visit)
+
+    def _loop(self, visit_once):
+        if self._in_loop:
+            # laço aninhado: o ponto fixo do laço de fora já cobre este
+            entry = dict(self.env)
+            visit_once()
+            self.env = self._merge(entry, self.env)
+            return
+        self._in_loop = True
+        entry = self.env
+        for _ in range(self.MAX_LOOP_PASSES):
+            self.env = dict(entry)
+            visit_once()
+            merged = self._merge(entry, self.env)
+            if merged == entry:
+                break
+            entry = merged
+        else:
+            # não estabilizou: tudo o que mudou no laço fica desconhecido
+            for name, t in merged.items():
+                if self.env.get(name, _UNSET) != t:
+                    merged[name] = None
+            self.env = dict(merged)
+            visit_once()
+            merged = self._merge(merged, self.env)
+        self.env = merged
+        self._in_loop = False
+
+    def _merge(self, a, b):
+        """
+        Junta dois ambientes (fim dos ramos de um if, entrada de um laço). Um
+        registro que muda de tipo conforme o caminho (outro registro, Dict,
+        tipo desconhecido) não pode ser acessado como NamedTuple depois: a
+        variável vai para self.shared (ver _compound).
+        """
+        merged = dict(a)
+        for name, t in b.items():
+            old = a.get(name, _UNSET)
+            joined = merged[name] = self._join_var(old, t)
+            if self.record_fields(joined) is None and (
+                    self.record_fields(old) is not None or self.record_fields(t) is not None):
+                self.shared.add(name)
+        return merged
+
+    def _join_var(self, a, b):
+        t = join(a, b)
+        # convertido em Dict num caminho só: o tipo depende do caminho
+        if t is None and (a in (DICT, MAYBE_DICT) or b in (DICT, MAYBE_DICT)):
+            if all(x == DICT or self.named_store_converts(x) for x in (a, b)):
+                return MAYBE_DICT
+        return t
+
+    def _plan_growth(self, loop, entry):
+        # importado aqui: growth usa os tipos definidos neste módulo
+        from .growth import plan_growth
+        loop.body.growth = plan_growth(loop, entry, loop.body.growth)
+
+    def stmt_While(self, stmt):
+        def once():
+            self.expr(stmt.cond)
+            self._visit_block(stmt.body)
+
+        def visit():
+            self._to_dict_before(stmt)
+            entry = dict(self.env)
+            self._loop(once)
+            self._plan_growth(stmt, entry)
+        self._compound(stmt, visit)
+
+    def stmt_For(self, stmt):
+        if stmt.start_expr is not None:
+            start = self.expr(stmt.start_expr)
+            end = self.expr(stmt.end_expr)
+            var_t = INT if start == INT and end == INT else None
+        else:
+            var_t = elem_type(self.expr(stmt.end_expr))
+
+        def once():
+            # a variável do for é reatribuída a cada volta: não junta com o
+            # tipo que tinha antes do laço
+            self.env[stmt.var] = var_t
+            self._visit_block(stmt.body)
+
+        def visit():
+            self._to_dict_before(stmt)
+            entry = dict(self.env)
+            self._loop(once)
+            self._plan_growth(stmt, entry)
+        self._compound(stmt, visit)
+
+    def _function_body(self, params, body):
+        # corpo com ambiente próprio: parâmetros e globais são desconhecidos
+        saved = (self.env, self._in_loop, self._returns)
+        self.env = {p: None for p in params}
+        self._in_loop = False
+        self._returns = []
+        self._visit_block(body)
+        returns = self._returns
+        self.env, self._in_loop, self._returns = saved
+
+        # sem return no fim, a função devolve o valor do último comando
+        ret = _fall_through(body)
+        for t in returns:
+            ret = join(ret, t)
+        return None if ret is _UNSET else ret
+
+    def _reads_outside(self, stmt):
+        # variáveis de fora lidas pela função: lá são acessadas como x["k"],
+        # então o registro que já tenham vira Dict antes da definição
+        free = function_free_vars([stmt])
+        self.shared |= free
+        self.converted.pop(stmt, None)
+        self._convert_shared(stmt, self.env, free)
+
+    def stmt_FunctionDecl(self, stmt):
+        self.functions[stmt.name] = self._function_body(stmt.params, stmt.body)
+        self._reads_outside(stmt)
+
+    def stmt_S3FunctionDecl(self, stmt):
+        self._function_body(stmt.params, stmt.body)
+        self._reads_outside(stmt)
+
+    # ------------------- EXPRESSÕES -------------------
+    def expr(self, root):
+        """Tipo de uma expressão (anotado em jl_type de cada nó visitado)."""
+        if root is None:
+            return None
+        # pós-ordem com pilha explícita (expressões podem ser muito profundas)
+        stack = [(root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if not ready:
+                stack.append((node, True))
+                stack.extend((c, False) for c in _children(node))
+                continue
+            node.jl_type = self._type_of(node)
+        return root.jl_type
+
+    def _type_of(self, node):
+        cls = node.__class__
+        if cls is IntLiteral:
+            return INT
+        if cls is FloatLiteral:
+            return FLOAT
+        if cls is BoolLiteral:
+            return BOOL
+        if cls is StringLiteral:
+            return STRING
+        if cls is Var:
+            t = self.env.get(node.name, None)
+            return None if t is _UNSET else t
+        if cls is IsDouble or cls is IsInteger:
+            return BOOL
+        if cls is UnaryOp:
+            t = node.expr.jl_type
+            if node.op == "!":
+                return vector_of(BOOL) if is_array(t) else BOOL
+            return INT if t == BOOL else t
+        if cls is BinaryOp:
+            return self._binary(node.op, node.left.jl_type, node.right.jl_type)
+        if cls is IndexOp:
+            elem = elem_type(node.target.jl_type)
+            idx = node.index.jl_type
+            if elem is None:
+                return None
+            if idx == INT:
+                return elem
+            if is_array(idx):
+                # intervalo indexado por intervalo continua intervalo em Julia
+                return ARRAY if node.target.jl_type == RANGE else vector_of(elem)
+            return None
+        if cls is DollarAccess:
+            fields = self.record_fields(node.target.jl_type)
+            return fields.get(node.field) if fields is not None else None
+        if cls is Call:
+            return self._call(node)
+        if cls is NamedArg:
+            return node.value.jl_type
+        return None
+
+    def _binary(self, op, a, b):
+        if op in _COMPARE or op in _LOGICAL:
+            if is_array(a) or is_array(b):
+                return vector_of(BOOL)
+            return BOOL
+        if op == ":":
+            return RANGE if a in (INT, BOOL) and b in (INT, BOOL) else ARRAY
+        if op in _ARITH or op == "/":
+            ea = elem_type(a) if is_array(a) else a
+            eb = elem_type(b) if is_array(b) else b
+            if ea not in _NUMERIC_RANK or eb not in _NUMERIC_RANK:
+                # elementos desconhecidos, mas o resultado ainda é um vetor
+                return ARRAY if is_array(a) or is_array(b) else None
+            t = FLOAT if op == "/" else join(join(ea, eb), INT)
+            if a == RANGE or b == RANGE:
+                # aritmética com intervalos devolve outro intervalo em Julia
+                return ARRAY
+            if is_array(a) or is_array(b):
+                return vector_of(t)
+            return t
+        return None
+
+    def _call(self, node):
+        args = [a.jl_type for a in node.args if not isinstance(a, NamedArg)]
+        name = node.name
+        if name == "c":
+            # c(...) sempre produz um vetor (concatenando os vetores passados);
+            # o tipo dos elementos só é conhecido quando todos os argumentos
+            # são escalares ou vetores de tipo conhecido
+            if not args:
+                return EMPTY
+            elem = _UNSET
+            for t in args:
+                if t == EMPTY:
+                    continue
+                if is_array(t):
+                    t = elem_type(t)
+                if t not in (INT, FLOAT, BOOL, STRING):
+                    return ARRAY
+                elem = join(elem, t)
+            return EMPTY if elem is _UNSET else vector_of(elem)
+        if name == "list":
+            return self._list(node)
+        if name == "matrix":
+            elem = elem_type(args[0]) if args else None
+            return f"Matrix{{{elem}}}" if elem is not None else ARRAY
+        result = _CALL_RESULTS.get(name)
+        if result is not None:
+            return result(args)
+        return self.functions.get(name)
+
+    def _list(self, node):
+        # só chaves fixas, todas nomeadas, únicas e válidas como campo em Julia
+        args = node.args
+        if not args or not all(isinstance(a, NamedArg) for a in args):
+            return None
+        names = [a.name for a in args]
+        if len(set(names)) != len(names) or not all(is_field_name(n) for n in names):
+            return None
+        return self.record_of([(a.name, a.value.jl_type) for a in args])
+
+
+def _fall_through(block):
+    """
+    Tipo do valor com que a execução sai pelo fim do bloco (em Julia, o do
+    último comando; None se algum caminho chega ao fim sem valor conhecido,
+    como um if sem else ou um laço, que devolvem nothing), ou _UNSET se
+    todos os caminhos terminam num return.
+    """
+    result = _UNSET
+    stack = [block]
+    while stack:
+        block = stack.pop()
+        last = None
+        if block is not None:
+            last = next((s for s in reversed(block.stmts) if s is not None), None)
+        if last is None:
+            return None
+        cls = last.__class__
+        if cls is Return:
+            continue
+        if cls is If:
+            stack.append(last.then_block)
+            stack.append(last.else_block)
+            continue
+        if cls is ExprStmt or cls is Assign:
+            t = last.expr.jl_type
+        else:
+            t = None
+        result = join(result, t)
+        if result is None:
+            return None
+    return result
+
+
+def _is_named_store(stmt):
+    """v["k"] <- x ou v$k <- x, com v uma variável."""
+    return isinstance(stmt.target, Var) and isinstance(stmt.index, StringLiteral)
+
+
+def _children(node):
+    cls = node.__class__
+    if cls is BinaryOp:
+        return (node.left, node.right)
+    if cls in (UnaryOp, IsDouble, IsInteger):
+        return (node.expr,)
+    if cls is IndexOp:
+        return (node.target, node.index)
+    if cls is DollarAccess:
+        return (node.target,)
+    if cls is Call:
+        return node.args
+    if cls is NamedArg:
+        return (node.value,)
+    return ()
+
+
+def infer_types(program):
+    """Roda a inferência sobre um Program inteiro e devolve o TypeInference."""
+    ti = TypeInference()
+    ti.visit_program(program)
+    return ti
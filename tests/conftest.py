@@ -0,0 +1,18 @@
+﻿import glob
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLES = sorted(glob.glob(os.path.join(ROOT, "RProjectExamples", "*.R")))
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def examples():
+    """{nome do exemplo: código R} de RProjectExamples/."""
+    return {os.path.splitext(os.path.basename(p))[0]: read(p) for p in EXAMPLES}
@@ -0,0 +1,241 @@
+﻿"""API assíncrona: pool limitado, backpressure, cancelamento, timeout e loop livre."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+import src.aio as aio
+from src.aio import AsyncTranspiler
+from src.diagnostics import UNEXPECTED_TOKEN, Diagnostics
+from src.transpile import transpile
+
+
+class _Gate:
+    """
+    Substitui aio._work (pool de threads): cada chamada espera `release` e
+    registra quantas rodam ao mesmo tempo e quais códigos chegaram ao worker.
+    """
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.started = []
+
+    def __call__(self, source_code, file, collect, codegen_options):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.started.append(source_code)
+        try:
+            self.release.wait(10)
+            return source_code.upper(), ([] if collect else None)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def gate(monkeypatch):
+    g = _Gate()
+    monkeypatch.setattr(aio, "_work", g)
+    yield g
+    g.release.set()
+
+
+async def _until(cond, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        assert time.monotonic() < deadline, "condição não atingida"
+        await asyncio.sleep(0.001)
+
+
+def test_outputs_match_transpile(examples):
+    sources = list(examples.values())
+
+    async def run():
+        async with AsyncTranspiler(workers=2, processes=False) as tr:
+            single = await tr.transpile(sources[0])
+            outputs = [None] * len(sources)
+            async for i, code, diagnostics, error in tr.transpile_many(sources):
+                assert error is None and not diagnostics
+                outputs[i] = code
+            return single, outputs
+
+    single, outputs = asyncio.run(run())
+    assert single == transpile(sources[0])
+    assert outputs == [transpile(s) for s in sources]
+
+
+def test_process_pool_and_diagnostics():
+    async def run():
+        async with AsyncTranspiler(workers=1) as tr:
+            diagnostics = Diagnostics("bad.R")
+            code = await tr.transpile("x <- 1\ny <- ) 2\nz <- 3\n", diagnostics)
+            return code, diagnostics
+
+    code, diagnostics = asyncio.run(run())
+    assert code == "x = 1\nz = 3"
+    assert [(d.file, d.line, d.code) for d in diagnostics] == [("bad.R", 2, UNEXPECTED_TOKEN)]
+
+
+def test_max_pending_bounds_work_in_the_pool(gate):
+    async def run():
+        async with AsyncTranspiler(workers=8, max_pending=3, processes=False) as tr:
+            tasks = [asyncio.ensure_future(tr.transpile(f"x{i}")) for i in range(10)]
+            await _until(lambda: gate.running == 3)
+            await asyncio.sleep(0.05)
+            # as demais esperam uma vaga sem chegar ao executor
+            assert len(gate.started) == 3
+            gate.release.set()
+            return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == [f"X{i}" for i in range(10)]
+    assert gate.peak == 3
+
+
+def test_transpile_many_reads_sources_lazily(gate):
+    read = []
+
+    async def sources():
+        for i in range(8):
+            read.append(i)
+            yield f"x{i}"
+
+    async def run():
+        async with AsyncTranspiler(workers=8, processes=False) as tr:
+            results = tr.transpile_many(sources(), concurrency=2)
+            first = asyncio.ensure_future(results.__anext__())
+            await _until(lambda: gate.running == 2)
+            await asyncio.sleep(0.05)
+            # só lê o próximo código quando um item termina
+            assert read == [0, 1]
+            gate.release.set()
+            items = [await first] + [item async for item in results]
+            return sorted((i, code) for i, code, _d, _e in items)
+
+    assert asyncio.run(run()) == [(i, f"X{i}") for i in range(8)]
+    assert gate.peak == 2
+
+
+def test_cancelled_request_leaves_the_queue(gate):
+    async def run():
+        async with AsyncTranspiler(workers=1, max_pending=1, processes=False) as tr:
+            busy = asyncio.ensure_future(tr.transpile("a"))
+            await _until(lambda: gate.running == 1)
+            queued = asyncio.ensure_future(tr.transpile("b"))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            gate.release.set()
+            assert await busy == "A"
+            assert await tr.transpile("c") == "C"
+
+    asyncio.run(run())
+    # "b" nunca chegou ao worker
+    assert gate.started == ["a", "c"]
+
+
+def test_timeout_keeps_the_slot_until_the_worker_ends(gate):
+    async def run():
+        async with AsyncTranspiler(workers=2, max_pending=1, processes=False) as tr:
+            with pytest.raises(TimeoutError):
+                await tr.transpile("a", timeout=0.05)
+            # o worker continua rodando "a": a próxima espera a vaga
+            nxt = asyncio.ensure_future(tr.transpile("b"))
+            await asyncio.sleep(0.05)
+            assert gate.started == ["a"] and not nxt.done()
+            gate.release.set()
+            assert await nxt == "B"
+
+    asyncio.run(run())
+
+
+def test_timeout_counts_the_wait_for_a_slot(gate):
+    async def run():
+        async with AsyncTranspiler(workers=2, max_pending=1, processes=False) as tr:
+            busy = asyncio.ensure_future(tr.transpile("a"))
+            await _until(lambda: gate.running == 1)
+            t0 = time.perf_counter()
+            with pytest.raises(TimeoutError):
+                await tr.transpile("b", timeout=0.05)
+            waited = time.perf_counter() - t0
+            gate.release.set()
+            assert await busy == "A"
+            # a vaga não foi perdida nem duplicada
+            assert await asyncio.gather(tr.transpile("c"), tr.transpile("d")) == ["C", "D"]
+            return waited
+
+    assert asyncio.run(run()) < 1
+    # "b" desistiu na fila, sem chegar ao worker
+    assert gate.started == ["a", "c", "d"] and gate.peak == 1
+
+
+def test_transpile_many_reports_errors_per_item(gate):
+    async def run():
+        async with AsyncTranspiler(workers=2, processes=False) as tr:
+            items = {}
+            results = tr.transpile_many(["a", "b"], timeout=0.05)
+            async for i, code, _d, error in results:
+                items[i] = (code, type(error))
+                if len(items) == 2:
+                    gate.release.set()
+            return items
+
+    assert asyncio.run(run()) == {0: (None, TimeoutError), 1: (None, TimeoutError)}
+
+
+def test_cancelling_the_consumer_cancels_pending_items(gate):
+    async def run():
+        async with AsyncTranspiler(workers=1, max_pending=1, processes=False) as tr:
+            results = tr.transpile_many([f"x{i}" for i in range(5)], concurrency=3)
+            consumer = asyncio.ensure_future(results.__anext__())
+            await _until(lambda: gate.running == 1)
+            consumer.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await consumer
+            gate.release.set()
+            await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    # x1 e x2 esperavam a vaga de x0 e foram cancelados; x3 e x4 nem foram lidos
+    assert gate.started == ["x0"]
+
+
+def test_event_loop_stays_responsive(examples):
+    # um "batimento" a cada 5 ms mede o maior atraso do loop: transpile()
+    # direto no loop o bloqueia pela conversão inteira; pelo pool, não
+    source = "\n".join(examples.values()) * 20
+    expected = transpile(source)
+
+    async def heartbeat(stop, lags):
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - t0 - 0.005)
+
+    async def measure(work):
+        stop, lags = asyncio.Event(), []
+        beat = asyncio.ensure_future(heartbeat(stop, lags))
+        await asyncio.sleep(0.02)
+        outputs = await work()
+        stop.set()
+        await beat
+        assert outputs == [expected] * 3
+        return max(lags)
+
+    async def blocking():
+        return [transpile(source) for _ in range(3)]
+
+    async def run():
+        async with AsyncTranspiler(workers=2) as tr:
+            await tr.transpile("x <- 1\n")  # inicia os workers fora da medida
+            pooled = await measure(lambda: asyncio.gather(*(tr.transpile(source) for _ in range(3))))
+        return await measure(blocking), pooled
+
+    blocked, pooled = asyncio.run(run())
+    print(f"\nmaior atraso do loop: {blocked * 1000:.1f} ms no loop, {pooled * 1000:.1f} ms pelo pool")
+    assert pooled < blocked / 4
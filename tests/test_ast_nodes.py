@@ -0,0 +1,59 @@
+﻿"""Nós da AST: __slots__ (sem __dict__), memória por nó e posições no código R."""
+import inspect
+import sys
+
+from src import ast_nodes
+from src.ast_nodes import Node
+from src.transpile import Transpiler
+
+NODE_CLASSES = [c for _, c in inspect.getmembers(ast_nodes, inspect.isclass)
+                if issubclass(c, Node)]
+
+
+def _nodes(root):
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Node):
+            yield item
+            for cls in type(item).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    value = getattr(item, slot, None)
+                    if isinstance(value, (Node, list)):
+                        stack.append(value)
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def test_every_node_class_is_slotted():
+    for cls in NODE_CLASSES:
+        assert "__slots__" in vars(cls), cls.__name__
+        assert "__dict__" not in dir(cls), cls.__name__
+
+
+def test_bytes_per_node_benchmark():
+    source = "".join(f"x{i} <- (a + {i}) * f(b, {i}.5)\n"
+                     f"if (x{i} > 2) {{ v[{i}] <- \"s\" }}\n" for i in range(5_000))
+    nodes = list(_nodes(Transpiler().parse(source)))
+    assert not any(hasattr(n, "__dict__") for n in nodes)
+    per_node = sum(sys.getsizeof(n) for n in nodes) / len(nodes)
+    print(f"\n{len(nodes)} nós, {per_node:.1f} bytes/nó")
+    # com __dict__ eram ~140 bytes/nó (objeto + dicionário)
+    assert per_node < 80
+
+
+def test_positions():
+    program = Transpiler().parse("x <- 1\n\nif (x > 0) {\n  y <- f(x, \"a\")\n}\n")
+    assign, cond = program.stmts
+    assert (assign.lineno, assign.col) == (1, 1)
+    assert (cond.lineno, cond.col) == (3, 1)
+    inner = cond.then_block.stmts[0]
+    assert (inner.lineno, inner.col) == (4, 3)
+    call = inner.expr
+    assert (call.lineno, call.col) == (4, 8)
+    assert (call.args[1].lineno, call.args[1].col) == (4, 13)
+
+
+def test_nodes_built_outside_the_parser_have_no_position():
+    node = ast_nodes.Var("x")
+    assert (node.lineno, node.col, node.jl_type) == (None, None, None)
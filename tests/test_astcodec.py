@@ -0,0 +1,180 @@
+﻿"""Codificação binária da AST: ida e volta, dados corrompidos e comparação com pickle."""
+import math
+import pickle
+import random
+import time
+
+import pytest
+
+from src import ast_nodes
+from src.astcodec import FORMAT_VERSION, MAGIC, dumps, loads
+from src.ast_nodes import Node
+from src.codegen import JuliaCodeGen
+from src.transpile import Transpiler
+
+EDGE = (
+    "x <- -7\n"
+    "big <- 123456789012345678\n"
+    "y <- 1e300 * -2.5\n"
+    "s <- \"ação 🎉\"\n"
+    "e <- ''\n"
+    "z <- TRUE\n"
+    "if (!z) { w <- FALSE } else { w <- NULL }\n"
+    "`+.foo` <- function(a, b) { \"soma\" }\n"
+    "obj <- structure(list(a=1, b=\"x\"), class=\"foo\")\n"
+    "obj$a\n"
+    "v <- c()\n"
+    "for (i in 1:3) { v[i] <- is.double(i) }\n"
+    "while (x < 0) { x <- x + 1 }\n"
+)
+
+
+def _fields(node):
+    return [f for c in type(node).__mro__ for f in getattr(c, "__slots__", ())
+            if f not in ("jl_type", "assigned", "reads", "growth", "writes")]
+
+
+def _assert_same(a, b):
+    # comparação estrutural (tipos, campos e posições), sem recursão
+    stack = [(a, b)]
+    while stack:
+        x, y = stack.pop()
+        assert type(x) is type(y), (x, y)
+        if isinstance(x, Node):
+            for f in _fields(x):
+                stack.append((getattr(x, f, None), getattr(y, f, None)))
+        elif isinstance(x, (list, tuple)):
+            assert len(x) == len(y)
+            stack.extend(zip(x, y))
+        elif isinstance(x, float) and math.isnan(x):
+            assert math.isnan(y)
+        else:
+            assert x == y
+
+
+def _roundtrip(value):
+    data = dumps(value)
+    back = loads(data)
+    _assert_same(value, back)
+    assert dumps(back) == data
+    return back
+
+
+def test_examples_roundtrip(examples):
+    tr = Transpiler()
+    for name, source in examples.items():
+        back = _roundtrip(tr.parse(source))
+        assert JuliaCodeGen().generate(back) == JuliaCodeGen().generate(tr.parse(source)), name
+
+
+def test_edge_cases_roundtrip():
+    program = Transpiler().parse(EDGE)
+    back = _roundtrip(program)
+    assert JuliaCodeGen().generate(back) == JuliaCodeGen().generate(Transpiler().parse(EDGE))
+    # posições voltam, inclusive de nós sem posição e linhas que recuam
+    assert [(s.lineno, s.col) for s in back.stmts] == [(s.lineno, s.col) for s in program.stmts]
+
+
+@pytest.mark.parametrize("value", [
+    None, [], [None, True, False], 0, -1, 2 ** 70, -(2 ** 70), 0.0, -0.0, 1e-320,
+    float("inf"), float("-inf"), float("nan"), "", "\x00", "\ud800", "ação 🎉" * 100,
+], ids=repr)
+def test_values_roundtrip(value):
+    back = _roundtrip(ast_nodes.ExprStmt(value))
+    if isinstance(value, float):
+        assert math.copysign(1, back.expr) == math.copysign(1, value)
+
+
+def test_positions_roundtrip():
+    nodes = [ast_nodes.Var(f"v{i}") for i in range(6)]
+    for node, (line, col) in zip(nodes, [(5, 3), (None, None), (1, 1), (100000, 200), (2, None), (None, 7)]):
+        node.lineno, node.col = line, col
+    back = loads(dumps(nodes))
+    assert [(n.lineno, n.col) for n in back] == [(n.lineno, n.col) for n in nodes]
+
+
+def test_deep_tree_roundtrip():
+    # sem recursão: 20 mil níveis de BinaryOp e de blocos aninhados
+    source = "x <- " + " + ".join(["a"] * 20000) + "\n"
+    source += "if (a) {\n" * 300 + "y <- 1\n" + "}\n" * 300
+    _roundtrip(Transpiler().parse(source))
+
+
+def test_annotations_are_not_encoded(examples):
+    source = "\n".join(examples.values())
+    tr = Transpiler()
+    fresh = dumps(tr.parse(source))
+    typed = tr.parse(source)
+    JuliaCodeGen().generate(typed)  # preenche jl_type, Block.assigned etc.
+    assert dumps(typed) == fresh
+
+
+def test_strings_are_pooled():
+    data = dumps([ast_nodes.Var("um_nome_comprido")] * 1000)
+    assert data.count(b"um_nome_comprido") == 1
+
+
+def test_unsupported_value():
+    with pytest.raises(TypeError):
+        dumps(ast_nodes.ExprStmt({"a": 1}))
+
+
+def test_rejects_foreign_and_old_data():
+    for bad in (b"", b"RAS", b"XXXX\x01", MAGIC, MAGIC + bytes([FORMAT_VERSION + 1]),
+                pickle.dumps([1, 2])):
+        with pytest.raises(ValueError):
+            loads(bad)
+
+
+def test_truncated_data_is_rejected(examples):
+    data = dumps(Transpiler().parse(next(iter(examples.values()))))
+    for n in range(len(data)):
+        with pytest.raises(ValueError):
+            loads(data[:n])
+    with pytest.raises(ValueError):
+        loads(data + b"\x00")
+
+
+def test_corrupted_data_only_raises_value_error():
+    data = bytearray(dumps(Transpiler().parse(EDGE)))
+    rng = random.Random(7)
+    rejected = 0
+    for _ in range(3000):
+        bad = bytearray(data)
+        for _ in range(rng.randint(1, 3)):
+            bad[rng.randrange(len(MAGIC) + 1, len(bad))] = rng.randrange(256)
+        try:
+            loads(bytes(bad))
+        except ValueError:
+            rejected += 1
+    # nenhuma outra exceção; a maioria das alterações é detectada
+    assert rejected > 1500
+
+
+def test_unknown_node_type_is_rejected():
+    data = dumps(ast_nodes.Var("x"))
+    with pytest.raises(ValueError, match="desconhecido"):
+        loads(data.replace(b"Var", b"Zzz"))
+
+
+def test_size_and_speed_vs_pickle(examples):
+    ast = Transpiler().parse("\n".join(examples.values()) * 20)
+    results = {}
+    for name, encode, decode in (
+            ("astcodec", dumps, loads),
+            ("pickle", lambda x: pickle.dumps(x, pickle.HIGHEST_PROTOCOL), pickle.loads)):
+        best = [float("inf")] * 2
+        for _ in range(3):
+            t0 = time.perf_counter()
+            data = encode(ast)
+            t1 = time.perf_counter()
+            decode(data)
+            t2 = time.perf_counter()
+            best = [min(best[0], t1 - t0), min(best[1], t2 - t1)]
+        results[name] = (len(data), *best)
+    print()
+    for name, (size, enc, dec) in results.items():
+        print(f"{name:10}{size:>10} bytes   dumps {enc * 1000:6.1f} ms   loads {dec * 1000:6.1f} ms")
+    ours, theirs = results["astcodec"], results["pickle"]
+    assert ours[0] < theirs[0] / 4
+    assert ours[2] < theirs[2]
@@ -0,0 +1,73 @@
+﻿"""Modo diretório: pool de processos, subdiretórios e resumo."""
+import pytest
+
+from src.batch import find_r_files, output_path, transpile_dir
+from src.transpile import main, transpile
+
+BAD = "x <- 1\ny <- ) 2\n"
+
+
+@pytest.fixture
+def tree(tmp_path, examples):
+    """Os exemplos espalhados em subdiretórios; devolve (raiz, {relativo: código})."""
+    root = tmp_path / "src"
+    sources = {}
+    for i, (name, source) in enumerate(sorted(examples.items())):
+        rel = ("", "um/", "um/dois/")[i % 3] + name + ".R"
+        sources[rel] = source
+    sources["um/minusculo.r"] = "z <- 3\n"
+    for rel, source in sources.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    (root / "um" / "notas.txt").write_text("não é R")
+    return root, sources
+
+
+def test_pool_keeps_subdirectories_and_matches_transpile(tree, tmp_path):
+    root, sources = tree
+    out = tmp_path / "out"
+    lines = []
+    results = transpile_dir(str(root), str(out), jobs=2, report=lines.append)
+    assert [r[0] for r in results] == sorted(sources)
+    assert all(r[1] is None and not r[3] for r in results)
+    for rel, source in sources.items():
+        assert (out / output_path(rel, "")).read_text(encoding="utf-8") == transpile(source), rel
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("*.jl")) == \
+        sorted(output_path(rel, "").replace("\\", "/") for rel in sources)
+    # uma linha por arquivo (na ordem em que terminam) e o resumo
+    assert sorted(lines[:-1]) == sorted(f"[OK]   {rel}" for rel in sources)
+    assert lines[-1].startswith(f"\n{len(sources)} arquivo(s): {len(sources)} ok (0 do cache), 0 com erro")
+
+
+def test_pool_reports_failures(tree, tmp_path):
+    root, sources = tree
+    (root / "um" / "dois" / "ruim.R").write_text(BAD, encoding="utf-8")
+    (root / "invalido.R").write_bytes(b"x <- '\xff'\n")
+    out = tmp_path / "out"
+    lines = []
+    results = dict((r[0], r[1]) for r in transpile_dir(str(root), str(out), jobs=2,
+                                                        report=lines.append))
+    assert results["um/dois/ruim.R"] == "1 erro(s) de sintaxe"
+    assert results["invalido.R"].startswith("UnicodeDecodeError")
+    assert sum(e is not None for e in results.values()) == 2
+    # o Julia dos comandos válidos é gravado mesmo assim
+    assert (out / "um" / "dois" / "ruim.jl").read_text(encoding="utf-8") == "x = 1"
+    assert "[ERRO] um/dois/ruim.R: 1 erro(s) de sintaxe" in lines
+    assert f"{len(sources)} ok (0 do cache), 2 com erro" in lines[-1]
+
+
+def test_exit_status_follows_failures(tree, tmp_path, capsys):
+    root, _ = tree
+    out = tmp_path / "out"
+    main([str(root), str(out), "-j", "2", "--no-cache"])
+    (root / "ruim.R").write_text(BAD, encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main([str(root), str(out), "-j", "2", "--no-cache"])
+    assert exc.value.code == 1
+    assert "[ERRO] ruim.R" in capsys.readouterr().out
+
+
+def test_find_r_files(tree):
+    root, sources = tree
+    assert find_r_files(str(root)) == sorted(sources)
@@ -0,0 +1,127 @@
+﻿"""Cache em disco do modo diretório (BuildCache) e opção --no-cache."""
+import os
+
+import pytest
+
+from src import cache as cache_module
+from src.batch import transpile_dir
+from src.cache import BuildCache, transpiler_signature
+from src.transpile import main, transpile
+
+GOOD = "x <- 1\nprint(x)\n"
+BAD = "x <- 1\ny <- ) 2\n"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.R").write_text(GOOD, encoding="utf-8")
+    (src / "b.R").write_text("v <- c(1, 2)\n", encoding="utf-8")
+    return src
+
+
+def _run(src, out, cache, **kw):
+    lines = []
+    results = transpile_dir(str(src), str(out), jobs=1, report=lines.append, cache=cache, **kw)
+    return results, lines
+
+
+def _entries(cache_dir):
+    return sorted(n for n in os.listdir(cache_dir) if n.endswith(".jl"))
+
+
+def test_miss_then_hit(tree, tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    out = tmp_path / "out"
+    results, lines = _run(tree, out, cache)
+    assert [r[3] for r in results] == [False, False]
+    assert lines[:2] == ["[OK]   a.R", "[OK]   b.R"]
+    assert len(_entries(cache.cache_dir)) == 2
+
+    (out / "a.jl").unlink()
+    results, lines = _run(tree, out, cache)
+    assert [r[3] for r in results] == [True, True]
+    assert lines[:2] == ["[CACHE] a.R", "[CACHE] b.R"]
+    assert "2 ok (2 do cache)" in lines[-1]
+    # a saída apagada volta do cache
+    assert (out / "a.jl").read_text(encoding="utf-8") == transpile(GOOD)
+
+
+def test_up_to_date_output_is_not_rewritten(tree, tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    out = tmp_path / "out"
+    _run(tree, out, cache)
+    target = out / "a.jl"
+    os.utime(target, (1_000_000, 1_000_000))
+    _run(tree, out, cache)
+    assert target.stat().st_mtime == 1_000_000
+    # uma saída alterada à mão é reescrita
+    target.write_text("mexido", encoding="utf-8")
+    _run(tree, out, cache)
+    assert target.read_text(encoding="utf-8") == transpile(GOOD)
+
+
+def test_key_depends_on_source_options_and_signature(tmp_path, monkeypatch):
+    cache = BuildCache(str(tmp_path / "cache"))
+    key = cache.key(GOOD)
+    assert key == cache.key(GOOD, {})
+    assert key != cache.key(GOOD + "\n")
+    assert key != cache.key(GOOD, {"wrap_main": True})
+    # outro transpilador (código do pacote mudou): outra chave
+    assert len(transpiler_signature()) == 64
+    monkeypatch.setattr(cache_module, "_signature", "outra")
+    assert key != cache.key(GOOD)
+
+
+def test_main_option_changes_the_cached_output(tree, tmp_path, capsys):
+    cache_dir = str(tmp_path / "cache")
+    out = tmp_path / "out"
+    main([str(tree), str(out), "-j", "1", "--cache-dir", cache_dir])
+    main([str(tree), str(out), "-j", "1", "--cache-dir", cache_dir, "--main"])
+    output = capsys.readouterr().out
+    assert "[CACHE]" not in output
+    assert (out / "a.jl").read_text(encoding="utf-8") == transpile(GOOD, wrap_main=True)
+    assert len(_entries(cache_dir)) == 4
+    main([str(tree), str(out), "-j", "1", "--cache-dir", cache_dir, "--main"])
+    assert "[CACHE] a.R" in capsys.readouterr().out
+
+
+def test_outputs_with_diagnostics_are_not_cached(tree, tmp_path):
+    (tree / "c.R").write_text(BAD, encoding="utf-8")
+    cache = BuildCache(str(tmp_path / "cache"))
+    out = tmp_path / "out"
+    _run(tree, out, cache)
+    assert len(_entries(cache.cache_dir)) == 2
+    assert cache.get(cache.key(BAD)) is None
+    # na segunda vez os erros aparecem de novo
+    results, lines = _run(tree, out, cache)
+    assert [(r[0], r[3]) for r in results] == [("a.R", True), ("b.R", True), ("c.R", False)]
+    assert lines[2] == "[ERRO] c.R: 1 erro(s) de sintaxe"
+    assert lines[3].strip().startswith(str(tree / "c.R") + ":2:")
+    assert (out / "c.jl").read_text(encoding="utf-8") == "x = 1"
+
+
+def test_evict_removes_the_least_recently_used(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"), max_bytes=250)
+    for i, name in enumerate(["velha", "media", "nova", "recente"]):
+        cache.put(name, "x" * 100)
+        os.utime(os.path.join(cache.cache_dir, name + ".jl"), (1000 + i, 1000 + i))
+    # get() conta como uso: "velha" passa a ser a mais recente
+    assert cache.get("velha") == "x" * 100
+    # arquivos que não são entradas não contam nem são removidos
+    (tmp_path / "cache" / "outro.txt").write_text("y" * 1000)
+    assert cache.evict() == 2
+    assert _entries(cache.cache_dir) == ["recente.jl", "velha.jl"]
+    assert os.path.exists(tmp_path / "cache" / "outro.txt")
+    assert cache.evict() == 0
+
+
+def test_no_cache_bypasses_the_cache(tree, tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    out = tmp_path / "out"
+    for _ in range(2):
+        main([str(tree), str(out), "-j", "1", "--cache-dir", str(cache_dir), "--no-cache"])
+    assert "[CACHE]" not in capsys.readouterr().out
+    assert not cache_dir.exists()
+    assert (out / "a.jl").read_text(encoding="utf-8") == transpile(GOOD)
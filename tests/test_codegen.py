@@ -0,0 +1,144 @@
+﻿"""Codegen: tabela de despacho por classe e saída num buffer único."""
+import pytest
+
+from src.ast_nodes import IntLiteral, Program
+from src.codegen import JuliaCodeGen
+from src.transpile import Transpiler
+
+
+class _NameLookup:
+    """Faz o papel das tabelas de despacho procurando o método pelo nome a cada nó."""
+
+    def __init__(self, cls, prefix):
+        self.cls = cls
+        self.prefix = prefix
+
+    def get(self, node_type):
+        return getattr(self.cls, self.prefix + node_type.__name__, None)
+
+    def __contains__(self, node_type):
+        return True
+
+
+class _GetattrDispatch(JuliaCodeGen):
+    """Despacho antigo: "gen_" + nome da classe e getattr em cada nó."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._handlers = _NameLookup(type(self), "gen_")
+        self._parts = _NameLookup(type(self), "parts_")
+        self._emitters = _NameLookup(type(self), "emit_")
+
+    def generate(self, node):
+        if node is None:
+            return None
+        name = node.__class__.__name__
+        if getattr(self, "parts_" + name, None) is not None:
+            return self._generate_expr(node)
+        if getattr(self, "emit_" + name, None) is not None:
+            out = []
+            getattr(self, "emit_" + name)(node, out)
+            return "".join(out)
+        return getattr(self, "gen_" + name)(node)
+
+
+def _deep_arithmetic(statements=200, terms=200):
+    ops = "+-*"
+    return "".join(
+        f"x{s} <- " + " ".join(f"a{t} {ops[t % 3]}" for t in range(terms)) + " 1\n"
+        for s in range(statements))
+
+
+def test_dispatch_table_matches_getattr_dispatch():
+    program = Transpiler().parse(_deep_arithmetic())
+    assert JuliaCodeGen().generate(program) == _GetattrDispatch().generate(program)
+
+
+def test_handlers_resolved_once_per_class_not_per_node():
+    calls = []
+
+    class Counting(JuliaCodeGen):
+        def _resolve_handler(self, node_type):
+            calls.append(node_type)
+            return super()._resolve_handler(node_type)
+
+    # getattr por nó faria uma busca para cada um dos ~80 mil nós; com a
+    # tabela, só a primeira ocorrência de cada classe é resolvida
+    Counting().generate(Transpiler().parse(_deep_arithmetic()))
+    assert len(calls) == len(set(calls)) == 5  # Program, Assign, BinaryOp, Var, IntLiteral
+
+
+def test_handlers_resolved_once_per_class():
+    program = Transpiler().parse(_deep_arithmetic(5, 20) + "if (x0 > 1) {\n  print(x0)\n}\n")
+    JuliaCodeGen().generate(program)
+    calls = []
+
+    class Counting(JuliaCodeGen):
+        def _resolve_handler(self, node_type):
+            calls.append(node_type)
+            return super()._resolve_handler(node_type)
+
+    Counting().generate(program)
+    first = len(calls)
+    assert first > 0
+    Counting().generate(program)
+    assert len(calls) == first  # a tabela é da classe, não da instância
+
+
+def test_subclass_overrides_are_dispatched():
+    class Hex(JuliaCodeGen):
+        def gen_IntLiteral(self, node):
+            return hex(node.value)
+
+    program = Transpiler().parse("x <- 10 + y\n")
+    assert Hex().generate(program) == "x = (0xa + y)"
+    assert JuliaCodeGen().generate(program) == "x = (10 + y)"
+    assert Hex().generate(IntLiteral(255)) == "0xff"
+
+
+def nested_blocks(depth, width=20):
+    """for e if alternados, depth níveis, com width atribuições em cada um."""
+    lines = []
+    for d in range(depth):
+        lines.append(f"for (i{d} in 1:3) {{" if d % 2 == 0 else f"if (x > {d}) {{")
+        lines.extend(f"y{k} <- y{k} + {d}" for k in range(width))
+    lines.extend("}" * depth)
+    return "\n".join(lines) + "\n"
+
+
+class _CountingReturns(JuliaCodeGen):
+    """Soma o tamanho das strings que generate devolve abaixo do Program."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.returned = 0
+
+    def generate(self, node):
+        code = super().generate(node)
+        if node.__class__ is not Program and code:
+            self.returned += len(code)
+        return code
+
+
+@pytest.mark.parametrize("depth", [25, 100])
+def test_nested_blocks_are_written_once(depth):
+    # cada bloco escreve direto no buffer de saída; se devolvesse a própria
+    # string ao pai, o texto de cada nível seria devolvido de novo por todos
+    # os blocos acima, e a soma seria proporcional a profundidade x tamanho
+    gen = _CountingReturns()
+    code = gen.generate(Transpiler().parse(nested_blocks(depth)))
+    assert gen.returned < len(code)
+
+
+def test_nested_blocks_layout():
+    code = JuliaCodeGen().generate(Transpiler().parse(nested_blocks(3, 1)))
+    assert code == (
+        "for i0 in 1:3\n"
+        "    y0 = (y0 + 0)\n"
+        "    if (x > 1)\n"
+        "        y0 = (y0 + 1)\n"
+        "        for i2 in 1:3\n"
+        "            y0 = (y0 + 2)\n"
+        "        end\n"
+        "    end\n"
+        "end")
@@ -0,0 +1,188 @@
+﻿"""Servidor de transpilação (JSON lines) e cliente fino."""
+import io
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+import src.daemon as daemon
+from src import client
+from src.client import Client
+from src.daemon import handle_request, serve_stdio, serve_unix
+from src.diagnostics import UNEXPECTED_TOKEN
+from src.transpile import transpile
+
+SOURCE = "x <- 1\nprint(x)\n"
+BAD = "x <- 1\ny <- ) 2\n"
+
+
+def _request(**req):
+    return handle_request(json.dumps(req))
+
+
+def test_source_request():
+    assert _request(id=7, source=SOURCE) == {
+        "id": 7, "ok": True, "julia": transpile(SOURCE), "diagnostics": []}
+
+
+def test_path_request_and_file_name(tmp_path):
+    path = tmp_path / "bad.R"
+    path.write_text(BAD, encoding="utf-8")
+    resp = _request(path=str(path))
+    assert resp["ok"] is False and resp["julia"] == "x = 1"
+    [d] = resp["diagnostics"]
+    assert (d["file"], d["line"], d["code"]) == (str(path), 2, UNEXPECTED_TOKEN)
+    # "file" muda o nome nos diagnósticos de um pedido com source
+    [d] = _request(source=BAD, file="editor.R")["diagnostics"]
+    assert d["file"] == "editor.R"
+
+
+def test_main_and_output(tmp_path):
+    resp = _request(source=SOURCE, main=True)
+    assert resp["julia"] == transpile(SOURCE, wrap_main=True)
+    output = tmp_path / "sub" / "out.jl"
+    resp = _request(id=1, source=SOURCE, output=str(output))
+    assert resp == {"id": 1, "ok": True, "output": str(output), "diagnostics": []}
+    assert output.read_text(encoding="utf-8") == transpile(SOURCE)
+
+
+@pytest.mark.parametrize("line, error", [
+    ("{x", "pedido inválido"),
+    ("[1, 2]", "pedido inválido: o pedido deve ser um objeto JSON"),
+    ('{"id": 3}', 'ValueError: o pedido precisa de "source" ou "path"'),
+    ('{"id": 4, "path": "/nao/existe.R"}', "FileNotFoundError"),
+])
+def test_bad_requests(line, error):
+    resp = handle_request(line)
+    assert resp["ok"] is False and resp["error"].startswith(error)
+    assert "julia" not in resp
+    if '"id"' in line:
+        assert resp["id"] == json.loads(line)["id"]
+
+
+def test_serve_stdio():
+    inp = io.StringIO(json.dumps({"id": 1, "source": SOURCE}) + "\n\n"
+                      + "nada\n" + json.dumps({"id": 2, "source": BAD}) + "\n")
+    out = io.StringIO()
+    serve_stdio(inp, out)
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    # linhas em branco são ignoradas; uma resposta por pedido, na ordem
+    assert [r.get("id") for r in responses] == [1, None, 2]
+    assert [r["ok"] for r in responses] == [True, False, False]
+    assert responses[0]["julia"] == transpile(SOURCE)
+
+
+def _start(path, monkeypatch):
+    """serve_unix(path) numa thread; devolve a função que o encerra."""
+    servers = []
+
+    class Server(daemon._Server):
+        def __init__(self, *args):
+            super().__init__(*args)
+            servers.append(self)
+
+    monkeypatch.setattr(daemon, "_Server", Server)
+    ready = threading.Event()
+    errors = []
+
+    def run():
+        try:
+            serve_unix(path, ready=ready.set)
+        except BaseException as e:
+            errors.append(e)
+            ready.set()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert ready.wait(10) and not errors, errors
+
+    def stop():
+        servers[0].shutdown()
+        thread.join(10)
+        assert not thread.is_alive()
+        # o socket é removido ao encerrar
+        assert not os.path.exists(path)
+
+    return stop
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Servidor rodando; devolve o caminho do socket."""
+    path = str(tmp_path / "t.sock")
+    stop = _start(path, monkeypatch)
+    yield path
+    stop()
+
+
+def test_socket_round_trip(server, tmp_path):
+    with Client(server) as c:
+        assert c.request(id=1, source=SOURCE)["julia"] == transpile(SOURCE)
+        # vários pedidos pela mesma conexão
+        resp = c.request(id=2, source=BAD)
+        assert resp["id"] == 2 and resp["ok"] is False
+        assert c.request(nada=1)["error"].startswith("ValueError")
+    # conexões simultâneas
+    results = []
+
+    def work():
+        with Client(server) as c:
+            results.extend(c.request(source=SOURCE)["julia"] for _ in range(10))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [transpile(SOURCE)] * 40
+
+
+def test_client_main(server, tmp_path, capsys):
+    a = tmp_path / "a.R"
+    a.write_text(SOURCE, encoding="utf-8")
+    b = tmp_path / "b.R"
+    b.write_text(BAD, encoding="utf-8")
+    assert client.main(["--socket", server, str(a)]) == 0
+    assert capsys.readouterr().out == transpile(SOURCE)
+    out_dir = tmp_path / "out"
+    assert client.main(["--socket", server, "-o", str(out_dir), str(a), str(b)]) == 1
+    assert (out_dir / "a.jl").read_text(encoding="utf-8") == transpile(SOURCE)
+    assert (out_dir / "b.jl").read_text(encoding="utf-8") == "x = 1"
+    assert f"{b}:2:" in capsys.readouterr().err
+
+
+def test_client_without_server(tmp_path, capsys):
+    assert client.main(["--socket", str(tmp_path / "nada.sock"), "a.R"]) == 2
+    assert "Servidor indisponível" in capsys.readouterr().err
+    assert client.main([]) == 2
+
+
+def test_live_socket_is_refused(server):
+    with pytest.raises(OSError, match="em uso"):
+        serve_unix(server)
+    # o servidor continua atendendo
+    with Client(server) as c:
+        assert c.request(source=SOURCE)["ok"] is True
+
+
+def test_stale_socket_is_replaced(tmp_path, monkeypatch):
+    path = str(tmp_path / "t.sock")
+    # socket deixado por um servidor que terminou sem removê-lo
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    assert os.path.exists(path)
+    stop = _start(path, monkeypatch)
+    with Client(path) as c:
+        assert c.request(source=SOURCE)["ok"] is True
+    stop()
+
+
+def test_other_file_is_not_replaced(tmp_path):
+    path = tmp_path / "t.sock"
+    path.write_text("não é um socket")
+    with pytest.raises(OSError):
+        serve_unix(str(path))
+    assert path.read_text() == "não é um socket"
@@ -0,0 +1,50 @@
+﻿"""Expressões muito profundas: geradas sem recursão (limite de recursão padrão)."""
+import io
+import sys
+
+import pytest
+
+from src.transpile import get_transpiler, transpile
+
+DEPTH = 5_000
+
+
+@pytest.fixture(autouse=True)
+def default_recursion_limit():
+    # o teste só vale se ninguém aumentou o limite
+    assert sys.getrecursionlimit() <= 1000
+
+
+def test_sum_of_100k_terms():
+    source = "x <- " + " + ".join(f"a{i}" for i in range(100_000)) + "\n"
+    code = transpile(source)
+    assert code.startswith("x = " + "(" * 99_999 + "a0 + a1) + a2)")
+    assert code.endswith(" + a99999)")
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("f(" * DEPTH + "1" + ")" * DEPTH, "f(" * DEPTH + "1" + ")" * DEPTH),
+    ("c(" * DEPTH + "1" + ")" * DEPTH, "Int[" * DEPTH + "1" + "]" * DEPTH),
+    ("v[" * DEPTH + "1" + "]" * DEPTH, "v[" * DEPTH + "1" + "]" * DEPTH),
+    ("(" * DEPTH + "y" + ")" * DEPTH, "y"),
+    ("-" * DEPTH + "y", "(-" * DEPTH + "y" + ")" * DEPTH),
+    ("y" + "$k" * DEPTH, "y" + '["k"]' * DEPTH),
+    ("sqrt(" * DEPTH + "2.0" + ")" * DEPTH, "sqrt(" * DEPTH + "2.0" + ")" * DEPTH),
+], ids=["call", "c", "index", "parens", "unary", "dollar", "elementwise"])
+def test_deeply_nested_expressions(source, expected):
+    assert transpile("x <- " + source + "\n") == "x = " + expected
+
+
+def test_deeply_nested_records_passed_to_a_function():
+    depth = 2_000
+    source = "f(" + "list(a = " * depth + "1" + ")" * depth + ")\n"
+    assert transpile(source) == "f(" + 'Dict("a" => ' * depth + "1" + ")" * depth + ")"
+
+
+def test_deep_expression_in_every_mode():
+    deep = "x <- " + "g(" * DEPTH + "y" + ")" * DEPTH + "\nprint(x)\n"
+    expected = transpile(deep)
+    out = io.StringIO()
+    get_transpiler().transpile_stream(io.StringIO(deep), out)
+    assert out.getvalue() == expected
+    assert "g(" * DEPTH in transpile(deep, wrap_main=True)
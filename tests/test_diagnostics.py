@@ -0,0 +1,124 @@
+﻿"""Diagnósticos estruturados e recuperação de erros do parser."""
+import io
+import os
+
+import pytest
+
+from src.batch import transpile_dir
+from src.diagnostics import ILLEGAL_CHARACTER, UNEXPECTED_EOF, UNEXPECTED_TOKEN, Diagnostics
+from src.transpile import Transpiler, transpile
+
+BAD = (
+    "x <- 1\n"
+    "y <- ) 2\n"
+    "z <- x @ 3\n"
+    "f <- function(a) {\n"
+    "  b <- a + )\n"
+    "  return(a)\n"
+    "}\n"
+    "w <- , 4\n"
+    "print(f(z))\n"
+)
+
+
+def _run(source, file="bad.R"):
+    diagnostics = Diagnostics(file)
+    code = Transpiler().transpile(source, diagnostics)
+    return code, [(d.line, d.column, d.code, d.message) for d in diagnostics], diagnostics
+
+
+def test_every_error_is_reported_in_one_pass(capsys):
+    code, found, _ = _run(BAD)
+    assert found == [
+        (2, 6, UNEXPECTED_TOKEN, "Syntax error at token RPAREN (')')"),
+        (3, 8, ILLEGAL_CHARACTER, "Illegal character '@'"),
+        (5, 12, UNEXPECTED_TOKEN, "Syntax error at token RPAREN (')')"),
+        (8, 6, UNEXPECTED_TOKEN, "Syntax error at token COMMA (',')"),
+    ]
+    # nada vai para a saída padrão
+    assert capsys.readouterr().out == ""
+
+
+def test_good_statements_are_still_transpiled():
+    code, _, _ = _run(BAD)
+    assert code.splitlines() == [
+        "x = 1",
+        "z = x",
+        "3",
+        "function f(a)",
+        "    return a",
+        "end",
+        "println(f(z))",
+    ]
+
+
+def test_records_are_structured():
+    _, _, diagnostics = _run("x <- 1\ny <- @\n")
+    d = next(iter(diagnostics))
+    assert d.to_dict() == {"file": "bad.R", "line": 2, "column": 6,
+                           "code": ILLEGAL_CHARACTER, "message": "Illegal character '@'"}
+    assert str(d) == "bad.R:2:6: E001 Illegal character '@'"
+
+
+def test_unexpected_end_of_input():
+    code, found, _ = _run("x <- 1\nf <- function(a) {\n  a\n")
+    assert code == "x = 1"
+    assert found == [(2, 1, UNEXPECTED_EOF, "Syntax error at EOF")]
+
+
+def test_stray_closing_brace_keeps_previous_statements():
+    code, found, _ = _run("x <- 1\n}\ny <- 2\n")
+    assert code == "x = 1\ny = 2"
+    assert [f[2] for f in found] == [UNEXPECTED_TOKEN]
+
+
+def test_many_illegal_characters_do_not_flood_stdout(capsys):
+    code, found, _ = _run("x <- 1\n" + "@ " * 5000 + "\ny <- 2\n")
+    assert code == "x = 1\ny = 2"
+    assert len(found) == 5000
+    assert capsys.readouterr().out == ""
+
+
+def test_without_diagnostics_the_first_error_raises():
+    with pytest.raises(SyntaxError):
+        transpile(BAD)
+
+
+@pytest.mark.parametrize("mode", ["stream", "stats"])
+def test_other_modes_report_the_same(mode):
+    code, found, _ = _run(BAD)
+    diagnostics = Diagnostics("bad.R")
+    if mode == "stream":
+        out = io.StringIO()
+        Transpiler().transpile_stream(io.StringIO(BAD), out, diagnostics)
+        other = out.getvalue()
+    else:
+        other, _stats = Transpiler().transpile_with_stats(BAD, diagnostics=diagnostics)
+    assert other == code
+    # com stats o texto todo passa pelo lexer antes do parser: a ordem em que
+    # os erros são achados muda, a posição de cada um não
+    assert [(d.line, d.column, d.code, d.message) for d in diagnostics.sorted()] == found
+
+
+def test_report_is_sorted_by_position():
+    diagnostics = Diagnostics("a.R")
+    diagnostics.add(UNEXPECTED_TOKEN, "b", 3, 1)
+    diagnostics.add(ILLEGAL_CHARACTER, "a", 1, 5)
+    out = io.StringIO()
+    diagnostics.report(out)
+    assert out.getvalue() == "a.R:1:5: E001 a\na.R:3:1: E002 b\n"
+
+
+def test_batch_keeps_going_and_lists_the_errors(tmp_path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    src.mkdir()
+    (src / "bom.R").write_text("x <- 1\n", encoding="utf-8")
+    (src / "ruim.R").write_text(BAD, encoding="utf-8")
+    lines = []
+    results = transpile_dir(str(src), str(out), jobs=1, report=lines.append)
+    assert [(rel, error) for rel, error, *_ in results] == [
+        ("bom.R", None), ("ruim.R", "4 erro(s) de sintaxe")]
+    assert "[ERRO] ruim.R: 4 erro(s) de sintaxe" in lines
+    assert f"       {os.path.join(str(src), 'ruim.R')}:2:6: E002 Syntax error at token RPAREN (')')" in lines
+    with open(out / "ruim.jl", encoding="utf-8") as f:
+        assert f.read() == _run(BAD)[0]
@@ -0,0 +1,60 @@
+﻿"""
+Saídas de referência dos exemplos: juliaExamples/<nome>.jl (modo normal) e
+juliaExamples/main/<nome>.jl (--main). Depois de uma mudança intencional na
+saída, gere de novo com python -m src.transpile [--main] <exemplo.R> <saída.jl>.
+"""
+import os
+import re
+
+import pytest
+
+from conftest import EXAMPLES, ROOT, read
+from src.transpile import main, transpile
+
+NAMES = [os.path.splitext(os.path.basename(p))[0] for p in EXAMPLES]
+GOLDEN = os.path.join(ROOT, "juliaExamples")
+
+
+def _source(name):
+    return read(os.path.join(ROOT, "RProjectExamples", name + ".R"))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_golden(name):
+    assert transpile(_source(name)) == read(os.path.join(GOLDEN, name + ".jl"))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_golden_main(name):
+    assert transpile(_source(name), wrap_main=True) == read(os.path.join(GOLDEN, "main", name + ".jl"))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_main_leaves_only_definitions_at_global_scope(name):
+    code = read(os.path.join(GOLDEN, "main", name + ".jl"))
+    assert code.endswith("\nend\n\nmain()")
+    outside = code[:code.index("function main()\n")].splitlines()
+    outside += code[code.rindex("\nend\n") + 5:].splitlines()
+    definition = re.compile(r"(function |struct |import |end$|\s|main\(\)$|[^=\s]+\(.*\) = )")
+    for line in outside:
+        assert not line or definition.match(line), line
+    body = code[code.index("function main()\n"):].splitlines()[1:-3]
+    assert all(line.startswith("    ") for line in body if line)
+
+
+def test_cli_main_flag(tmp_path):
+    out = tmp_path / "09.jl"
+    main(["--main", os.path.join(ROOT, "RProjectExamples", "09_funcoes.R"), str(out)])
+    assert out.read_text(encoding="utf-8") == read(os.path.join(GOLDEN, "main", "09_funcoes.jl"))
+
+
+def test_exists_under_main():
+    source = ('x <- 1\nprint(exists("x"))\nprint(exists("nada"))\n'
+              'g <- function() exists("w")\nw <- 2\nprint(g())\n')
+    lines = transpile(source, wrap_main=True).splitlines()
+    # x é local de main(); w é consultada dentro de g e continua global
+    assert "    println(@isdefined(x))" in lines
+    assert '    println(isdefined(Main, Symbol("nada")))' in lines
+    assert "    global w" in lines
+    assert '    isdefined(Main, Symbol("w"))' in lines
+    assert '@isdefined' not in transpile(source)
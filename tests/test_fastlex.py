@@ -0,0 +1,100 @@
+﻿"""FastLexer: mesmo fluxo de tokens do lexer do PLY, mais rápido."""
+import contextlib
+import io
+import random
+import time
+
+import pytest
+
+from src.diagnostics import Diagnostics
+from src.fastlex import FastLexer
+from src.lexer import get_lexer
+from src.transpile import Transpiler
+
+# pedaços para os textos aleatórios: todos os tokens, casos de fronteira
+# (42L, expoente, string de várias linhas, crases) e caracteres ilegais
+_PIECES = [
+    "x", "abc", "a.b", "_y1", "if", "else", "for", "in", "while", "function",
+    "return", "TRUE", "false", "True", "0", "42", "42L", "3.14", "1.5e3",
+    "2.0E-2", "1.", '"s"', '"a\\"b"', "'q'", '"linha\nnova"', "`+.foo`",
+    "`", "<-", "<=", "<", "==", "=", "!=", "!", ">=", ">", "&&", "&", "||",
+    "|", "+", "-", "*", "/", "^", "(", ")", "{", "}", "[", "]", ",", ";",
+    ":", "$", "# comentário", "\n", "\n\n", " ", "\t", "\r\n", "@", "~", "?",
+]
+
+
+def _ply(data):
+    lexer = get_lexer().clone()
+    lexer.lineno = 1
+    lexer.input(data)
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        tokens = [str(t) for t in iter(lexer.token, None)]
+    return tokens, printed.getvalue()
+
+
+def _fast(data):
+    lexer = FastLexer()
+    lexer.input(data)
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        tokens = [str(t) for t in lexer]
+    return tokens, printed.getvalue()
+
+
+def _random_text(rng):
+    return "".join(rng.choice(_PIECES) for _ in range(rng.randrange(1, 30)))
+
+
+def test_examples_lex_like_ply(examples):
+    for name, source in examples.items():
+        assert _fast(source) == _ply(source), name
+
+
+def test_random_texts_lex_like_ply():
+    rng = random.Random(2024)
+    for _ in range(3000):
+        text = _random_text(rng)
+        assert _fast(text) == _ply(text), repr(text)
+
+
+@pytest.mark.parametrize("text", [
+    "", " ", "\n", "x <- 1   ", "42L", "1.5e-3", "`+.foo` <- 1",
+    '"a\nb"\nx', "a # comentário\nb", "x @ y", "TRUE FALSE true",
+], ids=["empty", "space", "newline", "trailing", "long", "exponent", "backtick",
+        "multiline", "comment", "illegal", "bools"])
+def test_edge_cases_lex_like_ply(text):
+    assert _fast(text) == _ply(text)
+
+
+def test_illegal_characters_go_to_diagnostics():
+    diagnostics = Diagnostics()
+    lexer = FastLexer()
+    lexer.diagnostics = diagnostics
+    lexer.input("x <- 1\ny @ 2\n")
+    assert [t.type for t in lexer] == ["ID", "ASSIGN_ARROW", "INT_LITERAL", "NEWLINE",
+                                       "ID", "INT_LITERAL", "NEWLINE"]
+    assert [(d.message, d.line, d.column) for d in diagnostics] == [("Illegal character '@'", 2, 3)]
+
+
+def test_transpile_is_the_same_with_either_lexer(examples):
+    for name, source in examples.items():
+        assert Transpiler().transpile(source) == Transpiler(get_lexer()).transpile(source), name
+
+
+def test_tokens_per_second(examples):
+    # os exemplos repetidos, nos dois lexers; melhor de 3 rodadas alternadas
+    data = "\n".join(examples.values())
+    data = data * (300_000 // len(data) + 1)
+    best = {"PLY": float("inf"), "FastLexer": float("inf")}
+    count = {}
+    for _ in range(3):
+        for name, lexer in (("PLY", get_lexer().clone()), ("FastLexer", FastLexer())):
+            start = time.perf_counter()
+            lexer.input(data)
+            count[name] = sum(1 for _ in iter(lexer.token, None))
+            best[name] = min(best[name], time.perf_counter() - start)
+    assert count["PLY"] == count["FastLexer"]
+    rates = {name: count[name] / seconds for name, seconds in best.items()}
+    print(f"\ntokens/s: PLY {rates['PLY']:,.0f}, FastLexer {rates['FastLexer']:,.0f}")
+    assert rates["FastLexer"] > rates["PLY"] * 1.1
@@ -0,0 +1,223 @@
+﻿"""Vetores que crescem em laços: push!/append! e pré-alocação (ver growth.py)."""
+import time
+
+import pytest
+
+from src import growth
+from src.transpile import Transpiler, transpile
+from src.typeinfer import infer_types
+
+LOOPS = "08_comandos_repeticao"
+
+
+def nested_fors(depth, width=20):
+    lines = []
+    for d in range(depth):
+        lines.append(f"for (i{d} in 1:3) {{")
+        lines.extend(f"y{k} <- y{k} + i{d}" for k in range(width))
+    lines.extend("}" * depth)
+    return "\n".join(lines) + "\n"
+
+
+def _loop_plans(source):
+    program = Transpiler().parse(source)
+    infer_types(program)
+    return [s.body.growth for s in program.stmts if hasattr(s, "body")]
+
+
+def test_loop_examples_are_not_rewritten(examples):
+    assert _loop_plans(examples[LOOPS]) == [None, None]
+
+
+def test_growth_in_the_example_loops(examples):
+    source = "v <- c()\n" + examples[LOOPS].replace("print(i)", "v <- c(v, i)")
+    assert transpile(source).splitlines() == [
+        "v = Int[]",
+        "sizehint!(v, 3)",
+        "for i in 1:3",
+        "    push!(v, i)",
+        "end",
+        "i = 1",
+        "v = copy(v)",
+        "let i = i, v = v",
+        "    while (i <= 3)",
+        "        push!(v, i)",
+        "        i = (i + 1)",
+        "    end",
+        "end",
+    ]
+
+
+def test_indexed_store_in_the_example_for_is_preallocated(examples):
+    source = "v <- c()\n" + examples[LOOPS].replace("print(i)", "v[i] <- i * 2")
+    lines = transpile(source).splitlines()
+    assert lines[:4] == [
+        "v = Vector{Int}(undef, 3)",
+        "for i in 1:3",
+        "    v[i] = (i * 2)",
+        "end",
+    ]
+
+
+@pytest.mark.parametrize("loop, expected", [
+    # trip count conhecido pelo range do for
+    ("v <- c()\nn <- 5\nfor (i in 1:n) {\n  v <- c(v, i)\n}\n",
+     ["v = Any[]", "n = 5", "v = Int[]", "sizehint!(v, n)", "for i in 1:n", "    push!(v, i)", "end"]),
+    # vetor já preenchido: só reserva espaço
+    ("v <- c(1, 2)\nfor (i in 1:3) {\n  v <- c(v, i)\n}\n",
+     ["v = Int[1, 2]", "v = copy(v)", "sizehint!(v, length(v) + 3)", "for i in 1:3",
+      "    push!(v, i)", "end"]),
+    ("v <- c(1, 2)\nfor (i in 1:3) {\n  v <- c(v, c(i, i))\n}\n",
+     ["v = Int[1, 2]", "v = copy(v)", "sizehint!(v, length(v) + 3)", "for i in 1:3",
+      "    append!(v, Int[i, i])", "end"]),
+    # range que não começa em 1: push! sem sizehint!
+    ("v <- c(1)\nfor (i in 2:5) {\n  v <- c(v, i)\n}\n",
+     ["v = Int[1]", "v = copy(v)", "for i in 2:5", "    push!(v, i)", "end"]),
+], ids=["count", "hint", "append", "no-count"])
+def test_growth_rewrites(loop, expected):
+    assert transpile(loop).splitlines() == expected
+
+
+@pytest.mark.parametrize("loop", [
+    # o vetor mudaria de tipo (Int[] não recebe 2.5)
+    "v <- c(1, 2)\nfor (i in 1:3) {\n  v <- c(v, 2.5)\n}\n",
+    # v também é reatribuído de outro jeito no laço
+    "v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n  v <- v\n}\n",
+    # lido inteiro no laço: a pré-alocação mudaria o que é impresso
+    "v <- c()\nfor (i in 1:3) {\n  v[i] <- i\n  print(v)\n}\n",
+    # índices a partir de 2: Vector{T}(undef, n) teria o tamanho errado
+    "v <- c()\nfor (i in 2:3) {\n  v[i] <- i\n}\n",
+    # índice que não é a variável do laço
+    "v <- c()\nfor (i in 1:3) {\n  v[j] <- i\n}\n",
+    # o laço pode parar antes: em R o vetor fica com 3 elementos
+    "v <- c()\nfor (i in 1:10) {\n  if (i > 3) break\n  v[i] <- i\n}\nprint(v)\n",
+    # escrita condicional: em R v[1] e v[2] são NA, não memória sem valor
+    "v <- c()\nfor (i in 1:10) {\n  if (i > 2) v[i] <- i\n}\nprint(v)\n",
+    "v <- c()\nfor (i in 1:10) {\n  if (i > 3) next\n  v[i] <- i\n}\n",
+    "f <- function() {\n  v <- c()\n  for (i in 1:10) {\n    if (i > 3) return(v)\n    v[i] <- i\n  }\n  v\n}\n",
+], ids=["retype", "reassigned", "read", "offset", "other-index", "break", "conditional",
+        "next", "return"])
+def test_unsafe_loops_are_kept(loop):
+    assert _loop_plans(loop) == [None]
+    code = transpile(loop)
+    assert "push!" not in code and "undef" not in code and "sizehint!" not in code
+
+
+def test_nested_loops_push_into_the_outer_vector():
+    code = transpile("v <- c()\nfor (i in 1:3) {\n  for (j in 1:2) {\n    v <- c(v, i * j)\n  }\n}\n")
+    assert code.splitlines() == [
+        "v = Int[]",
+        "sizehint!(v, 3)",
+        "for i in 1:3",
+        "    sizehint!(v, length(v) + 2)",
+        "    for j in 1:2",
+        "        push!(v, (i * j))",
+        "    end",
+        "end",
+    ]
+
+
+def test_existing_vector_is_copied_before_push():
+    # w é o mesmo vetor que v: push! no lugar mudaria w também (em R, não)
+    code = transpile("v <- c(1, 2)\nw <- v\nfor (i in 1:3) {\n  v <- c(v, i)\n}\nprint(w)\n")
+    assert code.splitlines() == [
+        "v = Int[1, 2]",
+        "w = v",
+        "v = copy(v)",
+        "sizehint!(v, length(v) + 3)",
+        "for i in 1:3",
+        "    push!(v, i)",
+        "end",
+        "println(w)",
+    ]
+
+
+@pytest.mark.parametrize("loop", [
+    "v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n  if (i == 1) w <- v\n}\n",
+    "v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n  l <- list(a = v)\n}\n",
+    "v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n  g(v)\n}\n",
+], ids=["assign", "list", "call"])
+def test_vector_kept_by_another_name_in_the_loop_is_not_pushed(loop):
+    assert _loop_plans(loop) == [None]
+    assert "push!" not in transpile(loop)
+
+
+def test_reads_that_do_not_keep_the_vector_still_push():
+    code = transpile("v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n  print(length(v) + v[1])\n"
+                     "  s <- sum(v * 2)\n}\n")
+    assert "    push!(v, i)" in code.splitlines()
+
+
+def test_empty_vector_recreated_by_the_loop_is_not_emitted():
+    source = "v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n}\n"
+    assert transpile(source).splitlines()[0] == "v = Int[]"
+    # só quando o laço vem logo depois: aqui v = Any[] é usado antes
+    kept = "v <- c()\nprint(v)\nfor (i in 1:3) {\n  v <- c(v, i)\n}\n"
+    assert transpile(kept).splitlines()[:3] == ["v = Any[]", "println(v)", "v = Int[]"]
+    # o mesmo dentro de uma função e em main()
+    code = transpile("f <- function() {\n" + source + "v\n}\n")
+    assert "v = Any[]" not in code and "    v = Int[]" in code
+    code = transpile(source, wrap_main=True)
+    assert "v = Any[]" not in code and "    v = Int[]" in code
+
+
+def test_named_store_converts_once_before_the_loop():
+    code = transpile('v <- c(1, 2)\nfor (i in 1:3) {\n  v["k"] <- i\n}\n')
+    lines = code.splitlines()
+    assert lines[1].startswith("v = Dict{String,Any}(")
+    assert lines[2:] == ["for i in 1:3", '    v["k"] = i', "end"]
+
+
+def test_named_store_in_a_branch_converts_only_there():
+    code = transpile('v <- c(1, 2)\nif (flag) {\n  v["k"] <- 3\n}\nprint(v[1])\n')
+    assert code.splitlines() == [
+        "v = Int[1, 2]",
+        "if flag",
+        "    v = Dict{String,Any}(string(i) => x for (i, x) in pairs(v))",
+        '    v["k"] = 3',
+        "end",
+        # sem flag, v continua vetor e v[1] é o primeiro elemento
+        "println(v[1])",
+    ]
+
+
+def test_store_after_a_branch_converts_only_if_needed():
+    code = transpile('v <- c(1, 2)\nif (flag) {\n  v["k"] <- 3\n}\nv["z"] <- 1\nv["w"] <- 2\n')
+    assert code.splitlines()[-3:] == [
+        "v isa AbstractDict || (v = Dict{String,Any}(string(i) => x for (i, x) in pairs(v)))",
+        'v["z"] = 1',
+        'v["w"] = 2',
+    ]
+
+
+def test_store_in_a_branch_inside_a_loop_is_hoisted_out_of_the_loop():
+    code = transpile('v <- c(1, 2)\nfor (i in 1:3) {\n  if (i > 1) {\n    v["k"] <- i\n  }\n}\n')
+    lines = code.splitlines()
+    assert lines[1].startswith("v = Dict{String,Any}(")
+    assert code.count("Dict{String,Any}(") == 1
+    assert lines[2:] == ["for i in 1:3", "    if (i > 1)", '        v["k"] = i', "    end", "end"]
+
+
+def test_each_block_is_summarized_once(monkeypatch):
+    # os laços aninhados reaproveitam o resumo dos blocos de dentro: cada
+    # atribuição é examinada uma vez, e não uma vez por nível acima dela
+    program = Transpiler().parse(nested_fors(50))
+    calls = []
+    is_growth = growth._is_growth
+    monkeypatch.setattr(growth, "_is_growth", lambda s, n: calls.append(s) or is_growth(s, n))
+    infer_types(program)
+    assert len(calls) == 50 * 20
+
+
+def test_nested_typing_is_linear():
+    per_stmt = []
+    for depth in (25, 100):
+        program = Transpiler().parse(nested_fors(depth))
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            infer_types(program)
+            best = min(best, time.perf_counter() - start)
+        per_stmt.append(best / depth)
+    print(f"\nµs por nível: {per_stmt[0] * 1e6:.0f} (25 níveis), {per_stmt[1] * 1e6:.0f} (100 níveis)")
+    assert per_stmt[1] < per_stmt[0] * 2.5
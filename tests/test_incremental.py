@@ -0,0 +1,129 @@
+﻿"""Transpilação incremental: cada edição dá a mesma saída que transpile()."""
+import io
+import random
+
+import pytest
+
+from src.diagnostics import Diagnostics
+from src.incremental import IncrementalTranspiler
+from src.transpile import get_transpiler, transpile
+
+
+def _expected(text):
+    out = io.StringIO()
+    get_transpiler().transpile_stream(text.splitlines(keepends=True), out, Diagnostics())
+    return out.getvalue()
+
+
+def _edit(inc, old, new, count=1):
+    # troca a `count`-ésima ocorrência de old por new
+    pos = -1
+    for _ in range(count):
+        pos = inc.text.index(old, pos + 1)
+    return inc.update(pos, pos + len(old), new)
+
+
+def test_initial_text_matches_transpile(examples):
+    for name, source in examples.items():
+        assert IncrementalTranspiler(source).julia == transpile(source), name
+
+
+def test_random_line_edits(examples):
+    lines = [line + "\n" for source in examples.values() for line in source.splitlines()
+             if line and not line[0].isspace() and line.count("(") == line.count(")")
+             and "{" not in line and "}" not in line]
+    text = "".join(examples.values()) * 3
+    inc = IncrementalTranspiler(text)
+    rng = random.Random(1)
+    for _ in range(80):
+        # troca linhas inteiras (entre fronteiras) por comandos de uma linha
+        a = inc.text.rfind("\n", 0, rng.randrange(len(inc.text))) + 1
+        b = inc.text.find("\n", min(len(inc.text) - 1, a + rng.randrange(60)))
+        b = len(inc.text) if b < 0 else b + 1
+        inc.update(a, b, rng.choice(lines))
+        assert inc.julia == _expected(inc.text)
+
+
+def test_typing_character_by_character():
+    text = "x <- 10\ny <- x + 1\nf <- function(a) {\n  return(a * x)\n}\nz <- f(2)\n"
+    inc = IncrementalTranspiler(text)
+    pos = text.index("z <-")
+    for c in "w <- f(x, 2.5)\n":
+        inc.update(pos, pos, c)
+        pos += 1
+        assert inc.julia == _expected(inc.text)
+
+
+def test_type_change_reaches_later_statements():
+    text = "x <- 10\n" + "a <- 1\n" * 50 + "v <- c(x, x)\nprint(v)\n"
+    inc = IncrementalTranspiler(text)
+    assert "v = Int[x, x]" in inc.julia
+    _edit(inc, "10", "10.5")
+    assert "v = Float64[x, x]" in inc.julia
+    assert inc.julia == transpile(inc.text)
+
+
+@pytest.mark.parametrize("op", ["+", "=="])
+def test_renaming_a_class_recreates_structs(op):
+    # o método S3 usa o struct Foo criado por structure(); ao renomear a
+    # classe, é ele que passa a criar o struct (nome diferente do de Foo)
+    text = f'obj <- structure(1, class="foo")\n`{op}.foo` <- function(a, b) {{ "soma" }}\n'
+    inc = IncrementalTranspiler(text)
+    assert inc.julia == transpile(text)
+    _edit(inc, '"foo"', '"bar"')
+    assert "struct Foo{T}" in inc.julia
+    assert inc.julia == transpile(inc.text)
+    _edit(inc, '"bar"', '"foo"')
+    assert inc.julia.count("struct Foo{T}") == 1
+    assert inc.julia == transpile(inc.text)
+
+
+def test_renaming_the_method_class():
+    text = ('`+.foo` <- function(a, b) { "soma" }\n'
+            + "a <- 1\n" * 20
+            + 'obj <- structure(1, class="foo")\n')
+    inc = IncrementalTranspiler(text)
+    assert inc.julia == transpile(text)
+    _edit(inc, "+.foo", "+.bar")
+    assert inc.julia == transpile(inc.text)
+    assert inc.julia.count("struct Foo{T}") == 1
+
+
+def test_empty_vector_follows_the_next_statement():
+    # v = Any[] só é gerado se o comando seguinte não é o laço que recria v
+    text = "v <- c()\n# comentário\nfor (i in 1:3) {\n  v <- c(v, i)\n}\n"
+    inc = IncrementalTranspiler(text)
+    assert inc.julia == transpile(text) and "v = Any[]" not in inc.julia
+    _edit(inc, "# comentário\n", "print(v)\n")
+    assert inc.julia == transpile(inc.text) and "v = Any[]" in inc.julia
+    _edit(inc, "print(v)\n", "")
+    assert inc.julia == transpile(inc.text) and "v = Any[]" not in inc.julia
+
+
+def test_diagnostics_follow_the_edits():
+    inc = IncrementalTranspiler("x <- 1\ny <- 2\nz <- 3\n")
+    assert not len(inc.diagnostics)
+    _edit(inc, "2", ") 2")
+    assert [(d.line, d.column) for d in inc.diagnostics] == [(2, 6)]
+    inc.update(0, 0, "a <- 0\n\n")
+    assert [d.line for d in inc.diagnostics] == [4]
+    assert inc.julia == "a = 0\nx = 1\nz = 3"
+    _edit(inc, ") 2", "2")
+    assert not len(inc.diagnostics)
+    assert inc.julia == transpile(inc.text)
+
+
+def test_set_text_and_statements(examples):
+    source = next(iter(examples.values()))
+    inc = IncrementalTranspiler("x <- 1\n")
+    assert inc.set_text(source) == transpile(source)
+    assert len(inc.statements) == len(get_transpiler().parse(source).stmts)
+    assert inc.set_text("") == ""
+
+
+def test_invalid_usage():
+    inc = IncrementalTranspiler("x <- 1\n")
+    with pytest.raises(ValueError):
+        inc.update(3, 100, "")
+    with pytest.raises(ValueError):
+        IncrementalTranspiler("x <- 1\n", wrap_main=True)
@@ -0,0 +1,139 @@
+﻿"""Um arquivo em vários processos: saída idêntica, byte a byte, à serial."""
+import mmap
+
+import pytest
+
+import src.parallel as parallel
+from src.diagnostics import Diagnostics
+from src.parallel import find_chunks, transpile_file_parallel
+from src.transpile import Transpiler, transpile
+
+# um struct criado em mais de um trecho e tipos que atravessam os cortes
+STRUCTS = (
+    'obj <- structure(list(a=1), class="foo")\n'
+    "n <- 3\n"
+    "v <- c(1, 2)\n"
+    "for (i in 1:n) {\n"
+    "  v[i] <- i * 2\n"
+    "}\n"
+    "# comentário entre comandos\n"
+    "\n"
+    'other <- structure(list(a=2), class="foo")\n'
+    "w <- v + n\n"
+    'last <- structure(list(b=1), class="bar")\n'
+    "print(w)\n"
+)
+
+
+def _write(tmp_path, source, name="big.R", newline=None):
+    path = tmp_path / name
+    with open(path, "w", encoding="utf-8", newline=newline) as f:
+        f.write(source)
+    return str(path)
+
+
+@pytest.fixture
+def chunked(monkeypatch):
+    """Registra quantos trechos cada chamada de find_chunks gerou."""
+    counts = []
+    original = find_chunks
+
+    def spy(buf, parts):
+        chunks = original(buf, parts)
+        counts.append(len(chunks))
+        return chunks
+
+    monkeypatch.setattr(parallel, "find_chunks", spy)
+    return counts
+
+
+def test_find_chunks_cuts_between_statements(examples, tmp_path):
+    source = "\n".join(examples.values()) + "\n"
+    path = _write(tmp_path, source)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        chunks = find_chunks(mm, 8)
+        data = mm[:]
+    assert len(chunks) == 8
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+    for (_s, end, _l), (start, _e, _l2) in zip(chunks, chunks[1:]):
+        assert end == start
+    tr = Transpiler()
+    for start, end, lineno in chunks:
+        assert lineno == data[:start].count(b"\n") + 1
+        text = data[start:end].decode("utf-8")
+        # cada trecho é uma sequência de comandos completos
+        diagnostics = Diagnostics()
+        tr.parse(text, lineno, diagnostics)
+        assert not len(diagnostics), (lineno, list(diagnostics))
+        assert text.lstrip()[:1] not in ("", "#")
+
+
+def test_examples_match_serial(examples, tmp_path, chunked):
+    for name, source in examples.items():
+        path = _write(tmp_path, source, name + ".R")
+        assert transpile_file_parallel(path, workers=4, min_chunk=1) == transpile(source), name
+    # todos cortados em mais de um trecho
+    assert min(chunked) >= 2
+
+
+def test_large_file_matches_serial(examples, tmp_path, chunked):
+    source = ("\n".join(examples.values()) + "\n") * 10
+    path = _write(tmp_path, source)
+    assert transpile_file_parallel(path, workers=6, min_chunk=1) == transpile(source)
+    assert chunked == [6]
+
+
+def test_structs_are_created_once(tmp_path, chunked):
+    path = _write(tmp_path, STRUCTS)
+    expected = transpile(STRUCTS)
+    for workers in (2, 3, 4):
+        code = transpile_file_parallel(path, workers=workers, min_chunk=1)
+        assert code == expected, workers
+    assert code.count("struct Foo{T}") == 1 and code.count("struct Bar{T}") == 1
+    assert chunked == [2, 3, 4]
+
+
+def test_empty_vector_before_a_loop_in_the_next_chunk(tmp_path):
+    # `v <- c()` no fim de um trecho some se o trecho seguinte começa pelo
+    # laço que recria v, como em transpile()
+    source = ("v <- c()\nfor (i in 1:3) {\n  v <- c(v, i)\n}\n"
+              "w <- c()\nprint(w)\n") * 20
+    path = _write(tmp_path, source)
+    expected = transpile(source)
+    assert "v = Any[]" not in expected and expected.count("w = Any[]") == 20
+    for workers in (2, 3, 5, 8, 13):
+        assert transpile_file_parallel(path, workers=workers, min_chunk=1) == expected, workers
+
+
+def test_crlf_input(examples, tmp_path, chunked):
+    source = "\n".join(examples.values()) + "\n"
+    path = _write(tmp_path, source, newline="\r\n")
+    assert transpile_file_parallel(path, workers=4, min_chunk=1) == transpile(source)
+    assert chunked == [4]
+
+
+def test_syntax_error_falls_back_to_serial(examples, tmp_path, capsys):
+    source = "\n".join(examples.values()) + "\ny <- ) 2\nz <- 1\n"
+    path = _write(tmp_path, source)
+    serial = Diagnostics(path)
+    expected = Transpiler().transpile(source, serial)
+    found = Diagnostics(path)
+    assert transpile_file_parallel(path, found, workers=4, min_chunk=1) == expected
+    assert [str(d) for d in found] == [str(d) for d in serial] and len(found) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_small_files_stay_serial(tmp_path, monkeypatch):
+    def fail(*args):
+        raise AssertionError("não deveria iniciar processos")
+
+    monkeypatch.setattr(parallel, "_run_chunks", fail)
+    path = _write(tmp_path, STRUCTS)
+    assert transpile_file_parallel(path, workers=4) == transpile(STRUCTS)
+    assert transpile_file_parallel(path, workers=1, min_chunk=1) == transpile(STRUCTS)
+
+
+def test_wrap_main_is_rejected(tmp_path):
+    path = _write(tmp_path, STRUCTS)
+    with pytest.raises(ValueError):
+        transpile_file_parallel(path, workers=2, min_chunk=1, wrap_main=True)
@@ -0,0 +1,47 @@
+﻿"""Parser: listas montadas no lugar (tempo linear no nº de itens)."""
+import time
+
+from src.transpile import Transpiler
+
+
+def _seconds_per_item(parse, make, n):
+    source = make(n)
+    best = float("inf")
+    for _ in range(3 if n <= 10_000 else 1):
+        t0 = time.perf_counter()
+        parse(source)
+        best = min(best, time.perf_counter() - t0)
+    return best / n
+
+
+def _assert_linear(make, sizes, parse=None):
+    parse = parse or Transpiler().parse
+    per_item = [_seconds_per_item(parse, make, n) for n in sizes]
+    # p[1] + [novo] dá custo por item proporcional a n (10x a cada tamanho);
+    # com folga para o coletor de lixo e ruído, exige no máximo 3x
+    for small, big in zip(per_item, per_item[1:]):
+        assert big < small * 3, per_item
+
+
+def test_statements_scale_linearly():
+    make = lambda n: "x <- 1\n" * n
+    _assert_linear(make, (1_000, 10_000, 100_000))
+
+
+def test_arguments_scale_linearly():
+    make = lambda n: "v <- c(" + ", ".join(map(str, range(n))) + ")\n"
+    _assert_linear(make, (1_000, 10_000, 100_000))
+
+
+def test_parameters_scale_linearly():
+    make = lambda n: ("f <- function(" + ", ".join(f"p{i}" for i in range(n))
+                      + ") {\n  return(p0)\n}\n")
+    _assert_linear(make, (1_000, 10_000, 100_000))
+
+
+def test_lists_keep_order():
+    program = Transpiler().parse("f <- function(a, b, c) {\n  g(1, 2, 3)\n}\nx <- 1\ny <- 2\n")
+    func, x, y = program.stmts
+    assert func.params == ["a", "b", "c"]
+    assert [a.value for a in func.body.stmts[0].expr.args] == [1, 2, 3]
+    assert (x.name, y.name) == ("x", "y")
@@ -0,0 +1,86 @@
+﻿"""Análise de escopo: conjuntos de cada bloco calculados numa passada só."""
+import time
+
+from src import scope
+from src.codegen import JuliaCodeGen
+from src.scope import analyze_scopes, assigned_vars, function_exists_names, function_free_vars
+from src.transpile import Transpiler
+
+
+def nested_whiles(depth, width=20):
+    lines = []
+    for d in range(depth):
+        lines.append(f"while (c{d} < 10) {{")
+        lines.append(f"c{d} <- c{d} + 1")
+        lines.extend(f"y{k} <- y{k} + c{d}" for k in range(width))
+    lines.extend("}" * depth)
+    return "\n".join(lines) + "\n"
+
+
+def test_assigned_and_read_sets():
+    program = Transpiler().parse(
+        "x <- a + 1\n"
+        "if (x > 0) {\n  y <- b\n} else {\n  while (z < 3) {\n    z <- z + w\n  }\n}\n"
+        "f <- function(p) {\n  q <- p + g\n  return(q + x)\n}\n")
+    root = analyze_scopes(program)
+    assert root.assigned == {"x", "y", "z"}  # f é FunctionDecl, não Assign
+    assert root.reads == {"a", "x", "b", "z", "w"}
+    cond = program.stmts[1]
+    assert cond.then_block.assigned == {"y"}
+    assert cond.else_block.reads == {"z", "w"}
+    func = program.stmts[2]
+    assert func.body.assigned == {"q"}
+    assert func.body.reads == {"p", "g", "q", "x"}
+    assert function_free_vars(program.stmts) == {"g", "x"}
+
+
+def test_exists_names_inside_functions():
+    program = Transpiler().parse(
+        'a <- exists("fora")\n'
+        'f <- function() {\n  if (exists("u")) {\n    return(exists(paste0("v")))\n  }\n'
+        '  g <- function() print(exists("w"))\n}\n')
+    # só literais, e só dentro de funções (inclusive aninhadas)
+    assert function_exists_names(program.stmts) == {"u", "w"}
+
+
+def test_each_statement_is_walked_once(monkeypatch):
+    program = Transpiler().parse(nested_whiles(50))
+    calls = []
+    collect = scope._collect_reads
+    monkeypatch.setattr(scope, "_collect_reads",
+                        lambda exprs, reads: (calls.append(1), collect(exprs, reads)))
+    JuliaCodeGen().generate(program)
+    # uma vez por comando dentro dos laços: as 21 atribuições de cada corpo
+    # e os 49 while aninhados (o de fora está no programa, não num corpo)
+    assert len(calls) == 50 * 21 + 49
+
+
+def test_nested_loops_benchmark():
+    # com um percurso por laço (o _assigned_vars antigo) o custo por comando
+    # cresce com a profundidade: 4x de 25 para 100 níveis
+    per_stmt = []
+    for depth in (25, 100):
+        program = Transpiler().parse(nested_whiles(depth))
+        best = float("inf")
+        for _ in range(3):
+            for block in _blocks(program):
+                block.assigned = block.reads = None
+            t0 = time.perf_counter()
+            analyze_scopes(program)
+            for block in _blocks(program):
+                assigned_vars(block)
+            best = min(best, time.perf_counter() - t0)
+        per_stmt.append(best / (depth * 22))
+    print(f"\nanálise de escopo por comando: {per_stmt[0] * 1e6:.1f} µs (25 níveis), "
+          f"{per_stmt[1] * 1e6:.1f} µs (100 níveis)")
+    assert per_stmt[1] < per_stmt[0] * 2
+
+
+def _blocks(program):
+    stmts = list(program.stmts)
+    while stmts:
+        stmt = stmts.pop()
+        body = getattr(stmt, "body", None)
+        if body is not None:
+            yield body
+            stmts.extend(body.stmts)
@@ -0,0 +1,56 @@
+﻿"""Partida a frio: lexer e parser montados só no primeiro uso, das tabelas prontas."""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from conftest import ROOT
+
+SRC = os.path.join(ROOT, "src")
+
+
+def _python(code):
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def _median_seconds(code, runs=7):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        _python(code)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def test_import_does_not_build_lexer_or_parser():
+    out = _python("import sys, src.transpile, src.lexer, src.parser\n"
+                  "print('ply' in sys.modules, src.lexer._lexer, src.parser._parser)")
+    assert out.split() == ["False", "None", "None"]
+
+
+def test_parser_build_writes_nothing_next_to_the_code():
+    before = {f: os.path.getmtime(os.path.join(SRC, f)) for f in os.listdir(SRC)}
+    _python("from src.transpile import transpile\n"
+            "from src.lexer import get_lexer\n"
+            "get_lexer()\n"
+            "transpile('x <- 1')")
+    after = {f: os.path.getmtime(os.path.join(SRC, f)) for f in os.listdir(SRC)
+             if f != "__pycache__"}
+    before.pop("__pycache__", None)
+    assert after == before
+
+
+def test_cold_start_benchmark():
+    # o import preguiçoso contra o que o import fazia antes: montar o lexer e
+    # validar a gramática (optimize=0) logo ao carregar o módulo
+    lazy = _median_seconds("import src.transpile")
+    eager = _median_seconds("import src.transpile, src.lexer, ply.lex\n"
+                            "from src.parser import build_parser\n"
+                            "ply.lex.lex(module=src.lexer)\n"
+                            "build_parser(optimize=0)")
+    bare = _median_seconds("pass")
+    print(f"\npartida a frio: python {bare * 1000:.0f} ms, import src.transpile "
+          f"{lazy * 1000:.0f} ms, com lexer e parser montados {eager * 1000:.0f} ms")
+    assert lazy < eager
@@ -0,0 +1,101 @@
+﻿"""Medidas por fase (transpile_with_stats) e as opções --profile/--profile-codegen."""
+import json
+import pstats
+
+import pytest
+
+from src.ast_nodes import Program
+from src.diagnostics import Diagnostics
+from src.stats import TranspileStats, count_nodes
+from src.transpile import main, transpile, transpile_with_stats
+
+SMALL = "x <- 1 + 2\nprint(x)\n"
+
+
+def test_same_code_as_transpile(examples):
+    for name, source in examples.items():
+        assert transpile_with_stats(source)[0] == transpile(source), name
+
+
+@pytest.mark.parametrize("options", [{}, {"wrap_main": True}])
+def test_same_code_with_options(examples, options):
+    source = examples[sorted(examples)[0]]
+    assert transpile_with_stats(source, **options)[0] == transpile(source, **options)
+
+
+def test_counts_on_a_small_input():
+    code, stats = transpile_with_stats(SMALL)
+    assert stats.source_bytes == len(SMALL)
+    # x <- 1 + 2 NEWLINE print ( x ) NEWLINE
+    assert stats.tokens == 11
+    # Program, Assign, BinaryOp, 2 IntLiteral, ExprStmt, Call, Var
+    assert stats.nodes == 8
+    assert stats.output_bytes == len(code.encode("utf-8"))
+    assert stats.total_seconds == pytest.approx(
+        stats.lex_seconds + stats.parse_seconds + stats.codegen_seconds)
+    assert min(stats.lex_seconds, stats.parse_seconds, stats.codegen_seconds) >= 0
+
+
+def test_bytes_are_utf8():
+    _, stats = transpile_with_stats('s <- "ação"\n')
+    assert stats.source_bytes == len('s <- "ação"\n'.encode("utf-8"))
+
+
+def test_count_nodes():
+    assert count_nodes(Program([])) == 1
+    assert count_nodes([]) == 0
+
+
+def test_diagnostics_are_collected():
+    source = "x <- 1\ny <- ) 2\n"
+    diagnostics, expected = Diagnostics("x.R"), Diagnostics("x.R")
+    code, stats = transpile_with_stats(source, diagnostics=diagnostics)
+    assert code == transpile(source, expected)
+    assert [str(d) for d in diagnostics] == [str(d) for d in expected]
+    assert len(diagnostics) == 1
+    assert stats.nodes > 1
+
+
+def test_to_dict_keys():
+    d = TranspileStats().to_dict()
+    assert set(d) == {"source_bytes", "total_seconds", "phases"}
+    assert d["phases"] == {
+        "lex": {"seconds": 0.0, "tokens": 0},
+        "parse": {"seconds": 0.0, "nodes": 0},
+        "codegen": {"seconds": 0.0, "output_bytes": 0},
+    }
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / "small.R"
+    path.write_text(SMALL, encoding="utf-8")
+    return path
+
+
+def test_profile_writes_json(script, tmp_path, capsys):
+    out, report = tmp_path / "small.jl", tmp_path / "perfil.json"
+    main([str(script), str(out), "--profile", str(report)])
+    assert out.read_text(encoding="utf-8") == transpile(SMALL)
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert set(data) == {"file", "source_bytes", "total_seconds", "phases", "diagnostics"}
+    assert data["file"] == str(script)
+    assert data["diagnostics"] == []
+    assert data["phases"]["lex"]["tokens"] == 11
+    assert data["phases"]["parse"]["nodes"] == 8
+    assert set(data["phases"]["codegen"]) == {"seconds", "output_bytes"}
+    assert "Perfil por fase salvo em" in capsys.readouterr().out
+
+
+def test_profile_codegen_loads_in_pstats(script, tmp_path):
+    out, prof = tmp_path / "small.jl", tmp_path / "codegen.prof"
+    main([str(script), str(out), "--profile-codegen", str(prof)])
+    assert out.read_text(encoding="utf-8") == transpile(SMALL)
+    stats = pstats.Stats(str(prof))
+    assert any(func[2] == "generate" for func in stats.stats)
+
+
+@pytest.mark.parametrize("flag", ["--stream", "--parallel"])
+def test_profile_rejects_other_modes(script, tmp_path, flag):
+    with pytest.raises(SystemExit):
+        main([str(script), str(tmp_path / "o.jl"), "--profile", str(tmp_path / "p.json"), flag])
@@ -0,0 +1,59 @@
+﻿"""Streaming: mesma saída que transpile() e memória que não cresce com a entrada."""
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+from src.transpile import get_transpiler, transpile
+
+# pico de RSS do processo, em KiB: VmHWM é do espaço de endereços novo (o
+# ru_maxrss do Linux herda o pico do processo que fez o fork, aqui o pytest)
+_PEAK_RSS = """
+import sys
+from src.transpile import get_transpiler
+with open(sys.argv[1], encoding='utf-8') as fin, open(sys.argv[2], 'w', encoding='utf-8') as fout:
+    get_transpiler().transpile_stream(fin, fout)
+with open('/proc/self/status') as f:
+    print(next(line.split()[1] for line in f if line.startswith('VmHWM:')))
+"""
+
+
+def _stream(source):
+    out = io.StringIO()
+    get_transpiler().transpile_stream(io.StringIO(source), out)
+    return out.getvalue()
+
+
+def test_stream_matches_transpile(examples):
+    for name, source in examples.items():
+        assert _stream(source) == transpile(source), name
+    source = "\n".join(examples.values())
+    assert _stream(source) == transpile(source)
+
+
+# registros lidos por uma função: cada atribuição é marcada em
+# TypeInference.escaped, que não pode guardar os comandos já gerados
+RECORDS_HEAD = "f <- function() {\n  return(x$a)\n}\n"
+RECORDS = "x <- list(a = 1, b = 2)\n"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="precisa de /proc (Linux)")
+@pytest.mark.parametrize("kind", ["examples", "records"])
+def test_peak_rss_stays_flat(examples, tmp_path, kind):
+    if kind == "examples":
+        head, base = "", "\n".join(examples.values()) + "\n"
+    else:
+        head, base = RECORDS_HEAD, RECORDS
+    peaks = []
+    for size in (512 * 1024, 2 * 1024 * 1024):
+        src = tmp_path / f"{size}.R"
+        src.write_text(head + base * (size // len(base)), encoding="utf-8")
+        out = subprocess.run([sys.executable, "-c", _PEAK_RSS, str(src), str(tmp_path / "out.jl")],
+                             cwd=ROOT, check=True, capture_output=True, text=True).stdout
+        peaks.append(int(out) / 1024)
+    print(f"\npico de RSS: {peaks[0]:.1f} MiB (512 KiB), {peaks[1]:.1f} MiB (2 MiB)")
+    # sem streaming, 1,5 MiB a mais de R custa dezenas de MiB de AST e saída
+    assert peaks[1] < peaks[0] + 4
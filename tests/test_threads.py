@@ -0,0 +1,77 @@
+﻿"""transpile() em várias threads ao mesmo tempo dá a mesma saída que em série."""
+import sys
+import threading
+
+from src.lexer import get_lexer
+from src.transpile import Transpiler, transpile
+
+
+def _run_threads(work, count=8):
+    errors = []
+    start = threading.Barrier(count)
+
+    def run(i):
+        try:
+            start.wait()
+            work(i)
+        except BaseException as e:  # falha na thread: reportada no teste
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    # trocas de thread bem mais frequentes, para que elas se intercalem no
+    # meio de cada conversão
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors, errors
+
+
+def test_concurrent_transpile_matches_serial(examples):
+    sources = list(examples.values())
+    expected = [transpile(s) for s in sources]
+    results = {}
+
+    def work(i):
+        # cada thread começa num exemplo diferente, para que as conversões se
+        # sobreponham em pontos diferentes do lexer e do parser
+        order = sources[i:] + sources[:i]
+        outputs = [[transpile(s) for s in order] for _ in range(5)]
+        results[i] = [o[-i:] + o[:-i] if i else o for o in outputs]
+
+    _run_threads(work)
+    for outputs in results.values():
+        for run in outputs:
+            assert run == expected
+
+
+def test_transpiler_per_thread_with_ply_lexer(examples):
+    source = "\n".join(examples.values())
+    expected = Transpiler(get_lexer()).transpile(source)
+    outputs = []
+
+    def work(i):
+        tr = Transpiler(get_lexer())
+        outputs.extend(tr.transpile(source) for _ in range(3))
+
+    _run_threads(work, 4)
+    assert outputs == [expected] * 12
+
+
+def test_line_numbers_are_per_thread():
+    # linhas diferentes em cada thread: o lineno do lexer não pode vazar
+    results = {}
+
+    def work(i):
+        tr = Transpiler()
+        source = "\n" * i + "x <- 1\n"
+        results[i] = [tr.parse(source).stmts[0].lineno for _ in range(200)]
+
+    _run_threads(work)
+    for i, lines in results.items():
+        assert lines == [i + 1] * 200
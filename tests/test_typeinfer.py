@@ -0,0 +1,225 @@
+﻿"""Inferência de tipos: os tipos emitidos nunca podem ser mais estreitos que os valores."""
+import io
+
+import pytest
+
+from src import typeinfer
+from src.transpile import Transpiler, transpile
+from src.typeinfer import TypeInference, infer_types
+
+
+def _lines(source):
+    return transpile(source).splitlines()
+
+
+def _types(source):
+    program = Transpiler().parse(source)
+    typer = infer_types(program)
+    return typer.env, typer.functions
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("v <- c(1, 2, 3)", "v = Int[1, 2, 3]"),
+    ("v <- c(1, 2.5)", "v = Float64[1, 2.5]"),
+    ("v <- c(TRUE, 1)", "v = Int[true, 1]"),
+    ('v <- c("a", "b")', 'v = String["a", "b"]'),
+    ('v <- c(1, "a")', 'v = [1, "a"]'),
+    ("v <- c(y, 1)", "v = [y, 1]"),
+    ("v <- c()", "v = Any[]"),
+])
+def test_typed_vector_literals(source, expected):
+    assert _lines(source) == [expected]
+
+
+def test_arithmetic_promotion():
+    env, _ = _types("a <- 1\nb <- a * 2.5\nc <- a / 2\nd <- TRUE + TRUE\ne <- a > 0\n")
+    assert env == {"a": "Int", "b": "Float64", "c": "Float64", "d": "Int", "e": "Bool"}
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("x <- sum(c(TRUE, TRUE))", "Int"),
+    ("x <- sum(c(1, 2))", "Int"),
+    ("x <- sum(1:10)", "Int"),
+    ("x <- sum(c(1.5, 2))", "Float64"),
+    ("x <- sum(TRUE)", "Int"),
+    ('x <- sum(c("a"))', None),
+])
+def test_sum_types(source, expected):
+    env, _ = _types(source)
+    assert env["x"] == expected
+
+
+def test_sum_of_logicals_feeds_an_int_vector():
+    assert _lines("x <- sum(c(TRUE, TRUE))\nv <- c(x)\n")[-1] == "v = Int[x]"
+
+
+@pytest.mark.parametrize("body, expected", [
+    ("return(1)", "Int"),
+    ("if (x > 0) { return(1) } else { return(2.5) }", "Float64"),
+    # valor implícito do último comando
+    ("y <- 2\ny", "Int"),
+    ("if (x > 0) { 1 } else { 2 }", "Int"),
+    ("if (x > 0) { return(1) }\n2", "Int"),
+    # return explícito e último comando de tipos diferentes
+    ('if (x > 0) { return(1) }\n"neg"', None),
+    # pode cair no fim sem valor: devolve nothing
+    ("if (x > 0) { return(1) }", None),
+    ("for (i in 1:3) { return(1) }", None),
+    ("while (x > 0) { return(1) }", None),
+    ("print(x)", None),
+])
+def test_function_return_types(body, expected):
+    _, functions = _types("f <- function(x) {\n" + body + "\n}\n")
+    assert functions["f"] == expected
+
+
+def test_mixed_returns_do_not_type_the_vector():
+    code = transpile('f <- function(x) {\n  if (x > 0) {\n    return(1)\n  }\n  "neg"\n}\n'
+                     "v <- c(f(1), f(-1))\n")
+    assert code.splitlines()[-1] == "v = [f(1), f((-1))]"
+
+
+def test_loop_types_reach_a_fixed_point():
+    env, _ = _types("x <- 1\nfor (i in 1:10) {\n  x <- x / 2\n}\ny <- c(x)\n")
+    assert env["x"] == "Float64"
+    assert env["y"] == "Vector{Float64}"
+
+
+# ------------------- operadores elemento a elemento -------------------
+
+@pytest.mark.parametrize("source, expected", [
+    ("v <- c(1, 2)\nw <- v + 1", "w = (v .+ 1)"),
+    ("v <- c(1, 2)\nw <- 2 - v", "w = (2 .- v)"),
+    ("v <- c(1, 2)\nw <- v / 2", "w = (v ./ 2)"),
+    ("v <- c(1, 2)\nw <- v ^ 2", "w = (v .^ 2)"),
+    ("v <- c(1, 2)\nw <- v > 1", "w = (v .> 1)"),
+    ("w <- c(1, 2) == c(1, 3)", "w = (Int[1, 2] .== Int[1, 3])"),
+    ("v <- c(TRUE, FALSE)\nw <- v & TRUE", "w = (v .& true)"),
+    ("v <- c(TRUE, FALSE)\nw <- v | v", "w = (v .| v)"),
+    ("v <- c(TRUE, FALSE)\nw <- !v", "w = (.!v)"),
+    ("v <- c(1, 2)\nw <- sqrt(v)", "w = sqrt.(v)"),
+    # ranges, fatias e resultados de funções que devolvem vetores
+    ("r <- 1:5\nw <- r * 2", "w = (r .* 2)"),
+    ("v <- c(1, 2, 3)\nw <- v[2:3] * 2", "w = (v[2:3] .* 2)"),
+    ("v <- c(1, 2)\nw <- rev(v) + 1", "w = (rev(v) .+ 1)"),
+], ids=lambda x: x if x.startswith("w =") else None)
+def test_vector_operands_get_dotted_operators(source, expected):
+    assert _lines(source)[-1] == expected
+
+
+@pytest.mark.parametrize("source, expected", [
+    # && e || continuam escalares, como no R, mesmo com vetores
+    ("v <- c(TRUE, FALSE)\nb <- v && TRUE", "b = (v && true)"),
+    ("v <- c(TRUE, FALSE)\nb <- v || v", "b = (v || v)"),
+    ("a <- 1\nb <- a + 1 > 2 && a < 3", "b = (((a + 1) > 2) && (a < 3))"),
+    # escalares e elementos de vetores: operadores comuns
+    ("a <- 2\nb <- a * 3 - 1", "b = ((a * 3) - 1)"),
+    ("a <- TRUE\nb <- !a", "b = (!a)"),
+    ("a <- 2\nb <- sqrt(a)", "b = sqrt(a)"),
+    ("v <- c(1, 2)\nb <- v[1] + 1", "b = (v[1] + 1)"),
+    ("v <- c(1, 2)\nb <- length(v) > 1", "b = (length(v) > 1)"),
+])
+def test_scalar_operands_are_unchanged(source, expected):
+    assert _lines(source)[-1] == expected
+
+
+def test_fused_chain():
+    # todos os operadores da cadeia com ponto: o Julia faz um único laço
+    assert _lines("v <- c(1, 2)\nw <- (v * v) > 2")[-1] == "w = ((v .* v) .> 2)"
+    assert _lines("v <- c(1, 2)\nw <- sqrt(v * v) + 1")[-1] == "w = (sqrt.((v .* v)) .+ 1)"
+    env, _ = _types("v <- c(1, 2)\nw <- (v * v) > 2\nz <- sqrt(v * v) + 1\n")
+    assert env["w"] == "Vector{Bool}" and env["z"] == "Vector{Float64}"
+
+
+# ------------------- registros (list com chaves fixas) -------------------
+
+def test_fixed_key_list_is_a_named_tuple():
+    assert _lines("l <- list(a=1, b=2)\nprint(l$a)\n") == ["l = (a = 1, b = 2)", "println(l.a)"]
+
+
+def test_same_record_in_both_branches_stays_a_named_tuple():
+    code = transpile("l <- list(a=1)\nif (flag) {\n  l <- list(a=2)\n}\nprint(l$a)\n")
+    assert "Dict" not in code
+    assert code.splitlines()[-1] == "println(l.a)"
+
+
+def test_records_that_differ_by_branch_are_dicts():
+    code = transpile("if (flag) {\n  l <- list(a=1)\n} else {\n  l <- list(a=2, b=3)\n}\nprint(l$a)\n")
+    assert code.splitlines() == [
+        "if flag",
+        '    l = Dict("a" => 1)',
+        "else",
+        '    l = Dict("a" => 2, "b" => 3)',
+        "end",
+        'println(l["a"])',
+    ]
+
+
+def test_record_retyped_in_a_loop_is_converted_before_it():
+    # a definição antes do laço já foi gerada (streaming): converte na entrada
+    code = transpile('l <- list(a=1, b=2)\nfor (i in 1:3) {\n  l <- list(a=i, b="x")\n}\nprint(l$b)\n')
+    assert code.splitlines() == [
+        "l = (a = 1, b = 2)",
+        "l = Dict{String,Any}(string(i) => x for (i, x) in pairs(l))",
+        "for i in 1:3",
+        '    l = Dict("a" => i, "b" => "x")',
+        "end",
+        'println(l["b"])',
+    ]
+
+
+def test_record_extended_in_a_branch_is_converted_before_it():
+    code = transpile("l <- list(a=1)\nif (flag) {\n  l$b <- 3\n}\nprint(l$a)\n")
+    assert code.splitlines()[1:] == [
+        "l = Dict{String,Any}(string(i) => x for (i, x) in pairs(l))",
+        "if flag",
+        '    l["b"] = 3',
+        "end",
+        'println(l["a"])',
+    ]
+
+
+def test_global_record_read_by_a_later_function():
+    source = "p <- list(x=1, y=2)\ng <- function() {\n  return(p$x)\n}\nprint(p$y)\np <- list(x=3, y=4)\n"
+    assert _lines(source) == [
+        "p = (x = 1, y = 2)",
+        "p = Dict{String,Any}(string(i) => x for (i, x) in pairs(p))",
+        "function g()",
+        '    return p["x"]',
+        "end",
+        'println(p["y"])',
+        'p = Dict("x" => 3, "y" => 4)',
+    ]
+    # em main() a função é içada, mas a conversão fica no lugar dela
+    main = transpile(source, wrap_main=True).splitlines()
+    assert main[main.index("function main()"):] == [
+        "function main()",
+        "    global p",
+        "    p = (x = 1, y = 2)",
+        "    p = Dict{String,Any}(string(i) => x for (i, x) in pairs(p))",
+        '    println(p["y"])',
+        '    p = Dict("x" => 3, "y" => 4)',
+        "end",
+        "",
+        "main()",
+    ]
+
+
+def test_record_conversions_match_in_streaming():
+    source = ("l <- list(a=1, b=2)\nfor (i in 1:3) {\n  l <- list(a=i, b=\"x\")\n}\n"
+              "p <- list(x=1)\ng <- function() {\n  return(p$x)\n}\n"
+              "if (flag) {\n  q <- list(a=1)\n} else {\n  q <- list(b=2)\n}\nprint(q$b)\n")
+    out = io.StringIO()
+    Transpiler().transpile_stream(io.StringIO(source), out)
+    assert out.getvalue() == transpile(source)
+
+
+def test_record_types_are_kept_per_instance():
+    first, second = TypeInference(), TypeInference()
+    t = first.record_of([("a", "Int")])
+    assert first.record_fields(t) == {"a": "Int"}
+    assert second.record_fields(t) is None
+    assert not hasattr(typeinfer, "_RECORD_FIELDS")
+    # o estado repassado entre processos leva os campos junto
+    second.restore(first.state())
+    assert second.record_fields(t) == {"a": "Int"}